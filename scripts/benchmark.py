@@ -0,0 +1,353 @@
+"""
+Reproducible benchmarks for the model and the API.
+
+Runs model micro-benchmarks across batch sizes and an in-process load test
+against the ASGI app, and stores the results (with the git commit and
+machine details) as JSON so runs can be compared between commits.
+
+Usage:
+    python scripts/benchmark.py                      # model + api
+    python scripts/benchmark.py model --batch-sizes 1 100 10000
+    python scripts/benchmark.py api --requests 5000 --concurrency 64
+    python scripts/benchmark.py compare results/base.json results/new.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from scripts.train_model import generate_synthetic_data
+from src.models.credit_model import CreditApprovalModel
+from src.utils.config import get_settings
+from src.utils.logger import setup_logging
+from src.utils.parallelism import configure_worker_parallelism
+
+# Logger (handlers are installed by setup_logging in main)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZES: list[int] = [1, 10, 100, 1_000, 10_000, 100_000]
+RESULTS_DIR = Path("benchmark_results")
+
+
+def git_commit() -> str | None:
+    """Current commit hash, if run inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict[str, Any]:
+    """Machine and configuration details recorded with every run."""
+    settings = get_settings()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            "inference_backend": settings.inference_backend,
+            "fold_scaler": settings.fold_scaler,
+            "early_exit_enabled": settings.early_exit_enabled,
+            "model_n_jobs": settings.model_n_jobs,
+            "native_threads": settings.native_threads,
+            "cpu_affinity": settings.cpu_affinity,
+            "inference_workers": settings.inference_workers,
+            "micro_batching_enabled": settings.micro_batching_enabled,
+            "prediction_cache_size": settings.prediction_cache_size,
+            "fast_json_enabled": settings.fast_json_enabled,
+        },
+    }
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Median and tail latencies in milliseconds."""
+    p50, p95, p99 = np.percentile(np.asarray(samples) * 1000, [50, 95, 99])
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def time_call(fn: Callable[[], Any], min_seconds: float, min_repeats: int = 3) -> list[float]:
+    """Call fn repeatedly for at least min_seconds (and min_repeats calls)."""
+    fn()  # warm-up
+    samples: list[float] = []
+    deadline = time.perf_counter() + min_seconds
+    while len(samples) < min_repeats or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def build_model(args: argparse.Namespace) -> CreditApprovalModel:
+    """Load the configured model, or train one on synthetic data."""
+    settings = get_settings()
+    model = CreditApprovalModel(
+        decision_threshold=settings.decision_threshold,
+        backend=settings.inference_backend,
+        early_exit=settings.early_exit_enabled,
+        n_jobs=settings.model_n_jobs,
+    )
+    if Path(args.model_path).exists() and not args.synthetic:
+        logger.info(f"Loading model from {args.model_path}")
+        model.load(args.model_path, args.scaler_path, fold_scaler=settings.fold_scaler)
+    else:
+        logger.info("Training a model on synthetic data")
+        model.train(*generate_synthetic_data(5000))
+    return model
+
+
+def benchmark_model(
+    model: CreditApprovalModel, batch_sizes: list[int], min_seconds: float
+) -> list[dict[str, Any]]:
+    """Time predict, predict_proba and score_array per batch size."""
+    X_all, _ = generate_synthetic_data(max(batch_sizes))
+    X_all = X_all[model.feature_names or list(X_all.columns)]
+    results = []
+
+    for batch_size in batch_sizes:
+        X = X_all.iloc[:batch_size]
+        X_array = X.to_numpy(dtype=np.float64)
+        calls: dict[str, Callable[[], Any]] = {
+            "predict": lambda: model.predict(X),
+            "predict_proba": lambda: model.predict_proba(X),
+            "score_array": lambda: model.score_array(X_array),
+        }
+        for method, fn in calls.items():
+            samples = time_call(fn, min_seconds)
+            median = float(np.median(samples))
+            results.append(
+                {
+                    "method": method,
+                    "batch_size": batch_size,
+                    "calls": len(samples),
+                    **percentiles(samples),
+                    "rows_per_second": batch_size / median,
+                }
+            )
+            logger.info(
+                f"  {method:<14} batch={batch_size:>7,}  "
+                f"p50={results[-1]['p50_ms']:9.3f}ms  "
+                f"{results[-1]['rows_per_second']:>13,.0f} rows/s"
+            )
+
+    return results
+
+
+async def generate_load(
+    app: Any,
+    path: str,
+    bodies: list[bytes],
+    n_requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """
+    Drive the ASGI app in-process with concurrent clients.
+
+    Returns:
+        Throughput, latency percentiles and status code counts
+    """
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    counter = itertools.count()
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def client_loop() -> None:
+            while (i := next(counter)) < n_requests:
+                start = time.perf_counter()
+                response = await client.post(
+                    path,
+                    content=bodies[i % len(bodies)],
+                    headers={"Content-Type": "application/json"},
+                )
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": n_requests,
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "requests_per_second": n_requests / elapsed,
+        **percentiles(latencies),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def benchmark_api(model: CreditApprovalModel, args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Load-test /predict and /predict/batch against the in-process app."""
+    from src.api import dependencies
+    from src.api.main import create_app
+
+    settings = get_settings()
+    # Distinct payloads repeat, so with the cache on /predict mostly measures
+    # cache hits; it is off unless --api-cache is given
+    if not args.api_cache:
+        settings.prediction_cache_size = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Serve the benchmarked model through the regular loading path
+        if model.model is not None:
+            settings.model_path = str(Path(tmp) / "model.pkl")
+            settings.scaler_path = str(Path(tmp) / "scaler.pkl")
+            model.save(settings.model_path, settings.scaler_path)
+        else:
+            # Loaded from an artifact or forest file: serve that same file
+            settings.model_path = args.model_path
+            settings.scaler_path = args.scaler_path
+
+        app = create_app()
+        # Keep per-request logs out of the measurements
+        for name in ("src", "httpx"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        dependencies.initialize_model()
+
+    X, _ = generate_synthetic_data(args.distinct_payloads)
+    applicants = X.to_dict(orient="records")
+    single = [json.dumps(applicant).encode() for applicant in applicants]
+    batch = [
+        json.dumps({"applicants": applicants[i : i + args.api_batch_size]}).encode()
+        for i in range(0, len(applicants), args.api_batch_size)
+    ]
+
+    scenarios = [
+        ("/api/v1/predict", single, args.requests),
+        ("/api/v1/predict/batch", batch, max(1, args.requests // args.api_batch_size)),
+    ]
+    results = []
+    try:
+        for path, bodies, n_requests in scenarios:
+            # Fresh cache per scenario, so its hit rate is reported per endpoint
+            dependencies._cache_instance = None
+            result = asyncio.run(
+                generate_load(app, path, bodies, n_requests, args.concurrency)
+            )
+            cache = dependencies.get_prediction_cache()
+            result["prediction_cache"] = cache.stats() if cache is not None else None
+            results.append({"endpoint": path, **result})
+            logger.info(
+                f"  {path:<24} {result['requests_per_second']:>9,.0f} req/s  "
+                f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+                f"p99={result['p99_ms']:.2f}ms  {result['status_codes']}"
+            )
+    finally:
+        dependencies.shutdown_executor()
+
+    return results
+
+
+def compare(base_path: str, new_path: str) -> None:
+    """Print the change between two result files."""
+    base = json.loads(Path(base_path).read_text())
+    new = json.loads(Path(new_path).read_text())
+    print(f"base: {base['environment']['git_commit']}  new: {new['environment']['git_commit']}")
+
+    base_model = {(r["method"], r["batch_size"]): r for r in base.get("model", [])}
+    for result in new.get("model", []):
+        before = base_model.get((result["method"], result["batch_size"]))
+        if before:
+            change = result["rows_per_second"] / before["rows_per_second"] - 1
+            print(
+                f"  {result['method']:<14} batch={result['batch_size']:>7,}  "
+                f"p50 {before['p50_ms']:9.3f} -> {result['p50_ms']:9.3f}ms  ({change:+.1%} rows/s)"
+            )
+
+    base_api = {r["endpoint"]: r for r in base.get("api", [])}
+    for result in new.get("api", []):
+        before = base_api.get(result["endpoint"])
+        if before:
+            change = result["requests_per_second"] / before["requests_per_second"] - 1
+            print(
+                f"  {result['endpoint']:<24} p99 {before['p99_ms']:.2f} -> "
+                f"{result['p99_ms']:.2f}ms  ({change:+.1%} req/s)"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "suite", nargs="?", default="all", choices=["all", "model", "api", "compare"]
+    )
+    parser.add_argument("files", nargs="*", help="Two result files for 'compare'")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Time budget per case")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per API scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--api-batch-size", type=int, default=100)
+    parser.add_argument("--distinct-payloads", type=int, default=1000)
+    parser.add_argument(
+        "--api-cache",
+        action="store_true",
+        help="Keep the prediction cache on in the API scenarios (hit rate is recorded)",
+    )
+    parser.add_argument("--model-path", default=settings.model_path)
+    parser.add_argument("--scaler-path", default=settings.scaler_path)
+    parser.add_argument("--synthetic", action="store_true", help="Always train a fresh model")
+    parser.add_argument("-o", "--output", help="Result file (default: benchmark_results/)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main benchmark function."""
+    args = parse_args()
+    setup_logging()
+    if args.suite == "compare":
+        if len(args.files) != 2:
+            raise SystemExit("compare needs two result files")
+        compare(*args.files)
+        return
+
+    # Same thread limits and pinning as a serving worker
+    configure_worker_parallelism(get_settings())
+    model = build_model(args)
+    report: dict[str, Any] = {"environment": environment()}
+
+    if args.suite in ("all", "model"):
+        logger.info("=" * 60)
+        logger.info("MODEL BENCHMARKS")
+        logger.info("=" * 60)
+        report["model"] = benchmark_model(model, args.batch_sizes, args.min_seconds)
+
+    if args.suite in ("all", "api"):
+        logger.info("=" * 60)
+        logger.info("API LOAD TEST")
+        logger.info("=" * 60)
+        report["api"] = benchmark_api(model, args)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR
+        / f"{datetime.now():%Y%m%d-%H%M%S}-{report['environment']['git_commit'] or 'local'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"✓ Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
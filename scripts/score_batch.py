@@ -0,0 +1,264 @@
+"""
+Offline bulk scoring of CSV, Parquet or JSONL files.
+
+The input is read in chunks, chunks are scored in parallel by a pool of
+worker processes (each holding its own loaded model) and every scored chunk
+is written as a part file in the same format under the output directory.
+Part files are written atomically, so an interrupted run resumes where it
+stopped by skipping chunks whose part file already exists. A manifest in
+the output directory records the input file and chunking; resuming with a
+different input or chunk size is refused, since the existing parts would no
+longer line up with the new chunks.
+
+Usage:
+    python scripts/score_batch.py portfolio.csv results/ --workers 8
+    python scripts/score_batch.py portfolio.parquet results/ --chunk-size 200000
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.models.credit_model import CreditApprovalModel
+from src.models.policy import PolicyEngine
+from src.utils.config import get_settings
+from src.utils.parallelism import limit_native_threads
+
+# Logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FORMATS: dict[str, str] = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+EXTENSIONS: dict[str, str] = {"csv": ".csv", "parquet": ".parquet", "jsonl": ".jsonl"}
+
+# Describes the run that wrote the part files of an output directory
+MANIFEST_NAME: str = "manifest.json"
+
+# Model loaded once per worker process
+_worker_model: CreditApprovalModel | None = None
+
+
+def read_chunks(path: str, fmt: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield the input file as DataFrames of at most chunk_size rows."""
+    if fmt == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif fmt == "jsonl":
+        yield from pd.read_json(path, lines=True, chunksize=chunk_size)
+    elif fmt == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise SystemExit("Parquet support requires pyarrow: pip install pyarrow") from e
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported format '{fmt}'")
+
+
+def write_part(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    """Write one scored chunk atomically (temp file, then rename)."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if fmt == "csv":
+        df.to_csv(tmp_path, index=False)
+    elif fmt == "jsonl":
+        df.to_json(tmp_path, orient="records", lines=True)
+    else:
+        df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def run_manifest(input_path: str, fmt: str, chunk_size: int) -> dict[str, str | int]:
+    """Input file identity and chunking that part files depend on."""
+    stat = Path(input_path).stat()
+    return {
+        "input": str(Path(input_path).resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "format": fmt,
+        "chunk_size": chunk_size,
+    }
+
+
+def check_manifest(output_dir: Path, manifest: dict[str, str | int]) -> None:
+    """
+    Record the run in output_dir, or check it matches the run being resumed.
+
+    Raises:
+        ValueError: If output_dir holds parts of a different input or chunking
+    """
+    manifest_path = output_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        previous = json.loads(manifest_path.read_text())
+        changed = sorted(key for key in manifest if previous.get(key) != manifest[key])
+        if changed:
+            raise ValueError(
+                f"{output_dir} holds parts of another run (differs in: {', '.join(changed)}); "
+                "use a new output directory"
+            )
+        return
+
+    if any(output_dir.glob("part-*")):
+        raise ValueError(f"{output_dir} holds part files without a {MANIFEST_NAME}")
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+
+def _init_worker(
+    model_path: str, scaler_path: str, policy_path: str, decision_threshold: float
+) -> None:
+    """Load the model (and pre-screen policy) once in each worker process."""
+    global _worker_model
+    # Parallelism comes from the worker processes; keep each one single-threaded
+    limit_native_threads(1)
+    _worker_model = CreditApprovalModel(decision_threshold=decision_threshold, n_jobs=1)
+    _worker_model.load(model_path, scaler_path)
+    if policy_path:
+        _worker_model.policy = PolicyEngine.from_file(policy_path)
+
+
+def _score_chunk(df: pd.DataFrame, part_path: Path, fmt: str) -> int:
+    """Score one chunk in a worker and write its part file."""
+    feature_names = _worker_model.feature_names or list(df.columns)
+    missing = [name for name in feature_names if name not in df.columns]
+    if missing:
+        raise ValueError(f"Input is missing columns: {missing}")
+
+    X = df[feature_names].to_numpy(dtype=np.float64)
+    result = _worker_model.score_array(X)
+
+    scored = df.assign(
+        approved=result.labels.astype(bool),
+        approval_probability=np.round(result.probabilities, 4),
+        risk_level=result.risk_levels,
+    )
+    write_part(scored, part_path, fmt)
+    return len(df)
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Offline bulk scoring of applicant files.")
+    parser.add_argument("input", help="CSV, Parquet or JSONL file")
+    parser.add_argument("output", help="Directory receiving part-NNNNN files")
+    parser.add_argument("--format", choices=sorted(EXTENSIONS), help="Override input format")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--model-path", default=settings.model_path)
+    parser.add_argument("--scaler-path", default=settings.scaler_path)
+    parser.add_argument("--policy-path", default=settings.policy_path)
+    return parser.parse_args()
+
+
+def score_file(
+    input_path: str,
+    output_dir: Path,
+    fmt: str,
+    chunk_size: int,
+    workers: int,
+    initargs: tuple[str, str, str, float],
+) -> tuple[int, int]:
+    """
+    Score input_path chunk by chunk into part files under output_dir.
+
+    Args:
+        input_path: CSV, Parquet or JSONL file
+        output_dir: Directory receiving part-NNNNN files and the manifest
+        fmt: Input (and output) format
+        chunk_size: Rows per chunk
+        workers: Worker processes
+        initargs: Model, scaler and policy paths and decision threshold
+
+    Returns:
+        Rows scored, and chunks skipped because their part already existed
+
+    Raises:
+        ValueError: If output_dir holds parts of a different run
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    check_manifest(output_dir, run_manifest(input_path, fmt, chunk_size))
+
+    start = time.perf_counter()
+    scored_rows = 0
+    skipped_chunks = 0
+    pending: set[Future] = set()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=initargs
+    ) as pool:
+        for index, df in enumerate(read_chunks(input_path, fmt, chunk_size)):
+            part_path = output_dir / f"part-{index:05d}{EXTENSIONS[fmt]}"
+            if part_path.exists():
+                skipped_chunks += 1
+                continue
+
+            # Bound chunks in flight so memory stays constant
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scored_rows += future.result()
+                elapsed = time.perf_counter() - start
+                logger.info(f"  {scored_rows:,} rows scored ({scored_rows / elapsed:,.0f} rows/s)")
+
+            pending.add(pool.submit(_score_chunk, df, part_path, fmt))
+
+        for future in wait(pending).done:
+            scored_rows += future.result()
+
+    return scored_rows, skipped_chunks
+
+
+def main() -> None:
+    """Main scoring function."""
+    args = parse_args()
+    fmt = args.format or FORMATS.get(Path(args.input).suffix.lower())
+    if fmt is None:
+        raise SystemExit(f"Cannot infer format of {args.input}; use --format")
+
+    output_dir = Path(args.output)
+
+    logger.info("=" * 60)
+    logger.info(f"BULK SCORING {args.input} ({fmt}) -> {output_dir}")
+    logger.info("=" * 60)
+
+    start = time.perf_counter()
+    try:
+        scored_rows, skipped_chunks = score_file(
+            args.input,
+            output_dir,
+            fmt,
+            args.chunk_size,
+            args.workers,
+            (
+                args.model_path,
+                args.scaler_path,
+                args.policy_path,
+                get_settings().decision_threshold,
+            ),
+        )
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"✓ Scored {scored_rows:,} rows in {elapsed:.2f}s "
+        f"({scored_rows / elapsed:,.0f} rows/s)"
+    )
+    if skipped_chunks:
+        logger.info(f"  Resumed: skipped {skipped_chunks} chunks already written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Score an NDJSON file of customers with constant memory.
+
+Usage:
+    python scripts/score_ndjson.py applicants.jsonl -o results.jsonl
+    cat applicants.jsonl | python scripts/score_ndjson.py - > results.jsonl
+"""
+import argparse
+import logging
+import sys
+import time
+
+from src.api.dependencies import load_model
+from src.api.streaming import iter_scored_ndjson
+from src.utils.config import get_settings
+
+# Logger (stderr, so results can go to stdout)
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="NDJSON file with one applicant per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=settings.stream_chunk_size)
+    parser.add_argument("--model-path", default=settings.model_path)
+    parser.add_argument("--scaler-path", default=settings.scaler_path)
+    parser.add_argument(
+        "--policy-path", default=settings.policy_path, help="Pre-screen rules (POLICY_PATH)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main scoring function."""
+    args = parse_args()
+
+    # Same loading as the API, so backend and policy match what it serves
+    settings = get_settings()
+    settings.model_path = args.model_path
+    settings.scaler_path = args.scaler_path
+    settings.policy_path = args.policy_path
+    model = load_model()
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    sink = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+
+    start = time.perf_counter()
+    lines = 0
+    try:
+        for block in iter_scored_ndjson(source, model, chunk_size=args.chunk_size):
+            sink.write(block)
+            lines += block.count(b"\n")
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout.buffer:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"✓ Scored {lines} lines in {elapsed:.2f}s ({lines / max(elapsed, 1e-9):,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
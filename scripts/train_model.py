@@ -10,8 +10,8 @@ from sklearn.model_selection import train_test_split
 
 from src.models.credit_model import CreditApprovalModel
 
-# Logger
-logging.basicConfig(level=logging.INFO)
+# Logger (configured in main, so importing this module, e.g. from the
+# benchmark, does not install a second console handler)
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +54,7 @@ def generate_synthetic_data(n_samples: int = 1000) -> tuple[pd.DataFrame, pd.Ser
 
 def main() -> None:
     """Main training function."""
+    logging.basicConfig(level=logging.INFO)
     logger.info("=" * 60)
     logger.info("CREDIT APPROVAL MODEL TRAINING")
     logger.info("=" * 60)
@@ -81,15 +82,28 @@ def main() -> None:
     test_accuracy = (predictions == y_test.values).mean()
     logger.info(f"  Test accuracy: {test_accuracy:.4f}")
 
+    # Compact serving representation (INFERENCE_BACKEND=quantized)
+    parity = model.quantization_parity(X_test, y_test)
+    logger.info(
+        f"  Quantized forest: {parity['quantized_bytes'] / 1024:.0f} KiB "
+        f"(full: {parity['full_bytes'] / 1024:.0f} KiB), "
+        f"decision agreement {parity['decision_agreement']:.3%}, "
+        f"max probability error {parity['max_probability_error']:.1e}"
+    )
+
     # Save model
     model_dir = Path("models_trained")
     model_dir.mkdir(exist_ok=True)
 
-    model.save(
-        str(model_dir / "credit_model.pkl"),
-        str(model_dir / "scaler.pkl"),
+    # Single versioned artifact: trees, scaler, feature order and metadata
+    model.save_artifact(
+        str(model_dir / "credit_model.artifact"),
+        metadata={"test_accuracy": float(test_accuracy), "quantization_parity": parity},
     )
 
+    # Memory-mappable copy shared by all workers (MODEL_PATH=...credit_model.forest)
+    model.save_compiled(str(model_dir / "credit_model.forest"))
+
     logger.info("=" * 60)
     logger.info("✓ MODEL TRAINED AND SAVED SUCCESSFULLY!")
     logger.info("=" * 60)
@@ -0,0 +1,111 @@
+"""
+Bounded LRU/TTL cache of prediction results.
+"""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import numpy as np
+
+from src.api.schemas import PredictionRequest
+from src.models.compiled_forest import ThresholdIndex
+
+# Request fields making up the cache key, in a fixed order
+CACHE_KEY_FIELDS: tuple[str, ...] = tuple(PredictionRequest.model_fields)
+
+
+def prediction_cache_key(request: PredictionRequest, model_version: int) -> tuple:
+    """Cache key for a validated request scored by a given model version."""
+    return (model_version, *(float(getattr(request, name)) for name in CACHE_KEY_FIELDS))
+
+
+def values_cache_key(values: np.ndarray, model_version: int) -> tuple:
+    """Same key as prediction_cache_key, from values in CACHE_KEY_FIELDS order."""
+    return (model_version, *values.tolist())
+
+
+def interval_cache_key(index: ThresholdIndex, row: Sequence[float], model_version: int) -> tuple:
+    """
+    Key shared by every row in the same forest cell (see ThresholdIndex).
+
+    Rows with different raw values but identical paths through every tree
+    map to one key, so the cached result is exact for all of them.
+    """
+    return (model_version, "cell", *index.cell(row))
+
+
+def policy_cache_key(rule: int, model_version: int) -> tuple:
+    """
+    Key shared by every row decided by the same pre-screen rule.
+
+    A rule's result does not depend on the row, and rules need not follow
+    split thresholds (e.g. ratios), so decided rows must never share a cell
+    or payload key with rows scored by the model.
+    """
+    return (model_version, "rule", rule)
+
+
+class PredictionCache:
+    """
+    Size-bounded LRU cache with optional time-to-live.
+
+    Entries older than ``ttl`` seconds (when ``ttl`` > 0) are treated as
+    misses and dropped. Safe to share between the event loop and worker
+    threads.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 0.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,70 @@
+"""
+Single-flight coalescing of concurrent identical computations.
+"""
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Share one in-flight computation between concurrent callers.
+
+    The first caller for a key starts the computation; callers arriving with
+    the same key while it runs await the same task instead of computing
+    again, and all of them get its result (or its exception). Nothing is
+    kept once the computation finishes, so this complements a result cache
+    rather than replacing it: it covers the window before the first result
+    is cached.
+
+    A flight may carry a fingerprint (e.g. the payload behind an
+    Idempotency-Key); a caller whose fingerprint differs does not join it
+    and computes on its own. Must be used from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        self.leaders = 0
+        self.followers = 0
+        self._flights: dict[Hashable, tuple[Hashable, asyncio.Task]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        fingerprint: Hashable = None,
+    ) -> tuple[Any, bool]:
+        """
+        Run ``compute`` once per key among concurrent callers.
+
+        Args:
+            key: Identifies identical computations
+            compute: Coroutine function producing the result
+            fingerprint: Must match the running flight's to join it
+
+        Returns:
+            Result, and whether it was shared from another caller's flight
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight_fingerprint, task = flight
+            if flight_fingerprint == fingerprint:
+                self.followers += 1
+                return await asyncio.shield(task), True
+            return await compute(), False
+
+        task = asyncio.ensure_future(compute())
+        self._flights[key] = (fingerprint, task)
+        task.add_done_callback(lambda done: self._finish(key, done))
+        self.leaders += 1
+        # Shielded: a disconnecting leader does not cancel its followers' result
+        return await asyncio.shield(task), False
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._flights.get(key, (None, None))[1] is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Retrieved here so a flight whose callers all left logs no warning
+            task.exception()
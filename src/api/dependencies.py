@@ -1,10 +1,24 @@
 """
 API dependencies.
 """
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 
+from src.api.batching import MicroBatcher
+from src.api.cache import PredictionCache
+from src.api.coalescing import SingleFlight
+from src.api.executor import InferenceExecutor
+from src.api.metrics import observe_model_stages
+from src.api.schemas import PredictionRequest
+from src.models.artifact import ARTIFACT_SUFFIX
+from src.models.compiled_forest import FOREST_SUFFIX
+from src.models.policy import PolicyEngine
 from src.models.credit_model import CreditApprovalModel
 from src.utils.config import get_settings
 from src.utils.logger import get_logger
@@ -14,32 +28,379 @@ logger = get_logger(__name__)
 # Global model instance
 _model_instance: CreditApprovalModel | None = None
 
+# Load/warm-up durations of the current model (seconds)
+_model_stats: dict[str, float] = {}
+
+# Incremented every time a model is installed
+_model_version: int = 0
+
+# Serializes reloads; in-flight requests keep their own model reference
+_reload_lock = threading.Lock()
+
+# Canary applicants every new model must score sanely before being swapped in
+CANARY_APPLICANTS: list[dict[str, float]] = [
+    PredictionRequest.model_config["json_schema_extra"]["example"],
+    {
+        "age": 25,
+        "income": 25000,
+        "credit_score": 550,
+        "loan_amount": 30000,
+        "employment_years": 1,
+        "existing_debts": 15000,
+    },
+    {
+        "age": 45,
+        "income": 100000,
+        "credit_score": 820,
+        "loan_amount": 50000,
+        "employment_years": 20,
+        "existing_debts": 0,
+    },
+]
+
+# Global prediction cache instance
+_cache_instance: PredictionCache | None = None
+
+# Global in-flight request coalescer
+_single_flight_instance: SingleFlight | None = None
+
+# Global inference executor instance
+_executor_instance: InferenceExecutor | None = None
+
+# Global micro-batcher instance
+_batcher_instance: MicroBatcher | None = None
+
+
+def load_model() -> CreditApprovalModel:
+    """Load the model from the configured artifact paths."""
+    settings = get_settings()
+    model = CreditApprovalModel(
+        decision_threshold=settings.decision_threshold,
+        backend=settings.inference_backend,
+        early_exit=settings.early_exit_enabled,
+        n_jobs=settings.model_n_jobs,
+    )
+
+    model_path = Path(settings.model_path)
+    scaler_path = Path(settings.scaler_path)
+
+    # Artifacts and compiled forest files carry everything needed for inference
+    needs_scaler = model_path.suffix not in (ARTIFACT_SUFFIX, FOREST_SUFFIX)
+
+    if not model_path.exists() or (needs_scaler and not scaler_path.exists()):
+        logger.warning(
+            f"Model not found at {model_path}. "
+            "Make sure to train the model first."
+        )
+        raise FileNotFoundError(f"Model not found at {model_path}")
+
+    model.load(str(model_path), str(scaler_path), fold_scaler=settings.fold_scaler)
+    if settings.policy_path:
+        model.policy = PolicyEngine.from_file(settings.policy_path)
+    return model
+
+
+class ModelReloadError(RuntimeError):
+    """Raised when a new model cannot be loaded, validated or swapped in."""
+
+
+def warm_up_model(model: CreditApprovalModel) -> None:
+    """
+    Run dummy predictions so first requests don't pay one-off costs.
+
+    The model's stage observer and policy counters are suspended meanwhile,
+    so warm-up calls do not show up in the serving metrics.
+    """
+    with _unobserved(model):
+        _run_warm_up(model)
+
+
+@contextmanager
+def _unobserved(model: CreditApprovalModel) -> Iterator[None]:
+    """Suspend the model's stage observer and policy hit counters."""
+    observer, model.stage_observer = model.stage_observer, None
+    counting, model.policy.counting = model.policy.counting, False
+    try:
+        yield
+    finally:
+        model.stage_observer = observer
+        model.policy.counting = counting
+
+
+def _run_warm_up(model: CreditApprovalModel) -> None:
+    settings = get_settings()
+    example = PredictionRequest.model_config["json_schema_extra"]["example"]
+    feature_names = model.feature_names or list(PredictionRequest.model_fields)
+    row = np.array([[example[name] for name in feature_names]], dtype=np.float64)
+    batch = np.repeat(row, settings.model_warmup_rows, axis=0)
+
+    for _ in range(settings.model_warmup_iterations):
+        model.score_array(row)
+        model.score_array(batch)
+
+    if settings.interval_cache_enabled and settings.prediction_cache_size > 0:
+        model.threshold_index.cell(row[0].tolist())
+
+
+def validate_model(model: CreditApprovalModel) -> None:
+    """
+    Score the canary applicants and check the output is sane.
+
+    Raises:
+        ModelReloadError: If the model fails the canary batch
+    """
+    expected = list(PredictionRequest.model_fields)
+    if model.feature_names is not None and sorted(model.feature_names) != sorted(expected):
+        raise ModelReloadError(f"Model features {model.feature_names} do not match {expected}")
+
+    feature_names = model.feature_names or expected
+    X = np.array(
+        [[applicant[name] for name in feature_names] for applicant in CANARY_APPLICANTS],
+        dtype=np.float64,
+    )
+    with _unobserved(model):
+        result = model.score_array(X)
+
+    probabilities = np.asarray(result.probabilities)
+    if probabilities.shape != (len(CANARY_APPLICANTS),):
+        raise ModelReloadError(f"Canary batch returned shape {probabilities.shape}")
+    if not np.all(np.isfinite(probabilities)) or np.any((probabilities < 0) | (probabilities > 1)):
+        raise ModelReloadError("Canary batch returned invalid probabilities")
+
 
 def get_model() -> CreditApprovalModel:
     """Return model instance (lazy loading)."""
-    global _model_instance
+    global _model_instance, _model_version
 
     if _model_instance is None:
-        logger.info("Loading credit model...")
-        _model_instance = CreditApprovalModel()
+        with _reload_lock:
+            if _model_instance is None:
+                logger.info("Loading credit model...")
+                start = time.perf_counter()
+                model = load_model()
+                _model_version += 1
+                model.version = _model_version
+                model.stage_observer = observe_model_stages
+                _model_instance = model
+                _model_stats["model_load_seconds"] = time.perf_counter() - start
+                logger.info("Model loaded successfully")
 
-        settings = get_settings()
-        model_path = Path(settings.model_path)
-        scaler_path = Path(settings.scaler_path)
+    return _model_instance
 
-        if not model_path.exists() or not scaler_path.exists():
-            logger.warning(
-                f"Model not found at {model_path}. "
-                "Make sure to train the model first."
-            )
-            raise FileNotFoundError(f"Model not found at {model_path}")
 
-        _model_instance.load(str(model_path), str(scaler_path))
-        logger.info("Model loaded successfully")
+def reload_model() -> dict[str, float | int]:
+    """
+    Load, warm up and validate a new model, then swap it in atomically.
 
-    return _model_instance
+    The current model keeps serving until the swap; requests already holding
+    it finish on it.
+
+    Returns:
+        New model version and load/warm-up durations
+
+    Raises:
+        ModelReloadError: If a reload is already running, or the new model
+            cannot be loaded or fails validation (the old model stays active)
+    """
+    global _model_instance, _model_version
+
+    if not _reload_lock.acquire(blocking=False):
+        raise ModelReloadError("A model reload is already in progress")
+
+    try:
+        logger.info("Reloading credit model...")
+        start = time.perf_counter()
+        try:
+            model = load_model()
+        except (FileNotFoundError, ValueError, OSError) as e:
+            raise ModelReloadError(f"Could not load model: {e}") from e
+        loaded = time.perf_counter()
+
+        try:
+            warm_up_model(model)
+            warmed = time.perf_counter()
+            validate_model(model)
+        except ModelReloadError:
+            raise
+        except Exception as e:
+            raise ModelReloadError(f"New model failed canary scoring: {e}") from e
+
+        # Reference assignment is atomic: new requests see the new model
+        _model_version += 1
+        model.version = _model_version
+        model.stage_observer = observe_model_stages
+        _model_instance = model
+        if _cache_instance is not None:
+            _cache_instance.clear()
+        _model_stats.update(
+            model_load_seconds=loaded - start,
+            warmup_seconds=warmed - loaded,
+        )
+        logger.info(f"Model reloaded: version={_model_version}")
+
+        return {
+            "model_version": _model_version,
+            "model_load_seconds": loaded - start,
+            "warmup_seconds": warmed - loaded,
+        }
+    finally:
+        _reload_lock.release()
+
+
+# Model files written atomically (temp file + rename), safe to watch
+WATCHABLE_SUFFIXES: tuple[str, ...] = (ARTIFACT_SUFFIX, FOREST_SUFFIX)
+
+
+def _artifact_mtime() -> float | None:
+    """Modification time of the configured model artifact."""
+    path = Path(get_settings().model_path)
+    return path.stat().st_mtime if path.exists() else None
+
+
+async def watch_model_file(interval: float) -> None:
+    """
+    Poll the model artifact and hot-reload when it changes.
+
+    Only ``*.artifact`` and ``*.forest`` files are watched: they are replaced
+    atomically, whereas a joblib model/scaler pair is written as two files
+    and could be picked up halfway, pairing a new forest with the old
+    scaler. Reload such pairs with POST /api/v1/admin/reload.
+    """
+    if Path(get_settings().model_path).suffix not in WATCHABLE_SUFFIXES:
+        logger.warning(
+            "Model file watching needs a .artifact or .forest MODEL_PATH; "
+            "use the admin reload endpoint for joblib model/scaler pairs"
+        )
+        return
+
+    last_seen = _artifact_mtime()
+    while True:
+        await asyncio.sleep(interval)
+        mtime = _artifact_mtime()
+        if mtime is None or mtime == last_seen:
+            continue
+
+        last_seen = mtime
+        logger.info("Model artifact changed on disk, reloading")
+        try:
+            await asyncio.to_thread(reload_model)
+        except ModelReloadError as e:
+            logger.error(f"Model hot-reload failed, keeping current model: {str(e)}")
+
+
+def initialize_model() -> bool:
+    """
+    Load and warm up the model eagerly (application startup).
+
+    Returns:
+        Whether the model is ready to serve
+    """
+    try:
+        model = get_model()
+    except FileNotFoundError:
+        logger.warning("Starting without a model; readiness will report not ready")
+        return False
+
+    start = time.perf_counter()
+    warm_up_model(model)
+    _model_stats["warmup_seconds"] = time.perf_counter() - start
+
+    logger.info(
+        f"Model ready: load={_model_stats['model_load_seconds']:.3f}s, "
+        f"warm-up={_model_stats['warmup_seconds']:.3f}s"
+    )
+    return True
 
 
 def model_loaded() -> bool:
     """Check if model is loaded."""
     return _model_instance is not None
+
+
+def model_stats() -> dict[str, float]:
+    """Load and warm-up durations of the current model (seconds)."""
+    return dict(_model_stats)
+
+
+def model_version() -> int:
+    """Version of the current model (0 before the first load)."""
+    return _model_version
+
+
+def get_prediction_cache() -> PredictionCache | None:
+    """Return prediction cache instance (None when disabled)."""
+    global _cache_instance
+
+    settings = get_settings()
+    if settings.prediction_cache_size <= 0:
+        return None
+
+    if _cache_instance is None:
+        _cache_instance = PredictionCache(
+            max_size=settings.prediction_cache_size,
+            ttl=settings.prediction_cache_ttl_seconds,
+        )
+
+    return _cache_instance
+
+
+def get_single_flight() -> SingleFlight | None:
+    """Return request coalescer instance (None when disabled)."""
+    global _single_flight_instance
+
+    if not get_settings().request_coalescing_enabled:
+        return None
+
+    if _single_flight_instance is None:
+        _single_flight_instance = SingleFlight()
+
+    return _single_flight_instance
+
+
+def get_executor() -> InferenceExecutor:
+    """Return inference executor instance (lazy creation)."""
+    global _executor_instance
+
+    if _executor_instance is None:
+        settings = get_settings()
+        _executor_instance = InferenceExecutor(
+            max_workers=settings.inference_workers,
+            queue_size=settings.inference_queue_size,
+            overflow=settings.inference_overflow,
+            queue_timeout=settings.inference_queue_timeout_ms / 1000,
+        )
+
+    return _executor_instance
+
+
+def shutdown_executor() -> None:
+    """Wait for running inference calls and release the pool."""
+    global _executor_instance
+
+    if _executor_instance is not None:
+        _executor_instance.shutdown()
+        _executor_instance = None
+
+
+def get_batcher() -> MicroBatcher:
+    """Return micro-batcher instance (lazy creation)."""
+    global _batcher_instance
+
+    if _batcher_instance is None:
+        settings = get_settings()
+        _batcher_instance = MicroBatcher(
+            window=settings.micro_batch_window_ms / 1000,
+            max_batch_size=settings.micro_batch_max_size,
+            executor=get_executor(),
+        )
+
+    return _batcher_instance
+
+
+async def close_batcher() -> None:
+    """Flush and release the micro-batcher."""
+    global _batcher_instance
+
+    if _batcher_instance is not None:
+        await _batcher_instance.close()
+        _batcher_instance = None
@@ -0,0 +1,93 @@
+"""
+Bounded executor for CPU-bound inference.
+"""
+import asyncio
+import contextvars
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the inference queue is full."""
+
+
+class InferenceExecutor:
+    """
+    Thread pool with a bounded admission queue.
+
+    At most ``max_workers + queue_size`` calls are admitted at once. When the
+    limit is reached, ``overflow="reject"`` fails immediately and
+    ``overflow="wait"`` waits up to ``queue_timeout`` seconds for a slot;
+    either way callers get ExecutorSaturatedError instead of an unbounded
+    queue.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        queue_size: int = 64,
+        overflow: str = "reject",
+        queue_timeout: float = 0.1,
+    ) -> None:
+        if overflow not in ("reject", "wait"):
+            raise ValueError(f"Unknown overflow behaviour '{overflow}'")
+
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.queue_timeout = queue_timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference"
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_size
+
+    def _admission(self) -> asyncio.Semaphore:
+        """Admission semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.capacity)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``fn(*args)`` in the pool without blocking the event loop.
+
+        Raises:
+            ExecutorSaturatedError: If no slot is available
+        """
+        semaphore = self._admission()
+
+        if semaphore.locked():
+            if self.overflow == "reject":
+                raise ExecutorSaturatedError("Inference queue is full")
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except TimeoutError as e:
+                raise ExecutorSaturatedError("Timed out waiting for inference slot") from e
+        else:
+            await semaphore.acquire()
+
+        # Run in a copy of the caller's context (e.g. per-request timings)
+        context = contextvars.copy_context()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, partial(context.run, fn, *args)
+            )
+        finally:
+            semaphore.release()
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running calls."""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,135 @@
+"""
+Fast JSON decoding, validation and encoding for the /predict hot path.
+"""
+import json
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+from annotated_types import Ge, Gt, Le, Lt
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from src.api.schemas import PredictionRequest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Request fields, in schema order
+FEATURE_FIELDS: tuple[str, ...] = tuple(PredictionRequest.model_fields)
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode compact JSON with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def field_bounds(schema: type[BaseModel]) -> tuple[np.ndarray, ...]:
+    """
+    Numeric bounds declared on a schema's fields, as arrays.
+
+    Returns:
+        (lower, lower_exclusive, upper, upper_exclusive), one entry per field
+    """
+    n_fields = len(schema.model_fields)
+    lower = np.full(n_fields, -np.inf)
+    upper = np.full(n_fields, np.inf)
+    lower_exclusive = np.zeros(n_fields, dtype=bool)
+    upper_exclusive = np.zeros(n_fields, dtype=bool)
+
+    for i, field in enumerate(schema.model_fields.values()):
+        for constraint in field.metadata:
+            if isinstance(constraint, Gt):
+                lower[i], lower_exclusive[i] = constraint.gt, True
+            elif isinstance(constraint, Ge):
+                lower[i] = constraint.ge
+            elif isinstance(constraint, Lt):
+                upper[i], upper_exclusive[i] = constraint.lt, True
+            elif isinstance(constraint, Le):
+                upper[i] = constraint.le
+
+    return lower, lower_exclusive, upper, upper_exclusive
+
+
+LOWER, LOWER_EXCLUSIVE, UPPER, UPPER_EXCLUSIVE = field_bounds(PredictionRequest)
+
+
+def within_bounds(X: np.ndarray) -> np.ndarray:
+    """
+    Check rows of PredictionRequest values against the schema bounds.
+
+    Args:
+        X: (n_fields,) or (n_rows, n_fields) values in FEATURE_FIELDS order
+
+    Returns:
+        Boolean per row: every value is finite and within its field's bounds
+    """
+    ok = (
+        np.isfinite(X)
+        & np.where(LOWER_EXCLUSIVE, X > LOWER, X >= LOWER)
+        & np.where(UPPER_EXCLUSIVE, X < UPPER, X <= UPPER)
+    )
+    return ok.all(axis=-1)
+
+
+def parse_prediction_request(body: bytes) -> np.ndarray | None:
+    """
+    Decode a /predict body straight into a float64 vector (FEATURE_FIELDS order).
+
+    Returns None unless the body is a JSON object with a plain number for
+    every field, all within bounds, so callers can fall back to full Pydantic
+    validation and its exact error responses.
+    """
+    try:
+        data = loads(body)
+        values = [data[name] for name in FEATURE_FIELDS]
+    except (ValueError, TypeError, KeyError):
+        return None
+
+    # bool is an int subclass, and strings need Pydantic's coercion rules
+    if any(type(value) not in (int, float) for value in values):
+        return None
+
+    try:
+        row = np.array(values, dtype=np.float64)
+    except OverflowError:
+        return None
+    return row if within_bounds(row) else None
+
+
+_APPROVED_PREFIX: dict[bool, bytes] = {
+    True: b'{"approved":true,"approval_probability":',
+    False: b'{"approved":false,"approval_probability":',
+}
+
+
+@lru_cache(maxsize=16)
+def _risk_level_suffix(risk_level: str) -> bytes:
+    return b',"risk_level":' + dumps(risk_level) + b"}"
+
+
+def encode_prediction(approved: bool, probability: float, risk_level: str) -> bytes:
+    """PredictionResponse JSON built from pre-encoded fragments."""
+    return _APPROVED_PREFIX[approved] + repr(probability).encode() + _risk_level_suffix(risk_level)
+
+
+class FastJSONResponse(Response):
+    """JSON response taking pre-encoded bytes, or encoding content with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -1,13 +1,21 @@
 """
 Main FastAPI application.
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.routes import router
+from src.api.dependencies import (
+    close_batcher,
+    initialize_model,
+    shutdown_executor,
+    watch_model_file,
+)
+from src.api.routes import admin_router, metrics_router, router
 from src.utils.config import get_settings
 from src.utils.logger import get_logger, setup_logging
+from src.utils.parallelism import configure_worker_parallelism
 
 logger = get_logger(__name__)
 
@@ -18,8 +26,21 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     logger.info(f"Starting {settings.api_title} v{settings.api_version}")
     logger.info(f"Environment: {settings.environment}")
+    # Before loading the model, so its thread pools start within the limits
+    configure_worker_parallelism(settings)
+    if settings.eager_model_loading:
+        await asyncio.to_thread(initialize_model)
+
+    watcher = None
+    if settings.model_watch_interval_seconds > 0:
+        watcher = asyncio.create_task(watch_model_file(settings.model_watch_interval_seconds))
+
     yield
     logger.info("Shutting down application")
+    if watcher is not None:
+        watcher.cancel()
+    await close_batcher()
+    shutdown_executor()
 
 
 def create_app() -> FastAPI:
@@ -46,6 +67,9 @@ def create_app() -> FastAPI:
 
     # Routes
     app.include_router(router)
+    app.include_router(admin_router)
+    if settings.metrics_enabled:
+        app.include_router(metrics_router)
 
     return app
 
@@ -0,0 +1,244 @@
+"""
+Low-overhead Prometheus metrics.
+
+Metric children are bound to their label values once, at import time, so
+recording a value on the request path is a bisect and two additions under
+a lock, with no label dict or string allocation.
+"""
+import bisect
+import threading
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from src.api.profiling import record_stage
+from src.models.policy import DEFAULT_RISK_LEVEL, RISK_LEVEL_THRESHOLDS
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+SIZE_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 1000, 10_000, 50_000)
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonic counter for one label combination."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Cumulative histogram for one label combination."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class MetricFamily:
+    """A named metric and its pre-bound children, one per label combination."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.label_names = label_names
+        self.buckets = buckets
+        self._children: dict[tuple[str, ...], Counter | Histogram] = {}
+
+    def labels(self, *values: str) -> Counter | Histogram:
+        """Return (creating once) the child for these label values."""
+        child = self._children.get(values)
+        if child is None:
+            child = Counter() if self.kind == "counter" else Histogram(self.buckets)
+            self._children[values] = child
+        return child
+
+    def expose(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in self._children.items():
+            labels = _labels(self.label_names, values)
+            if isinstance(child, Counter):
+                yield f"{self.name}{{{labels}}} {_format_value(child.value)}"
+                continue
+
+            with child._lock:
+                counts, total = list(child.counts), child.sum
+            prefix = f"{labels}," if labels else ""
+            cumulative = 0
+            for bound, count in zip((*child.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}'
+            yield f"{self.name}_sum{{{labels}}} {total!r}"
+            yield f"{self.name}_count{{{labels}}} {cumulative}"
+
+
+STAGE_SECONDS = MetricFamily(
+    "credit_api_stage_seconds",
+    "Time spent in each stage of single-row prediction",
+    "histogram",
+    ("stage",),
+)
+PREDICTIONS = MetricFamily(
+    "credit_api_predictions_total",
+    "Scored applicants by risk level",
+    "counter",
+    ("risk_level",),
+)
+ERRORS = MetricFamily(
+    "credit_api_errors_total",
+    "Failed prediction requests by endpoint and reason",
+    "counter",
+    ("endpoint", "reason"),
+)
+BATCH_SIZE = MetricFamily(
+    "credit_api_batch_rows",
+    "Rows per model call by source",
+    "histogram",
+    ("source",),
+    buckets=SIZE_BUCKETS,
+)
+COALESCED = MetricFamily(
+    "credit_api_coalesced_requests_total",
+    "Requests served by another request's in-flight computation, by key",
+    "counter",
+    ("key",),
+)
+
+# Pre-bound children used on the request path
+PARSE_SECONDS = STAGE_SECONDS.labels("parse")
+BUILD_SECONDS = STAGE_SECONDS.labels("build")
+SCALING_SECONDS = STAGE_SECONDS.labels("scaling")
+FOREST_SECONDS = STAGE_SECONDS.labels("forest")
+SERIALIZE_SECONDS = STAGE_SECONDS.labels("serialize")
+
+STAGES: dict[str, Histogram] = {
+    "parse": PARSE_SECONDS,
+    "build": BUILD_SECONDS,
+    "scaling": SCALING_SECONDS,
+    "forest": FOREST_SECONDS,
+    "serialize": SERIALIZE_SECONDS,
+}
+
+PREDICTIONS_BY_RISK: dict[str, Counter] = {
+    level: PREDICTIONS.labels(level)
+    for level in (*(level for _, level in RISK_LEVEL_THRESHOLDS), DEFAULT_RISK_LEVEL)
+}
+
+PREDICT_OVERLOADED = ERRORS.labels("predict", "overloaded")
+PREDICT_FAILED = ERRORS.labels("predict", "internal")
+BATCH_OVERLOADED = ERRORS.labels("predict_batch", "overloaded")
+BATCH_FAILED = ERRORS.labels("predict_batch", "internal")
+
+COALESCED_BY_PAYLOAD = COALESCED.labels("payload")
+COALESCED_BY_IDEMPOTENCY_KEY = COALESCED.labels("idempotency_key")
+
+BATCH_ENDPOINT_ROWS = BATCH_SIZE.labels("batch")
+MICRO_BATCH_ROWS = BATCH_SIZE.labels("micro_batch")
+
+FAMILIES: tuple[MetricFamily, ...] = (
+    STAGE_SECONDS,
+    PREDICTIONS,
+    ERRORS,
+    BATCH_SIZE,
+    COALESCED,
+)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record a stage duration (and in the request's timings, when collected)."""
+    STAGES[stage].observe(seconds)
+    record_stage(stage, seconds)
+
+
+def observe_model_stages(scaling_seconds: float, forest_seconds: float) -> None:
+    """Stage observer installed on served models (see CreditApprovalModel)."""
+    observe_stage("scaling", scaling_seconds)
+    observe_stage("forest", forest_seconds)
+
+
+def count_risk_level(level: str, count: int = 1) -> None:
+    """Count scored applicants of one risk level (policies may define new ones)."""
+    counter = PREDICTIONS_BY_RISK.get(level)
+    if counter is None:
+        counter = PREDICTIONS_BY_RISK[level] = PREDICTIONS.labels(level)
+    counter.inc(count)
+
+
+def count_risk_levels(risk_levels: np.ndarray) -> None:
+    """Count a batch of scored applicants per risk level."""
+    levels, counts = np.unique(risk_levels, return_counts=True)
+    for level, count in zip(levels.tolist(), counts.tolist()):
+        count_risk_level(level, count)
+
+
+def cache_metrics(stats: dict[str, int | float]) -> Iterator[str]:
+    """Exposition lines for the prediction cache's own counters."""
+    yield "# HELP credit_api_cache_lookups_total Prediction cache lookups by result"
+    yield "# TYPE credit_api_cache_lookups_total counter"
+    yield f'credit_api_cache_lookups_total{{result="hit"}} {stats["hits"]}'
+    yield f'credit_api_cache_lookups_total{{result="miss"}} {stats["misses"]}'
+    yield "# HELP credit_api_cache_entries Cached predictions"
+    yield "# TYPE credit_api_cache_entries gauge"
+    yield f"credit_api_cache_entries {stats['size']}"
+
+
+def log_metrics(dropped: int) -> Iterator[str]:
+    """Exposition lines for the async log pipeline."""
+    yield "# HELP credit_api_log_records_dropped_total Log records dropped on a full log queue"
+    yield "# TYPE credit_api_log_records_dropped_total counter"
+    yield f"credit_api_log_records_dropped_total {dropped}"
+
+
+def policy_metrics(stats: dict[str, int]) -> Iterator[str]:
+    """Exposition lines for the pre-screen policy's hit counters."""
+    yield "# HELP credit_api_policy_decisions_total Rows decided per policy rule (or the model)"
+    yield "# TYPE credit_api_policy_decisions_total counter"
+    for rule, count in stats.items():
+        yield f'credit_api_policy_decisions_total{{rule="{rule}"}} {count}'
+
+
+def render(extra: Iterable[str] = ()) -> bytes:
+    """
+    Render every metric family in Prometheus text format.
+
+    Args:
+        extra: Additional exposition lines read at scrape time (e.g. cache counters)
+    """
+    lines = [line for family in FAMILIES for line in family.expose()]
+    lines.extend(extra)
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,90 @@
+"""
+On-demand sampling profiler and per-request stage timings.
+"""
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+
+# Stage durations (seconds) of the current request, when timing is enabled
+_request_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "request_timings", default=None
+)
+
+# Only one profile runs at a time
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def start_request_timings() -> dict[str, float]:
+    """Start collecting stage timings for the current request context."""
+    timings: dict[str, float] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add a stage duration to the current request's timings, if collected."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def server_timing_header(timings: dict[str, float]) -> str:
+    """Format stage timings as a Server-Timing header value (milliseconds)."""
+    return ", ".join(f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings.items())
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> Counter[str]:
+    """
+    Sample the Python stacks of every other thread for a while.
+
+    Args:
+        seconds: Sampling duration
+        interval: Time between samples
+
+    Returns:
+        Collapsed stacks (``thread;outer;...;inner``) and their sample counts
+
+    Raises:
+        ProfilerBusyError: If another profile is already running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+
+    try:
+        own_thread = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        deadline = time.perf_counter() + seconds
+
+        while time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_thread:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f"thread-{ident}"))
+                stacks[";".join(reversed(labels))] += 1
+            time.sleep(interval)
+
+        return stacks
+    finally:
+        _profile_lock.release()
+
+
+def collapsed(stacks: Counter[str]) -> str:
+    """Render stack counts in flamegraph.pl / speedscope collapsed format."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -1,20 +1,250 @@
 """
 Main API routes.
 """
-from typing import Annotated
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Annotated, Any
 
-import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
 
-from src.api.dependencies import get_model, model_loaded
-from src.api.schemas import PredictionRequest, PredictionResponse, HealthResponse
+from src.api.batching import RowScore
+from src.api.cache import (
+    interval_cache_key,
+    policy_cache_key,
+    prediction_cache_key,
+    values_cache_key,
+)
+from src.api.dependencies import (
+    ModelReloadError,
+    get_batcher,
+    get_executor,
+    get_model,
+    get_prediction_cache,
+    get_single_flight,
+    model_loaded,
+    model_stats,
+    model_version,
+    reload_model,
+)
+from src.api.executor import ExecutorSaturatedError
+from src.api import metrics
+from src.api.fastjson import (
+    FEATURE_FIELDS,
+    FastJSONResponse,
+    encode_prediction,
+    parse_prediction_request,
+)
+from src.api.streaming import (
+    DuplexStreamingResponse,
+    Record,
+    score_records,
+    stream_scored_ndjson,
+)
+from src.api.profiling import (
+    ProfilerBusyError,
+    collapsed,
+    sample_stacks,
+    server_timing_header,
+    start_request_timings,
+)
+from src.api.schemas import (
+    CacheStatsResponse,
+    HealthResponse,
+    PredictionBatchRequest,
+    PredictionBatchResponse,
+    PredictionRequest,
+    PredictionResponse,
+    ReadinessResponse,
+    ReloadResponse,
+)
 from src.models.credit_model import CreditApprovalModel
 from src.utils.config import get_settings
-from src.utils.logger import get_logger
+from src.utils.logger import dropped_log_records, get_logger
 
 router = APIRouter(prefix="/api/v1", tags=["Credit Approval"])
+admin_router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+metrics_router = APIRouter(tags=["Monitoring"])
 logger = get_logger(__name__)
 
+# Marks per-request log records subject to LOG_SAMPLE_RATE
+SAMPLED: dict[str, bool] = {"sampled": True}
+
+# Feature column order expected by the model
+FEATURE_COLUMNS: list[str] = list(PredictionRequest.model_fields)
+
+
+def _feature_order(model: CreditApprovalModel) -> list[str]:
+    """Feature order expected by the model (falls back to the schema order)."""
+    return model.feature_names or FEATURE_COLUMNS
+
+
+def _feature_index(model: CreditApprovalModel) -> list[int]:
+    """Positions of the model's features within FEATURE_FIELDS."""
+    return [FEATURE_FIELDS.index(name) for name in _feature_order(model)]
+
+
+def _policy_rule(row: list[float], model: CreditApprovalModel) -> int:
+    """
+    Pre-screen rule deciding a row (-1: scored by the model).
+
+    Counted here, once per request, so the policy counters also cover
+    requests served from the cache or a coalesced computation.
+    """
+    if not model.policy.rules:
+        return -1
+    return int(model.policy.match(np.array([row]), _feature_order(model))[0])
+
+
+def _request_cache_key(request: PredictionRequest, model: CreditApprovalModel) -> tuple:
+    """Cache key for a validated request: its rule, forest cell, or raw values."""
+    row = [getattr(request, name) for name in _feature_order(model)]
+    rule = _policy_rule(row, model)
+    if rule >= 0:
+        return policy_cache_key(rule, model.version)
+    if get_settings().interval_cache_enabled:
+        return interval_cache_key(model.threshold_index, row, model.version)
+    return prediction_cache_key(request, model.version)
+
+
+def _values_cache_key(values: np.ndarray, model: CreditApprovalModel) -> tuple:
+    """Cache key for values in FEATURE_FIELDS order (see _request_cache_key)."""
+    row = values[_feature_index(model)].tolist()
+    rule = _policy_rule(row, model)
+    if rule >= 0:
+        return policy_cache_key(rule, model.version)
+    if get_settings().interval_cache_enabled:
+        return interval_cache_key(model.threshold_index, row, model.version)
+    return values_cache_key(values, model.version)
+
+
+def _build_feature_row(request: PredictionRequest, feature_names: list[str]) -> np.ndarray:
+    """Fill a (1, n_features) float64 row directly from the request."""
+    row = np.empty((1, len(feature_names)), dtype=np.float64)
+    for i, name in enumerate(feature_names):
+        row[0, i] = getattr(request, name)
+    return row
+
+
+def _build_feature_matrix(
+    applicants: list[PredictionRequest], feature_names: list[str]
+) -> np.ndarray:
+    """Build a single float64 feature matrix for a list of applicants."""
+    return np.array(
+        [[getattr(applicant, name) for name in feature_names] for applicant in applicants],
+        dtype=np.float64,
+    )
+
+
+async def _score_row(model: CreditApprovalModel, X: np.ndarray) -> RowScore:
+    """Score a single feature row, through the micro-batcher when enabled."""
+    if get_settings().micro_batching_enabled:
+        return await get_batcher().submit(model, X[0])
+
+    # The deciding rule was counted with the cache key (see _policy_rule)
+    result = await get_executor().run(partial(model.score_array, count_policy=False), X)
+    return (
+        int(result.labels[0]),
+        float(result.probabilities[0]),
+        str(result.risk_levels[0]),
+    )
+
+
+async def _score_cached(
+    model: CreditApprovalModel,
+    key: tuple,
+    build_row: Callable[[], np.ndarray],
+    idempotency_key: str | None = None,
+) -> RowScore:
+    """
+    Serve a single-row score from the cache, or compute and cache it.
+
+    Concurrent misses for the same key (or the same Idempotency-Key and
+    payload) share one computation instead of each scoring the row.
+    """
+    cache = get_prediction_cache()
+    score = cache.get(key) if cache is not None else None
+
+    if score is None:
+
+        async def compute() -> RowScore:
+            start = time.perf_counter()
+            X = build_row()
+            metrics.observe_stage("build", time.perf_counter() - start)
+
+            # Prediction, probability and risk level in a single forest pass
+            result = await _score_row(model, X)
+            if cache is not None:
+                cache.put(key, result)
+            return result
+
+        flights = get_single_flight()
+        if flights is None:
+            score = await compute()
+        elif idempotency_key is None:
+            score, shared = await flights.run(key, compute)
+            if shared:
+                metrics.COALESCED_BY_PAYLOAD.inc()
+        else:
+            flight_key = (model.version, "idempotency", idempotency_key)
+            score, shared = await flights.run(flight_key, compute, fingerprint=key)
+            if shared:
+                metrics.COALESCED_BY_IDEMPOTENCY_KEY.inc()
+
+    metrics.count_risk_level(score[2])
+    return score
+
+
+def _is_json(request: Request) -> bool:
+    """Whether the request body is declared as ``application/json``."""
+    media_type = request.headers.get("content-type", "").partition(";")[0]
+    return media_type.strip().lower() == "application/json"
+
+
+def _overloaded() -> HTTPException:
+    """503 returned when the inference queue is full."""
+    logger.warning("Inference queue full, rejecting request")
+    return HTTPException(
+        status_code=503,
+        detail="Service overloaded, retry later",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _predict_one(
+    model: CreditApprovalModel,
+    key: tuple,
+    build_row: Callable[[], np.ndarray],
+    idempotency_key: str | None,
+) -> RowScore:
+    """
+    Score one /predict applicant, shared by the fast and the Pydantic path.
+
+    Raises:
+        HTTPException: 503 when the inference queue is full, 500 on failure
+    """
+    try:
+        score = await _score_cached(model, key, build_row, idempotency_key)
+    except ExecutorSaturatedError as e:
+        metrics.PREDICT_OVERLOADED.inc()
+        raise _overloaded() from e
+    except Exception as e:
+        metrics.PREDICT_FAILED.inc()
+        logger.error(f"Error during prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error processing prediction") from e
+
+    logger.info(
+        "Prediction made: approved=%s, probability=%.4f",
+        bool(score[0]),
+        score[1],
+        extra=SAMPLED,
+    )
+    return score
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
@@ -27,52 +257,319 @@ async def health_check() -> HealthResponse:
     )
 
 
-@router.post("/predict", response_model=PredictionResponse)
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """Whether the model is loaded and warmed up (503 until it is)."""
+    loaded = model_loaded()
+    if not loaded:
+        response.status_code = 503
+
+    stats = model_stats()
+    return ReadinessResponse(
+        ready=loaded,
+        model_loaded=loaded,
+        model_version=model_version(),
+        model_load_seconds=stats.get("model_load_seconds"),
+        warmup_seconds=stats.get("warmup_seconds"),
+    )
+
+
+class FastPredictRoute(APIRoute):
+    """
+    /predict route with a fast path for well-formed requests.
+
+    Valid, in-bounds ``application/json`` bodies are decoded straight into a
+    feature row and the response is written from pre-encoded bytes, skipping
+    Pydantic request parsing and response model serialization. Anything else
+    (and every request while the fast path is disabled or no model is loaded
+    yet) goes through the regular FastAPI handler, so error responses and the
+    OpenAPI schema are unchanged.
+
+    With TIMING_HEADER_ENABLED, responses carry a Server-Timing header
+    breaking the request down into its stages. On the regular handler the
+    parse stage runs until the endpoint is called, so it covers Pydantic
+    validation (and a failed fast-path attempt).
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            if not get_settings().timing_header_enabled:
+                return await fast_handler(request)
+
+            timings = start_request_timings()
+            start = time.perf_counter()
+            response = await fast_handler(request)
+            timings["total"] = time.perf_counter() - start
+            response.headers["Server-Timing"] = server_timing_header(timings)
+            return response
+
+        async def fast_handler(request: Request) -> Response:
+            if (
+                not get_settings().fast_json_enabled
+                or not model_loaded()
+                or not _is_json(request)
+            ):
+                request.state.parse_start = time.perf_counter()
+                return await handler(request)
+
+            body = await request.body()
+            start = time.perf_counter()
+            values = parse_prediction_request(body)
+            if values is None:
+                # The endpoint records parse, including this attempt
+                request.state.parse_start = start
+                return await handler(request)
+            metrics.observe_stage("parse", time.perf_counter() - start)
+
+            # Resolved like Depends(get_model), honouring dependency overrides
+            model = request.app.dependency_overrides.get(get_model, get_model)()
+            prediction, probability, risk_level = await _predict_one(
+                model,
+                _values_cache_key(values, model),
+                lambda: values[_feature_index(model)].reshape(1, -1),
+                request.headers.get("idempotency-key"),
+            )
+
+            start = time.perf_counter()
+            response = FastJSONResponse(
+                encode_prediction(bool(prediction), round(float(probability), 4), risk_level)
+            )
+            metrics.observe_stage("serialize", time.perf_counter() - start)
+            return response
+
+        return timed_handler
+
+
 async def predict(
     request: PredictionRequest,
+    http_request: Request,
     model: Annotated[CreditApprovalModel, Depends(get_model)],
+    idempotency_key: Annotated[str | None, Header()] = None,
 ) -> PredictionResponse:
     """
     Predict credit approval.
 
     Receives customer data and returns whether credit should be approved.
+    Concurrent retries carrying the same Idempotency-Key (and payload) share
+    one computation.
     """
-    try:
-        # Prepare data for prediction
-        X = pd.DataFrame(
-            {
-                "age": [request.age],
-                "income": [request.income],
-                "credit_score": [request.credit_score],
-                "loan_amount": [request.loan_amount],
-                "employment_years": [request.employment_years],
-                "existing_debts": [request.existing_debts],
-            }
-        )
+    # Body reading and validation happened before this call (see FastPredictRoute)
+    parse_start = getattr(http_request.state, "parse_start", None)
+    if parse_start is not None:
+        metrics.observe_stage("parse", time.perf_counter() - parse_start)
 
-        # Prediction
-        prediction = model.predict(X)[0]
-        probability = model.predict_proba(X)[0][1]
+    # Repeat payloads (or, with the interval cache, any applicant taking the
+    # same path through every tree) are served from the cache
+    prediction, probability, risk_level = await _predict_one(
+        model,
+        _request_cache_key(request, model),
+        lambda: _build_feature_row(request, _feature_order(model)),
+        idempotency_key,
+    )
+
+    start = time.perf_counter()
+    response = PredictionResponse(
+        approved=bool(prediction),
+        approval_probability=round(float(probability), 4),
+        risk_level=risk_level,
+    )
+    metrics.observe_stage("serialize", time.perf_counter() - start)
+    return response
 
-        # Determine risk level
-        if probability >= 0.8:
-            risk_level = "low"
-        elif probability >= 0.5:
-            risk_level = "medium"
-        else:
-            risk_level = "high"
+
+router.add_api_route(
+    "/predict",
+    predict,
+    methods=["POST"],
+    response_model=PredictionResponse,
+    route_class_override=FastPredictRoute,
+)
+
+
+@router.post("/predict/batch", response_model=PredictionBatchResponse)
+async def predict_batch(
+    request: PredictionBatchRequest,
+    model: Annotated[CreditApprovalModel, Depends(get_model)],
+) -> PredictionBatchResponse:
+    """
+    Predict credit approval for many customers at once.
+
+    All applicants are scored with a single model call.
+    """
+    try:
+        X = _build_feature_matrix(request.applicants, _feature_order(model))
+
+        metrics.BATCH_ENDPOINT_ROWS.observe(len(X))
+        result = await get_executor().run(model.score_array, X)
+        metrics.count_risk_levels(result.risk_levels)
+        approved = result.labels.astype(bool)
+        rounded = np.round(result.probabilities.astype(np.float64), 4)
 
         logger.info(
-            f"Prediction made: approved={bool(prediction)}, "
-            f"probability={probability:.4f}"
+            "Batch prediction made: rows=%d, approved=%d",
+            len(result),
+            int(approved.sum()),
+            extra=SAMPLED,
         )
 
-        return PredictionResponse(
-            approved=bool(prediction),
-            approval_probability=round(float(probability), 4),
-            risk_level=risk_level,
+        return PredictionBatchResponse(
+            count=len(result),
+            predictions=[
+                PredictionResponse.model_construct(
+                    approved=is_approved,
+                    approval_probability=probability,
+                    risk_level=risk_level,
+                )
+                for is_approved, probability, risk_level in zip(
+                    approved.tolist(), rounded.tolist(), result.risk_levels.tolist()
+                )
+            ],
         )
 
+    except ExecutorSaturatedError as e:
+        metrics.BATCH_OVERLOADED.inc()
+        raise _overloaded() from e
     except Exception as e:
-        logger.error(f"Error during prediction: {str(e)}")
+        metrics.BATCH_FAILED.inc()
+        logger.error(f"Error during batch prediction: {str(e)}")
         raise HTTPException(status_code=500, detail="Error processing prediction") from e
+
+
+@router.post(
+    "/predict/stream",
+    response_class=DuplexStreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {
+                        "type": "string",
+                        "description": "One PredictionRequest JSON object per line",
+                    }
+                }
+            },
+        }
+    },
+)
+async def predict_stream(
+    request: Request,
+    model: Annotated[CreditApprovalModel, Depends(get_model)],
+) -> DuplexStreamingResponse:
+    """
+    Score an NDJSON stream of customers.
+
+    The body is parsed and validated incrementally and scored in fixed-size
+    chunks; one NDJSON result per input line (with its line number) is
+    streamed back as each chunk completes. Invalid lines produce an error
+    line instead of failing the whole stream.
+    """
+    settings = get_settings()
+    executor = get_executor()
+
+    async def score(records: list[Record]) -> bytes:
+        # Bulk streams slow down instead of failing when the queue is full
+        while True:
+            try:
+                return await executor.run(score_records, model, records)
+            except ExecutorSaturatedError:
+                await asyncio.sleep(0.05)
+
+    return DuplexStreamingResponse(
+        stream_scored_ndjson(
+            request.stream(),
+            score,
+            chunk_size=settings.stream_chunk_size,
+            max_line_bytes=settings.stream_max_line_bytes,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+def require_admin(x_admin_token: Annotated[str | None, Header()] = None) -> None:
+    """Allow admin endpoints only when enabled (and the token matches, if set)."""
+    settings = get_settings()
+    if not settings.admin_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.admin_token and x_admin_token != settings.admin_token:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@admin_router.post(
+    "/reload", response_model=ReloadResponse, dependencies=[Depends(require_admin)]
+)
+async def reload() -> ReloadResponse:
+    """
+    Hot-reload the model from the configured artifacts.
+
+    The new model is loaded, warmed up and validated in the background and
+    only then swapped in; in-flight requests finish on the old model.
+    """
+    try:
+        result = await asyncio.to_thread(reload_model)
+    except ModelReloadError as e:
+        logger.error(f"Model reload failed: {str(e)}")
+        raise HTTPException(status_code=409, detail=f"Model reload failed: {e}") from e
+
+    return ReloadResponse(status="reloaded", **result)
+
+
+@admin_router.get(
+    "/cache", response_model=CacheStatsResponse, dependencies=[Depends(require_admin)]
+)
+async def cache_stats() -> CacheStatsResponse:
+    """Prediction cache size and hit/miss counters."""
+    cache = get_prediction_cache()
+    if cache is None:
+        return CacheStatsResponse(enabled=False)
+    return CacheStatsResponse(enabled=True, **cache.stats())
+
+
+def require_profiling() -> None:
+    """Allow the profiler only when explicitly enabled."""
+    if not get_settings().profiling_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@admin_router.post(
+    "/profile",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_admin), Depends(require_profiling)],
+)
+async def profile(
+    seconds: Annotated[float, Query(gt=0, description="Sampling duration")] = 5.0,
+    interval_ms: Annotated[float, Query(ge=1, le=1000, description="Sampling interval")] = 5.0,
+) -> PlainTextResponse:
+    """
+    Sample the stacks of this worker's threads for a few seconds.
+
+    Returns collapsed stacks (one ``thread;frame;...;frame count`` line per
+    distinct stack) ready for flamegraph.pl or speedscope. Requests keep
+    being served while the profile runs.
+    """
+    max_seconds = get_settings().profiling_max_seconds
+    if seconds > max_seconds:
+        raise HTTPException(
+            status_code=422, detail=f"seconds must be at most {max_seconds}"
+        )
+
+    try:
+        stacks = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    return PlainTextResponse(collapsed(stacks))
+
+
+@metrics_router.get("/metrics", response_class=Response)
+async def prometheus_metrics() -> Response:
+    """Prometheus metrics: latencies, predictions, errors, batch sizes, cache, policy, logs."""
+    extra: list[str] = list(metrics.log_metrics(dropped_log_records()))
+    cache = get_prediction_cache()
+    if cache is not None:
+        extra.extend(metrics.cache_metrics(cache.stats()))
+    if model_loaded():
+        extra.extend(metrics.policy_metrics(get_model().policy.stats()))
+    return Response(content=metrics.render(extra), media_type=metrics.CONTENT_TYPE)
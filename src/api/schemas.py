@@ -46,9 +46,84 @@ class PredictionResponse(BaseModel):
     risk_level: str = Field(..., description="Risk level: low, medium, high")
 
 
+class PredictionBatchRequest(BaseModel):
+    """Request schema for batch prediction."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "applicants": [
+                    {
+                        "age": 35,
+                        "income": 50000,
+                        "credit_score": 720,
+                        "loan_amount": 15000,
+                        "employment_years": 8,
+                        "existing_debts": 5000,
+                    },
+                    {
+                        "age": 25,
+                        "income": 25000,
+                        "credit_score": 550,
+                        "loan_amount": 30000,
+                        "employment_years": 1,
+                        "existing_debts": 15000,
+                    },
+                ]
+            }
+        },
+    )
+
+    applicants: list[PredictionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50_000,
+        description="Customers to score, in order",
+    )
+
+
+class PredictionBatchResponse(BaseModel):
+    """Response schema for batch prediction."""
+
+    count: int = Field(..., ge=0, description="Number of scored customers")
+    predictions: list[PredictionResponse] = Field(
+        ..., description="Predictions in the same order as the request"
+    )
+
+
 class HealthResponse(BaseModel):
     """Response schema for health check."""
 
     status: str = Field(..., description="Application status")
     version: str = Field(..., description="API version")
     model_loaded: bool = Field(..., description="Model loaded in memory")
+
+
+class ReadinessResponse(BaseModel):
+    """Response schema for readiness check."""
+
+    ready: bool = Field(..., description="Ready to serve predictions")
+    model_loaded: bool = Field(..., description="Model loaded in memory")
+    model_version: int = Field(..., ge=0, description="Version of the model being served")
+    model_load_seconds: float | None = Field(None, description="Model load duration")
+    warmup_seconds: float | None = Field(None, description="Model warm-up duration")
+
+
+class ReloadResponse(BaseModel):
+    """Response schema for model reload."""
+
+    status: str = Field(..., description="Reload status")
+    model_version: int = Field(..., ge=0, description="Version of the model now being served")
+    model_load_seconds: float = Field(..., description="New model load duration")
+    warmup_seconds: float = Field(..., description="New model warm-up duration")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response schema for prediction cache statistics."""
+
+    enabled: bool = Field(..., description="Prediction cache enabled")
+    size: int = Field(0, ge=0, description="Cached predictions")
+    max_size: int = Field(0, ge=0, description="Cache capacity")
+    hits: int = Field(0, ge=0, description="Lookups served from the cache")
+    misses: int = Field(0, ge=0, description="Lookups that ran the model")
+    hit_rate: float = Field(0.0, ge=0, le=1, description="hits / (hits + misses)")
@@ -0,0 +1,187 @@
+"""
+Incremental NDJSON scoring shared by the streaming endpoint and CLI.
+"""
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+import numpy as np
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.api.schemas import PredictionRequest
+from src.models.credit_model import CreditApprovalModel
+
+# A parsed input line: (line number, validated request or pre-encoded error line)
+Record = tuple[int, PredictionRequest | bytes]
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body iterator itself reads the request body.
+
+    StreamingResponse normally listens for client disconnects by calling
+    ``receive()`` alongside the body iterator, which would steal the request
+    body chunks the iterator is consuming. Here only the iterator receives;
+    a disconnect surfaces from ``request.stream()`` as ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect() from e
+
+        if self.background is not None:
+            await self.background()
+
+
+def _encode(data: dict) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def parse_line(line_number: int, line: bytes) -> Record:
+    """Parse and validate one NDJSON line (errors become output lines)."""
+    try:
+        return line_number, PredictionRequest.model_validate(json.loads(line))
+    except json.JSONDecodeError as e:
+        return line_number, _encode({"line": line_number, "error": f"Invalid JSON: {e.msg}"})
+    except ValidationError as e:
+        return line_number, _encode(
+            {
+                "line": line_number,
+                "error": "Validation error",
+                "detail": e.errors(include_url=False, include_context=False),
+            }
+        )
+
+
+def score_records(model: CreditApprovalModel, records: list[Record]) -> bytes:
+    """
+    Score a chunk of records with one model call.
+
+    Returns:
+        NDJSON result lines in input order
+    """
+    valid = [(n, r) for n, r in records if isinstance(r, PredictionRequest)]
+    scores = {}
+    if valid:
+        feature_names = model.feature_names or list(PredictionRequest.model_fields)
+        X = np.array(
+            [[getattr(r, name) for name in feature_names] for _, r in valid],
+            dtype=np.float64,
+        )
+        result = model.score_array(X)
+        for (n, _), label, probability, risk_level in zip(
+            valid,
+            result.labels.tolist(),
+            result.probabilities.tolist(),
+            result.risk_levels.tolist(),
+        ):
+            scores[n] = _encode(
+                {
+                    "line": n,
+                    "approved": bool(label),
+                    "approval_probability": round(probability, 4),
+                    "risk_level": risk_level,
+                }
+            )
+
+    return b"".join(scores[n] if n in scores else r for n, r in records)
+
+
+def iter_scored_ndjson(
+    lines: Iterable[bytes],
+    model: CreditApprovalModel,
+    chunk_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Score NDJSON lines in fixed-size chunks (synchronous, constant memory).
+
+    Args:
+        lines: Input lines (blank lines are skipped)
+        model: Model to score with
+        chunk_size: Records scored per model call
+
+    Yields:
+        Blocks of NDJSON result lines
+    """
+    chunk: list[Record] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        chunk.append(parse_line(line_number, line))
+        if len(chunk) >= chunk_size:
+            yield score_records(model, chunk)
+            chunk = []
+
+    if chunk:
+        yield score_records(model, chunk)
+
+
+async def iter_lines(body: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    """
+    Split a chunked byte stream into lines without buffering the whole body.
+
+    Lines longer than ``max_line_bytes`` are replaced by a single ``b"\\x00"``
+    marker line so callers can report them without holding them in memory.
+    """
+    buffer = b""
+    skipping = False
+    async for chunk in body:
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            yield line if len(line) <= max_line_bytes else b"\x00"
+
+        if len(buffer) > max_line_bytes:
+            buffer = b""
+            if not skipping:
+                skipping = True
+                yield b"\x00"
+
+    if buffer and not skipping:
+        yield buffer
+
+
+async def stream_scored_ndjson(
+    body: AsyncIterator[bytes],
+    score: Callable[[list[Record]], Awaitable[bytes]],
+    chunk_size: int = 1000,
+    max_line_bytes: int = 65_536,
+) -> AsyncIterator[bytes]:
+    """
+    Parse, validate and score an NDJSON byte stream chunk by chunk.
+
+    Args:
+        body: Request body chunks
+        score: Coroutine scoring a chunk of records (e.g. on the executor)
+        chunk_size: Records scored per model call
+        max_line_bytes: Longest accepted input line
+
+    Yields:
+        Blocks of NDJSON result lines, as soon as each chunk is scored
+    """
+    chunk: list[Record] = []
+    line_number = 0
+    async for line in iter_lines(body, max_line_bytes):
+        line_number += 1
+        if line == b"\x00":
+            chunk.append(
+                (line_number, _encode({"line": line_number, "error": "Line too long"}))
+            )
+        elif not line.strip():
+            continue
+        else:
+            chunk.append(parse_line(line_number, line))
+
+        if len(chunk) >= chunk_size:
+            yield await score(chunk)
+            chunk = []
+
+    if chunk:
+        yield await score(chunk)
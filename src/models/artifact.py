@@ -0,0 +1,119 @@
+"""
+Single-file, versioned model artifact (no pickle).
+
+An artifact is a zip archive holding ``manifest.json`` and one compressed
+``.npy`` entry per array. The manifest records the format version, feature
+order, model metadata, and a SHA-256 digest per array plus one over all of
+them, so corrupted or mismatched files are rejected on load.
+"""
+import hashlib
+import io
+import json
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ARTIFACT_SUFFIX: str = ".artifact"
+ARTIFACT_FORMAT: str = "credit-approval-model"
+ARTIFACT_VERSION: int = 1
+MANIFEST_NAME: str = "manifest.json"
+
+
+def _digest(array: np.ndarray) -> str:
+    return hashlib.sha256(np.ascontiguousarray(array).tobytes()).hexdigest()
+
+
+def _checksum(specs: dict[str, dict[str, Any]]) -> str:
+    """Digest over every array digest, in name order."""
+    combined = "".join(specs[name]["sha256"] for name in sorted(specs))
+    return hashlib.sha256(combined.encode("ascii")).hexdigest()
+
+
+def write_artifact(path: str, arrays: dict[str, np.ndarray], manifest: dict[str, Any]) -> None:
+    """
+    Write arrays and a manifest as one compressed artifact.
+
+    Args:
+        path: Destination file (conventionally ``*.artifact``)
+        arrays: Numeric arrays to store (object arrays are rejected)
+        manifest: JSON-serializable metadata; format, version, array specs
+            and checksum are added
+    """
+    specs = {}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ValueError(f"Array '{name}' has an object dtype and cannot be stored")
+        specs[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "sha256": _digest(array),
+        }
+
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "format_version": ARTIFACT_VERSION,
+        **manifest,
+        "arrays": specs,
+        "checksum": _checksum(specs),
+    }
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(path).with_name(f".{Path(path).name}.tmp")
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        for name, array in arrays.items():
+            buffer = io.BytesIO()
+            np.lib.format.write_array(buffer, np.ascontiguousarray(array), allow_pickle=False)
+            archive.writestr(f"{name}.npy", buffer.getvalue())
+
+    # Readers (e.g. the hot-reload watcher) never see a half-written file
+    tmp_path.replace(path)
+
+
+def read_artifact(path: str) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """
+    Read and verify an artifact written by ``write_artifact``.
+
+    Args:
+        path: Artifact file
+
+    Returns:
+        Manifest and arrays
+
+    Raises:
+        ValueError: If the file is not an artifact, has an unsupported
+            version, or fails checksum verification
+    """
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"{path} is not a model artifact") from e
+
+    with archive:
+        try:
+            manifest = json.loads(archive.read(MANIFEST_NAME))
+        except KeyError as e:
+            raise ValueError(f"{path} has no {MANIFEST_NAME}") from e
+
+        if manifest.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"{path} is not a {ARTIFACT_FORMAT} artifact")
+        if manifest.get("format_version", 0) > ARTIFACT_VERSION:
+            raise ValueError(
+                f"{path} uses artifact version {manifest['format_version']}, "
+                f"this release reads up to {ARTIFACT_VERSION}"
+            )
+
+        arrays = {}
+        for name, spec in manifest["arrays"].items():
+            with archive.open(f"{name}.npy") as f:
+                array = np.lib.format.read_array(f, allow_pickle=False)
+            if _digest(array) != spec["sha256"]:
+                raise ValueError(f"{path}: checksum mismatch for array '{name}'")
+            arrays[name] = array
+
+    if _checksum(manifest["arrays"]) != manifest.get("checksum"):
+        raise ValueError(f"{path}: manifest checksum mismatch")
+
+    return manifest, arrays
@@ -0,0 +1,681 @@
+"""
+Flat, array-backed random forest evaluator.
+"""
+import bisect
+import json
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+# Rows evaluated per traversal step (bounds the (rows, trees) index arrays)
+DEFAULT_CHUNK_SIZE: int = 4096
+
+# Trees evaluated between early-exit checks
+DEFAULT_EXIT_BLOCK: int = 10
+
+# Memory-mappable artifact: magic, uint32 header length, JSON header, arrays
+FOREST_SUFFIX: str = ".forest"
+FOREST_MAGIC: bytes = b"CFOREST1"
+FOREST_ALIGNMENT: int = 64
+FOREST_ARRAYS: tuple[str, ...] = ("feature", "threshold", "left", "right", "value", "roots")
+QUANTIZED_ARRAYS: tuple[str, ...] = ("feature", "threshold", "left", "right", "roots")
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the artifact's array alignment."""
+    return -(-offset // FOREST_ALIGNMENT) * FOREST_ALIGNMENT
+
+
+def float32_split_boundary(threshold: np.ndarray) -> np.ndarray:
+    """
+    Convert sklearn thresholds to exact float64 split boundaries.
+
+    sklearn casts inputs to float32 before comparing ``x <= threshold``, and
+    thresholds often coincide with a float32 training value. The equivalent
+    float64 test is ``x <= m`` where ``m`` is the midpoint between the largest
+    float32 not above the threshold and the next float32 up.
+    """
+    lower = threshold.astype(np.float32)
+    lower = np.where(
+        lower.astype(np.float64) > threshold,
+        np.nextafter(lower, np.float32(-np.inf)),
+        lower,
+    )
+    upper = np.nextafter(lower, np.float32(np.inf))
+    return (lower.astype(np.float64) + upper.astype(np.float64)) / 2.0
+
+
+def flatten_forest(forest: RandomForestClassifier) -> tuple[dict[str, np.ndarray], int]:
+    """
+    Concatenate every tree of a fitted forest into shared node arrays.
+
+    Thresholds keep sklearn's semantics (float32 comparison, scaled feature
+    space); leaves have feature 0, threshold 0 and point to themselves, and
+    ``value`` holds each node's approval probability.
+
+    Args:
+        forest: Fitted RandomForestClassifier (binary)
+
+    Returns:
+        Node arrays (FOREST_ARRAYS) and the deepest tree depth
+    """
+    positive = int(np.flatnonzero(forest.classes_ == 1)[0])
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        node_ids = np.arange(n_nodes)
+        is_leaf = tree.children_left == -1
+
+        counts = tree.value[:, 0, :]
+
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.int64))
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+        rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+        values.append(counts[:, positive] / counts.sum(axis=1))
+        roots.append(offset)
+
+        offset += n_nodes
+        max_depth = max(max_depth, tree.max_depth)
+
+    nodes = {
+        "feature": np.concatenate(features),
+        "threshold": np.concatenate(thresholds),
+        "left": np.concatenate(lefts).astype(np.int64),
+        "right": np.concatenate(rights).astype(np.int64),
+        "value": np.concatenate(values).astype(np.float64),
+        "roots": np.asarray(roots, dtype=np.int64),
+    }
+    return nodes, max_depth
+
+
+class CompiledForest:
+    """
+    Random forest flattened into contiguous NumPy arrays.
+
+    All trees share one set of node arrays; ``roots`` holds the index of each
+    tree's root node. Leaves point to themselves on both sides, so a batch is
+    evaluated by stepping every (row, tree) pair ``max_depth`` times without
+    any per-node branching in Python.
+    """
+
+    # Node arrays written by save() and read back by load()
+    arrays: tuple[str, ...] = FOREST_ARRAYS
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        n_features: int,
+        max_depth: int,
+        feature_names: list[str] | None = None,
+    ) -> None:
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.n_features = n_features
+        self.max_depth = max_depth
+        self.feature_names = feature_names
+        self._tree_bounds: tuple[np.ndarray, np.ndarray] | None = None
+        self._checkpoints: dict[tuple, list[int]] = {}
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the node arrays."""
+        return sum(getattr(self, name).nbytes for name in self.arrays)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        nodes: dict[str, np.ndarray],
+        n_features: int,
+        max_depth: int,
+        scaler_mean: np.ndarray | None = None,
+        scaler_scale: np.ndarray | None = None,
+        feature_names: list[str] | None = None,
+    ) -> "CompiledForest":
+        """
+        Build a compiled forest from node arrays produced by ``flatten_forest``.
+
+        Trees only compare one feature against a threshold per node, so
+        ``(x - mean) / scale <= t`` is rewritten as ``x <= t * scale + mean``
+        and the compiled forest consumes raw (unscaled) features. Thresholds
+        are first widened to sklearn's float32 rounding boundary so decisions
+        match sklearn exactly on values seen during training.
+
+        Args:
+            nodes: Node arrays with sklearn threshold semantics
+            n_features: Number of input features
+            max_depth: Deepest tree depth
+            scaler_mean: StandardScaler mean applied before the forest, if any
+            scaler_scale: StandardScaler scale applied before the forest, if any
+            feature_names: Feature order expected by the forest
+
+        Returns:
+            Compiled forest
+        """
+        feature = nodes["feature"].astype(np.int64)
+        is_leaf = nodes["left"] == np.arange(len(feature))
+
+        threshold = np.where(is_leaf, 0.0, float32_split_boundary(nodes["threshold"]))
+        if scaler_mean is not None and scaler_scale is not None:
+            threshold = np.where(
+                is_leaf, 0.0, threshold * scaler_scale[feature] + scaler_mean[feature]
+            )
+
+        return cls(
+            feature=feature,
+            threshold=threshold,
+            left=nodes["left"].astype(np.int64),
+            right=nodes["right"].astype(np.int64),
+            value=nodes["value"].astype(np.float64),
+            roots=nodes["roots"].astype(np.int64),
+            n_features=n_features,
+            max_depth=max_depth,
+            feature_names=feature_names,
+        )
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        forest: RandomForestClassifier,
+        scaler: StandardScaler | None = None,
+        feature_names: list[str] | None = None,
+    ) -> "CompiledForest":
+        """
+        Flatten a fitted forest, optionally folding a StandardScaler into it.
+
+        Args:
+            forest: Fitted RandomForestClassifier (binary)
+            scaler: StandardScaler applied before the forest, if any
+            feature_names: Feature order expected by the forest
+
+        Returns:
+            Compiled forest
+        """
+        nodes, max_depth = flatten_forest(forest)
+        return cls.from_arrays(
+            nodes,
+            n_features=forest.n_features_in_,
+            max_depth=max_depth,
+            scaler_mean=scaler.mean_ if scaler is not None else None,
+            scaler_scale=scaler.scale_ if scaler is not None else None,
+            feature_names=feature_names,
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the forest as a single memory-mappable file.
+
+        The file holds a small JSON header followed by each node array as
+        raw, 64-byte aligned little-endian data, so ``load(mmap=True)`` can
+        expose the arrays without copying them.
+
+        Args:
+            path: Destination file (conventionally ``*.forest``)
+        """
+        arrays = {}
+        for name in self.arrays:
+            array = getattr(self, name)
+            arrays[name] = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+
+        specs = {}
+        offset = 0
+        for name, array in arrays.items():
+            offset = _align(offset)
+            specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset += array.nbytes
+
+        header = {
+            "layout": "quantized" if isinstance(self, QuantizedForest) else "full",
+            "n_features": self.n_features,
+            "max_depth": self.max_depth,
+            "feature_names": self.feature_names,
+            "arrays": specs,
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+        data_start = _align(len(FOREST_MAGIC) + 4 + len(header_bytes))
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(path).with_name(f".{Path(path).name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(FOREST_MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.seek(data_start + specs[name]["offset"])
+                f.write(array.tobytes())
+
+        # A new inode: processes mapping the old file keep reading it intact
+        # (truncating a mapped file in place kills them with SIGBUS)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CompiledForest":
+        """
+        Read a forest written by ``save``.
+
+        Quantized forests are returned as ``QuantizedForest``. With
+        ``mmap=True`` the node arrays are read-only views of the file mapping,
+        so every process loading the same file shares one copy of the pages
+        through the OS page cache.
+
+        Args:
+            path: Forest file
+            mmap: Map the file instead of reading it into memory
+
+        Returns:
+            Compiled forest
+        """
+        with open(path, "rb") as f:
+            if f.read(len(FOREST_MAGIC)) != FOREST_MAGIC:
+                raise ValueError(f"{path} is not a compiled forest file")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+
+        data_start = _align(len(FOREST_MAGIC) + 4 + header_length)
+
+        if mmap:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            buffer = np.fromfile(path, dtype=np.uint8)
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            count = int(np.prod(spec["shape"]))
+            arrays[name] = (
+                buffer[start : start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+            )
+
+        forest_cls = QuantizedForest if header.get("layout") == "quantized" else CompiledForest
+        return forest_cls(
+            **arrays,
+            n_features=header["n_features"],
+            max_depth=header["max_depth"],
+            feature_names=header["feature_names"],
+        )
+
+    def leaves(self, X: np.ndarray, roots: np.ndarray | None = None) -> np.ndarray:
+        """
+        Return the leaf reached in every tree for every row.
+
+        Args:
+            X: Raw features (n_samples, n_features)
+            roots: Root nodes of the trees to evaluate (default: all trees)
+
+        Returns:
+            Leaf node indices (n_samples, n_trees)
+        """
+        roots = self.roots if roots is None else roots
+        nodes = np.broadcast_to(roots, (len(X), len(roots)))
+        for _ in range(self.max_depth):
+            x = np.take_along_axis(X, self.feature[nodes], axis=1)
+            nodes = np.where(x <= self.threshold[nodes], self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_positive(
+        self, X: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> np.ndarray:
+        """
+        Return the approval probability (mean leaf value over trees).
+
+        Args:
+            X: Raw features (n_samples, n_features)
+            chunk_size: Rows evaluated per traversal step
+
+        Returns:
+            Approval probabilities (n_samples,)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected array of shape (n_samples, {self.n_features}), got {X.shape}"
+            )
+
+        result = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), chunk_size):
+            stop = start + chunk_size
+            result[start:stop] = self.value[self.leaves(X[start:stop])].mean(axis=1)
+        return result
+
+    def predict_proba(self, X: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+        """
+        Return prediction probabilities in sklearn's layout.
+
+        Args:
+            X: Raw features (n_samples, n_features)
+            chunk_size: Rows evaluated per traversal step
+
+        Returns:
+            Probabilities [prob_rejected, prob_approved]
+        """
+        positive = self.predict_positive(X, chunk_size)
+        return np.column_stack([1.0 - positive, positive])
+
+    @property
+    def tree_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Smallest and largest leaf value of each tree."""
+        if self._tree_bounds is None:
+            is_leaf = self.left == np.arange(self.n_nodes)
+            value = self.value.astype(np.float64)
+            self._tree_bounds = (
+                np.minimum.reduceat(np.where(is_leaf, value, np.inf), self.roots),
+                np.maximum.reduceat(np.where(is_leaf, value, -np.inf), self.roots),
+            )
+        return self._tree_bounds
+
+    def exit_checkpoints(self, boundaries: tuple[float, ...], block_size: int) -> list[int]:
+        """
+        Tree counts after which early exit is checked.
+
+        No row can be decided before enough trees are evaluated for the
+        remaining ones to fit between two boundaries, so the first check is
+        at the earliest such count, then every ``block_size`` trees.
+        """
+        key = (tuple(boundaries), block_size)
+        if key not in self._checkpoints:
+            tree_min, tree_max = self.tree_bounds
+            done_min = np.concatenate([[0.0], np.cumsum(tree_min)])
+            done_max = np.concatenate([[0.0], np.cumsum(tree_max)])
+            rest_min = done_min[-1] - done_min
+            rest_max = done_max[-1] - done_max
+
+            # Some sum of the first t leaves leaves the final sum inside one gap
+            edges = np.concatenate([[-np.inf], np.sort(boundaries) * self.n_trees, [np.inf]])
+            decidable = np.zeros(self.n_trees + 1, dtype=bool)
+            for low, high in zip(edges[:-1], edges[1:]):
+                decidable |= np.maximum(done_min, low - rest_min) < np.minimum(
+                    done_max, high - rest_max
+                )
+
+            first = int(np.argmax(decidable[1:])) + 1 if decidable[1:].any() else self.n_trees
+            self._checkpoints[key] = [*range(first, self.n_trees, block_size), self.n_trees]
+        return self._checkpoints[key]
+
+    def predict_positive_early_exit(
+        self,
+        X: np.ndarray,
+        boundaries: tuple[float, ...],
+        block_size: int = DEFAULT_EXIT_BLOCK,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return approval probabilities, stopping once no boundary can be crossed.
+
+        Trees are evaluated in blocks (see ``exit_checkpoints``). After each
+        block, the smallest and largest leaves of the remaining trees bound
+        each row's final probability, and rows whose bounds contain no
+        boundary stop. Their probability is the running mean clipped to those
+        bounds, so it lands on the same side of every boundary as the exact
+        one; rows that need every tree get the exact probability.
+
+        Args:
+            X: Raw features (n_samples, n_features)
+            boundaries: Probabilities whose side must be exact (e.g. the
+                decision threshold and risk level cutoffs)
+            block_size: Trees evaluated between checks
+            chunk_size: Rows evaluated per traversal step
+
+        Returns:
+            Approval probabilities (n_samples,) and trees evaluated per row
+        """
+        # Compare in the thresholds' precision (float32 when quantized)
+        X = np.asarray(X, dtype=self.threshold.dtype)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected array of shape (n_samples, {self.n_features}), got {X.shape}"
+            )
+
+        checkpoints = self.exit_checkpoints(boundaries, block_size)
+        boundaries = np.asarray(boundaries, dtype=np.float64)
+        result = np.empty(len(X), dtype=np.float64)
+        evaluated = np.empty(len(X), dtype=np.int64)
+        for start in range(0, len(X), chunk_size):
+            stop = start + chunk_size
+            result[start:stop], evaluated[start:stop] = self._early_exit_chunk(
+                X[start:stop], boundaries, checkpoints
+            )
+        return result, evaluated
+
+    def _early_exit_chunk(
+        self, X: np.ndarray, boundaries: np.ndarray, checkpoints: list[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        tree_min, tree_max = self.tree_bounds
+        sums = np.zeros(len(X), dtype=np.float64)
+        lower = np.zeros(len(X), dtype=np.float64)
+        upper = np.ones(len(X), dtype=np.float64)
+        evaluated = np.zeros(len(X), dtype=np.int64)
+        active = np.arange(len(X))
+
+        start = 0
+        for stop in checkpoints:
+            leaves = self.leaves(X[active], self.roots[start:stop])
+            sums[active] += self.value[leaves].sum(axis=1, dtype=np.float64)
+            evaluated[active] = stop
+
+            lower[active] = (sums[active] + tree_min[stop:].sum()) / self.n_trees
+            upper[active] = (sums[active] + tree_max[stop:].sum()) / self.n_trees
+            crossable = (lower[active, None] <= boundaries) & (boundaries <= upper[active, None])
+            active = active[crossable.any(axis=1)]
+            if len(active) == 0:
+                break
+            start = stop
+
+        return np.clip(sums / evaluated, lower, upper), evaluated
+
+    def quantize(self) -> "QuantizedForest":
+        """
+        Return a compact copy for serving (see ``QuantizedForest``).
+
+        Returns:
+            Quantized forest
+        """
+        is_leaf = self.left == np.arange(self.n_nodes)
+
+        # Largest float32 not above each boundary: float32(x) <= t32 <=> x <= t
+        threshold = self.threshold.astype(np.float32)
+        threshold = np.where(
+            threshold.astype(np.float64) > self.threshold,
+            np.nextafter(threshold, np.float32(-np.inf)),
+            threshold,
+        )
+        threshold = np.where(is_leaf, self.value.astype(np.float32), threshold)
+
+        feature_dtype = np.uint8 if self.n_features <= 256 else np.uint16
+        index_dtype = np.int16 if self.n_nodes < 2**15 else np.int32
+        return QuantizedForest(
+            feature=self.feature.astype(feature_dtype),
+            threshold=threshold,
+            left=self.left.astype(index_dtype),
+            right=self.right.astype(index_dtype),
+            roots=self.roots.astype(index_dtype),
+            n_features=self.n_features,
+            max_depth=self.max_depth,
+            feature_names=self.feature_names,
+        )
+
+
+class QuantizedForest(CompiledForest):
+    """
+    Compact compiled forest: 9 bytes per node instead of 40.
+
+    Split thresholds are float32 and compared against float32 inputs, feature
+    indices are uint8 (uint16 beyond 256 features) and child indices int16
+    (int32 for forests of 32,768 nodes or more).
+    Leaves never read their threshold, so a leaf's approval probability is
+    stored in that slot and there is no separate value array. Decisions match
+    the full-precision forest except for inputs within float32 rounding of a
+    split boundary; ``CreditApprovalModel.quantization_parity`` measures this.
+    """
+
+    arrays: tuple[str, ...] = QUANTIZED_ARRAYS
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        roots: np.ndarray,
+        n_features: int,
+        max_depth: int,
+        feature_names: list[str] | None = None,
+    ) -> None:
+        # Leaf probabilities live in the threshold array
+        super().__init__(
+            feature=feature,
+            threshold=threshold,
+            left=left,
+            right=right,
+            value=threshold,
+            roots=roots,
+            n_features=n_features,
+            max_depth=max_depth,
+            feature_names=feature_names,
+        )
+
+    def quantize(self) -> "QuantizedForest":
+        return self
+
+    def leaves(self, X: np.ndarray, roots: np.ndarray | None = None) -> np.ndarray:
+        """
+        Return the leaf reached in every tree for every row.
+
+        Args:
+            X: Raw features (n_samples, n_features), float32
+            roots: Root nodes of the trees to evaluate (default: all trees)
+
+        Returns:
+            Leaf node indices (n_samples, n_trees)
+        """
+        roots = self.roots if roots is None else roots
+        # Traverse with native indices: NumPy would convert int16/int32 ones on every gather
+        nodes = np.broadcast_to(roots.astype(np.intp), (len(X), len(roots)))
+        for _ in range(self.max_depth):
+            x = np.take_along_axis(X, self.feature[nodes], axis=1)
+            nodes = np.where(
+                x <= self.threshold[nodes], self.left[nodes], self.right[nodes]
+            ).astype(np.intp)
+        return nodes
+
+    def predict_positive(
+        self, X: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> np.ndarray:
+        """
+        Return the approval probability (mean leaf value over trees).
+
+        Args:
+            X: Raw features (n_samples, n_features), compared as float32
+            chunk_size: Rows evaluated per traversal step
+
+        Returns:
+            Approval probabilities (n_samples,), averaged in float64
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected array of shape (n_samples, {self.n_features}), got {X.shape}"
+            )
+
+        result = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), chunk_size):
+            stop = start + chunk_size
+            leaves = self.leaves(X[start:stop])
+            result[start:stop] = self.threshold[leaves].mean(axis=1, dtype=np.float64)
+        return result
+
+
+class ThresholdIndex:
+    """
+    Sorted split thresholds per feature, mapping rows to forest cells.
+
+    Every split tests ``x <= t`` for a threshold ``t`` of one feature, so two
+    rows whose features fall in the same intervals between consecutive
+    thresholds take the same path through every tree and get exactly the
+    same probability. A row's cell is the number of thresholds below each
+    of its feature values.
+    """
+
+    def __init__(self, thresholds: list[np.ndarray], dtype: np.dtype) -> None:
+        self.thresholds = thresholds
+        self.dtype = dtype
+        # Plain float lists: bisect on them is faster than NumPy for one row
+        self._bounds = [t.tolist() for t in thresholds]
+
+    @classmethod
+    def from_forest(cls, forest: CompiledForest) -> "ThresholdIndex":
+        """
+        Collect the distinct split thresholds of each feature.
+
+        Args:
+            forest: Compiled (or quantized) forest
+
+        Returns:
+            Threshold index comparing values in the forest's threshold dtype
+        """
+        internal = forest.left != np.arange(forest.n_nodes)
+        feature = forest.feature[internal]
+        threshold = forest.threshold[internal]
+        return cls(
+            [np.unique(threshold[feature == i]) for i in range(forest.n_features)],
+            forest.threshold.dtype,
+        )
+
+    @property
+    def n_cells(self) -> int:
+        """Number of distinct cells (product of intervals per feature)."""
+        return int(np.prod([len(t) + 1 for t in self.thresholds], dtype=np.float64))
+
+    def cell(self, row: Sequence[float]) -> tuple[int, ...]:
+        """
+        Return the interval id of each feature value of one row.
+
+        Args:
+            row: Raw feature values in the forest's feature order
+
+        Returns:
+            Cell key (one interval id per feature)
+        """
+        if self.dtype != np.float64:
+            row = np.asarray(row, dtype=self.dtype).tolist()
+        return tuple(bisect.bisect_left(bounds, x) for bounds, x in zip(self._bounds, row))
+
+    def cells(self, X: np.ndarray) -> np.ndarray:
+        """
+        Return the interval ids of every row.
+
+        Args:
+            X: Raw features (n_samples, n_features)
+
+        Returns:
+            Interval ids (n_samples, n_features)
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        return np.column_stack(
+            [np.searchsorted(t, X[:, i], side="left") for i, t in enumerate(self.thresholds)]
+        )
@@ -1,31 +1,235 @@
 """
 Machine Learning models module.
 """
-import joblib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+
+import joblib
 
 import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 
+from src.models.artifact import ARTIFACT_SUFFIX, read_artifact, write_artifact
+from src.models.compiled_forest import (
+    FOREST_SUFFIX,
+    CompiledForest,
+    QuantizedForest,
+    ThresholdIndex,
+    flatten_forest,
+    float32_split_boundary,
+)
+from src.models.policy import PolicyEngine, risk_levels
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default probability a customer must exceed to be approved
+DEFAULT_DECISION_THRESHOLD: float = 0.5
+
+# Inference backends: sklearn's forest or the flat array evaluator
+# (full precision or quantized to float32 / small integers)
+BACKENDS: tuple[str, ...] = ("sklearn", "compiled", "quantized")
+COMPILED_BACKENDS: tuple[str, ...] = ("compiled", "quantized")
+
+# Smallest batch scored with early exit: below it, the extra NumPy calls per
+# tree block cost more than the trees they skip
+EARLY_EXIT_MIN_ROWS: int = 256
+
+
+@dataclass(frozen=True)
+class ScoringResult:
+    """Decisions, approval probabilities and risk levels for a batch."""
+
+    labels: np.ndarray
+    probabilities: np.ndarray
+    risk_levels: np.ndarray
+
+    @classmethod
+    def from_probabilities(
+        cls,
+        probabilities: np.ndarray,
+        threshold: float = DEFAULT_DECISION_THRESHOLD,
+        policy: PolicyEngine | None = None,
+    ) -> "ScoringResult":
+        """Derive labels and risk levels (the policy's, if given) from probabilities."""
+        return cls(
+            labels=(probabilities > threshold).astype(np.int64),
+            probabilities=probabilities,
+            risk_levels=(
+                policy.risk_levels(probabilities) if policy else risk_levels(probabilities)
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
 
 class CreditApprovalModel:
     """Credit approval classification model."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        decision_threshold: float = DEFAULT_DECISION_THRESHOLD,
+        backend: str = "sklearn",
+        early_exit: bool = False,
+        n_jobs: int | None = None,
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Choose one of {BACKENDS}.")
+
         self.model: RandomForestClassifier | None = None
         self.scaler: StandardScaler | None = None
         self.feature_names: list[str] | None = None
+        self.decision_threshold = decision_threshold
+        self.backend = backend
+        # Serving n_jobs of the sklearn forest (None: keep the fitted value)
+        self.n_jobs = n_jobs
+        # Stop walking trees once decision and risk level are settled
+        self.early_exit = early_exit
+        # Pre-screen rules and risk levels (replaced by the serving layer)
+        self.policy = PolicyEngine()
+        self.compiled: CompiledForest | None = None
+        # Training details recorded in artifacts
+        self.metadata: dict[str, Any] = {}
+        # Set by the serving layer when the model is installed; the observer
+        # receives (scaling, forest) seconds of single-row calls
+        self.version: int = 0
+        self.stage_observer: Callable[[float, float], None] | None = None
+        self._threshold_index: ThresholdIndex | None = None
+
+    @property
+    def threshold_index(self) -> ThresholdIndex:
+        """
+        Per-feature split thresholds of the served forest (built on first use).
+
+        Cells are exact for the compiled backends. For the sklearn backend they
+        come from the compiled equivalent of the forest, whose decisions match
+        sklearn's up to float rounding of scaled values at a split.
+        """
+        if self._threshold_index is None:
+            if self.model is None and self.compiled is None:
+                raise ValueError("Model not trained. Run train() first.")
+            forest = self.compiled or CompiledForest.from_sklearn(
+                self.model, self.scaler, feature_names=self.feature_names
+            )
+            self._threshold_index = ThresholdIndex.from_forest(forest)
+        return self._threshold_index
+
+    def _set_serving_n_jobs(self) -> None:
+        """
+        Apply the serving n_jobs to the sklearn forest.
+
+        The forest is fitted with ``n_jobs=-1`` and that value is pickled
+        with it, so without this every predict call dispatches to a joblib
+        pool across all cores, which costs more than a small batch's work.
+        """
+        if self.n_jobs is not None and self.model is not None:
+            self.model.set_params(n_jobs=self.n_jobs)
+
+    def compile(self) -> CompiledForest:
+        """
+        Flatten the trained forest (with the scaler folded in) for serving.
+
+        Returns:
+            Compiled forest used by the "compiled" backend, quantized for
+            the "quantized" backend
+        """
+        if self.model is None:
+            raise ValueError("Model not trained. Run train() first.")
+
+        compiled = CompiledForest.from_sklearn(
+            self.model, self.scaler, feature_names=self.feature_names
+        )
+        self.compiled = compiled.quantize() if self.backend == "quantized" else compiled
+        self._threshold_index = None
+        logger.info(
+            f"Forest compiled: {self.compiled.n_trees} trees, "
+            f"{self.compiled.n_nodes} nodes, {self.compiled.nbytes / 1024:.0f} KiB"
+        )
+        return self.compiled
+
+    def quantization_parity(
+        self, X: pd.DataFrame, y: pd.Series | None = None
+    ) -> dict[str, float]:
+        """
+        Measure how closely the quantized forest matches the trained one.
+
+        Args:
+            X: Features to compare on (e.g. the test set)
+            y: True labels, to also compare accuracy
+
+        Returns:
+            Largest probability difference, share of identical decisions,
+            memory of both representations and, with ``y``, both accuracies
+        """
+        if self.model is None:
+            raise ValueError("Model not trained. Run train() first.")
+
+        full = CompiledForest.from_sklearn(
+            self.model, self.scaler, feature_names=self.feature_names
+        )
+        quantized = full.quantize()
+
+        X_array = self._to_array(X)
+        reference = self.model.predict_proba(self._prepare(X))[:, 1]
+        candidate = quantized.predict_positive(X_array)
+        reference_approved = reference > self.decision_threshold
+        candidate_approved = candidate > self.decision_threshold
+
+        parity = {
+            "max_probability_error": float(np.abs(candidate - reference).max()),
+            "decision_agreement": float((candidate_approved == reference_approved).mean()),
+            "full_bytes": full.nbytes,
+            "quantized_bytes": quantized.nbytes,
+        }
+        if y is not None:
+            y = np.asarray(y)
+            parity["reference_accuracy"] = float((reference_approved == y).mean())
+            parity["quantized_accuracy"] = float((candidate_approved == y).mean())
+        return parity
+
+    def fold_scaler(self) -> None:
+        """
+        Rewrite the forest's split thresholds into raw feature space.
+
+        Trees are invariant to per-feature affine scaling, so the scaler can
+        be absorbed into the thresholds and dropped from the serving path.
+        Does nothing if the scaler is already folded.
+        """
+        if self.scaler is None:
+            return
+
+        if self.model is None:
+            raise ValueError("Model not trained. Run train() first.")
+
+        for estimator in self.model.estimators_:
+            tree = estimator.tree_
+            internal = tree.children_left != -1
+            feature = tree.feature[internal]
+            boundary = float32_split_boundary(tree.threshold[internal])
+            tree.threshold[internal] = (
+                boundary * self.scaler.scale_[feature] + self.scaler.mean_[feature]
+            )
+
+        self.scaler = None
+        self._threshold_index = None
+        if self.compiled is not None:
+            self.compile()
+
+        logger.info("Scaler folded into forest thresholds")
 
     def train(
         self,
         X_train: pd.DataFrame,
         y_train: pd.Series,
+        fold_scaler: bool = False,
     ) -> dict:
         """
         Train the classification model.
@@ -33,6 +237,7 @@ class CreditApprovalModel:
         Args:
             X_train: Training features
             y_train: Training target
+            fold_scaler: Fold the scaler into the trees after fitting
 
         Returns:
             Training metrics
@@ -53,6 +258,7 @@ class CreditApprovalModel:
             n_jobs=-1,
         )
         self.model.fit(X_scaled, y_train)
+        self._set_serving_n_jobs()
 
         # Store feature names
         self.feature_names = X_train.columns.tolist()
@@ -60,13 +266,44 @@ class CreditApprovalModel:
         # Calculate training accuracy
         train_score = self.model.score(X_scaled, y_train)
 
+        self.compiled = None
+        self._threshold_index = None
+        if fold_scaler:
+            self.fold_scaler()
+        if self.backend in COMPILED_BACKENDS:
+            self.compile()
+
         logger.info(f"Model trained successfully. Accuracy: {train_score:.4f}")
 
-        return {
+        metrics = {
             "train_accuracy": float(train_score),
             "n_features": len(self.feature_names),
             "n_estimators": self.model.n_estimators,
         }
+        self.metadata = {
+            **metrics,
+            "n_samples": len(X_train),
+            "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "sklearn_version": sklearn.__version__,
+            "params": {
+                name: value
+                for name, value in self.model.get_params().items()
+                if isinstance(value, (int, float, str, bool)) or value is None
+            },
+        }
+        return metrics
+
+    def _to_array(self, X: pd.DataFrame) -> np.ndarray:
+        """Convert a feature frame to a float64 matrix in feature_names order."""
+        if isinstance(X, pd.DataFrame) and self.feature_names is not None:
+            X = X[self.feature_names]
+        return np.asarray(X, dtype=np.float64)
+
+    def _prepare(self, X: pd.DataFrame) -> np.ndarray:
+        """Scale features for the forest (a no-op once the scaler is folded)."""
+        if self.scaler is None:
+            return self._to_array(X)
+        return self.scaler.transform(X)
 
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """
@@ -78,11 +315,14 @@ class CreditApprovalModel:
         Returns:
             Predictions (0 = Rejected, 1 = Approved)
         """
-        if self.model is None or self.scaler is None:
+        if self.model is None and self.compiled is None:
             raise ValueError("Model not trained. Run train() first.")
 
-        X_scaled = self.scaler.transform(X)
-        return self.model.predict(X_scaled)
+        if self.compiled is not None:
+            proba = self.compiled.predict_proba(self._to_array(X))
+            return np.argmax(proba, axis=1)
+
+        return self.model.predict(self._prepare(X))
 
     def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
         """
@@ -94,11 +334,127 @@ class CreditApprovalModel:
         Returns:
             Probabilities [prob_rejected, prob_approved]
         """
-        if self.model is None or self.scaler is None:
+        if self.model is None and self.compiled is None:
+            raise ValueError("Model not trained. Run train() first.")
+
+        if self.compiled is not None:
+            return self.compiled.predict_proba(self._to_array(X))
+
+        return self.model.predict_proba(self._prepare(X))
+
+    def predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Return prediction probabilities for a raw NumPy matrix.
+
+        Skips pandas and sklearn's feature-name validation, so it is the
+        fast path for serving single rows and small batches.
+
+        Args:
+            X: float64 matrix (n_samples, n_features) in feature_names order
+
+        Returns:
+            Probabilities [prob_rejected, prob_approved]
+        """
+        if self.model is None and self.compiled is None:
             raise ValueError("Model not trained. Run train() first.")
 
-        X_scaled = self.scaler.transform(X)
-        return self.model.predict_proba(X_scaled)
+        n_features = (
+            self.compiled.n_features if self.compiled is not None else self.model.n_features_in_
+        )
+        if X.ndim != 2 or X.shape[1] != n_features:
+            raise ValueError(
+                f"Expected array of shape (n_samples, {n_features}), got {X.shape}"
+            )
+
+        start = time.perf_counter()
+        if self.compiled is None and self.scaler is not None:
+            X = (X - self.scaler.mean_) / self.scaler.scale_
+        scaled = time.perf_counter()
+
+        if self.compiled is not None:
+            probabilities = self.compiled.predict_proba(X)
+        else:
+            probabilities = self.model.predict_proba(X)
+
+        # Scaling and forest evaluation times of single rows, e.g. for serving
+        # metrics (batches would swamp the per-request latency distribution)
+        if self.stage_observer is not None and len(X) == 1:
+            self.stage_observer(scaled - start, time.perf_counter() - scaled)
+        return probabilities
+
+    def score_array(
+        self, X: np.ndarray, threshold: float | None = None, count_policy: bool = True
+    ) -> ScoringResult:
+        """
+        Score a raw NumPy matrix with a single pass through the forest.
+
+        Rows matched by a pre-screen rule of ``policy`` are decided by the
+        rule and never reach the forest; the rest are scored in one call.
+
+        Args:
+            X: float64 matrix (n_samples, n_features) in feature_names order
+            threshold: Approval probability to exceed (defaults to decision_threshold)
+            count_policy: Add the rows to the policy's hit counters (off when
+                the caller already counted them, e.g. /predict)
+
+        Returns:
+            Labels, approval probabilities and risk levels
+        """
+        if threshold is None:
+            threshold = self.decision_threshold
+
+        if not self.policy.rules:
+            probabilities = self._forest_positive(X, threshold)
+            return ScoringResult.from_probabilities(probabilities, threshold, self.policy)
+
+        rule = self.policy.match(X, self.feature_names or [], count=count_policy)
+        to_model = rule < 0
+        decided = ~to_model
+
+        probabilities = np.empty(len(X), dtype=np.float64)
+        labels = np.empty(len(X), dtype=np.int64)
+        probabilities[decided] = self.policy.rule_probabilities[rule[decided]]
+        labels[decided] = self.policy.rule_labels[rule[decided]]
+
+        if to_model.any():
+            scored = self._forest_positive(X if to_model.all() else X[to_model], threshold)
+            probabilities[to_model] = scored
+            labels[to_model] = scored > threshold
+
+        return ScoringResult(
+            labels=labels,
+            probabilities=probabilities,
+            risk_levels=self.policy.risk_levels(probabilities),
+        )
+
+    def _forest_positive(self, X: np.ndarray, threshold: float) -> np.ndarray:
+        """
+        Approval probabilities from the forest.
+
+        With ``early_exit`` on a compiled backend, batches of at least
+        EARLY_EXIT_MIN_ROWS rows stop evaluating trees for each row once its
+        label and risk level can no longer change; the probability returned
+        for such rows is an estimate within the same bands.
+        """
+        if self.early_exit and self.compiled is not None and len(X) >= EARLY_EXIT_MIN_ROWS:
+            boundaries = (threshold, *self.policy.risk_cutoffs)
+            probabilities, _ = self.compiled.predict_positive_early_exit(X, boundaries)
+            return probabilities
+
+        return self.predict_proba_array(X)[:, 1]
+
+    def score(self, X: pd.DataFrame, threshold: float | None = None) -> ScoringResult:
+        """
+        Score customers with a single pass through the forest.
+
+        Args:
+            X: Features for prediction
+            threshold: Approval probability to exceed (defaults to decision_threshold)
+
+        Returns:
+            Labels, approval probabilities and risk levels
+        """
+        return self.score_array(self._to_array(X), threshold)
 
     def save(self, model_path: str, scaler_path: str) -> None:
         """
@@ -108,26 +464,154 @@ class CreditApprovalModel:
             model_path: Path to model file
             scaler_path: Path to scaler file
         """
-        if self.model is None or self.scaler is None:
+        if self.model is None:
             raise ValueError("Model not trained.")
 
         Path(model_path).parent.mkdir(parents=True, exist_ok=True)
 
         joblib.dump(self.model, model_path)
-        joblib.dump(self.scaler, scaler_path)
+        if self.scaler is None:
+            # Scaler folded into the trees: keep only the feature order
+            joblib.dump({"scaler_folded": True, "feature_names": self.feature_names}, scaler_path)
+        else:
+            joblib.dump(self.scaler, scaler_path)
 
         logger.info(f"Model saved at {model_path}")
         logger.info(f"Scaler saved at {scaler_path}")
 
-    def load(self, model_path: str, scaler_path: str) -> None:
+    def save_compiled(self, path: str) -> None:
+        """
+        Save the compiled forest as a single memory-mappable file.
+
+        Args:
+            path: Path to forest file (``*.forest``)
+        """
+        compiled = self.compiled
+        if compiled is None:
+            if self.model is None:
+                raise ValueError("Model not trained.")
+            # Built for the file only: saving must not switch the serving backend
+            compiled = CompiledForest.from_sklearn(
+                self.model, self.scaler, feature_names=self.feature_names
+            )
+        compiled.save(path)
+
+        logger.info(f"Compiled forest saved at {path}")
+
+    def save_artifact(self, path: str, metadata: dict[str, Any] | None = None) -> None:
+        """
+        Save trees, scaler parameters, feature order and metadata as one artifact.
+
+        The artifact holds only NumPy arrays and a JSON manifest (no pickle),
+        is compressed and carries checksums; loading it rebuilds the
+        compiled inference model directly.
+
+        Args:
+            path: Path to artifact file (``*.artifact``)
+            metadata: Extra metadata to record (e.g. evaluation metrics)
+        """
+        if self.model is None:
+            raise ValueError("Model not trained.")
+
+        nodes, max_depth = flatten_forest(self.model)
+        arrays = dict(nodes)
+        if self.scaler is not None:
+            arrays["scaler_mean"] = self.scaler.mean_
+            arrays["scaler_scale"] = self.scaler.scale_
+
+        write_artifact(
+            path,
+            arrays,
+            {
+                "feature_names": self.feature_names,
+                "n_features": int(self.model.n_features_in_),
+                "n_trees": len(self.model.estimators_),
+                "max_depth": max_depth,
+                "decision_threshold": self.decision_threshold,
+                "scaler": "standard" if self.scaler is not None else None,
+                "metadata": {**self.metadata, **(metadata or {})},
+            },
+        )
+
+        logger.info(f"Model artifact saved at {path}")
+
+    def load(
+        self,
+        model_path: str,
+        scaler_path: str | None = None,
+        fold_scaler: bool = False,
+    ) -> None:
         """
-        Load model and scaler from joblib files.
+        Load model and scaler from joblib files, a model artifact or a
+        compiled forest file.
+
+        ``*.artifact`` and ``*.forest`` model paths carry the scaler and
+        feature order themselves (no scaler file needed) and are always
+        served by a compiled backend: artifacts are quantized when the
+        backend is "quantized", ``*.forest`` files are memory-mapped and
+        keep the layout they were saved with.
 
         Args:
             model_path: Path to model file
             scaler_path: Path to scaler file
+            fold_scaler: Fold the scaler into the trees after loading
         """
+        self._threshold_index = None
+
+        if Path(model_path).suffix == FOREST_SUFFIX:
+            self.model = None
+            self.scaler = None
+            self.compiled = CompiledForest.load(model_path, mmap=True)
+            self.feature_names = self.compiled.feature_names
+            self.backend = (
+                "quantized" if isinstance(self.compiled, QuantizedForest) else "compiled"
+            )
+
+            logger.info(f"Compiled forest mapped from {model_path}")
+            return
+
+        if Path(model_path).suffix == ARTIFACT_SUFFIX:
+            manifest, arrays = read_artifact(model_path)
+            self.model = None
+            self.scaler = None
+            self.feature_names = manifest["feature_names"]
+            self.metadata = manifest.get("metadata", {})
+            self.compiled = CompiledForest.from_arrays(
+                arrays,
+                n_features=manifest["n_features"],
+                max_depth=manifest["max_depth"],
+                scaler_mean=arrays.get("scaler_mean"),
+                scaler_scale=arrays.get("scaler_scale"),
+                feature_names=self.feature_names,
+            )
+            if self.backend == "quantized":
+                self.compiled = self.compiled.quantize()
+            else:
+                self.backend = "compiled"
+
+            logger.info(f"Model artifact loaded from {model_path}")
+            return
+
+        if scaler_path is None:
+            raise ValueError("scaler_path is required for joblib model files.")
+
         self.model = joblib.load(model_path)
-        self.scaler = joblib.load(scaler_path)
+        self._set_serving_n_jobs()
+        scaler = joblib.load(scaler_path)
+
+        if isinstance(scaler, dict) and scaler.get("scaler_folded"):
+            self.scaler = None
+            self.feature_names = scaler.get("feature_names")
+        else:
+            self.scaler = scaler
+            # Feature order is recorded by the scaler when fitted on a DataFrame
+            feature_names = getattr(self.scaler, "feature_names_in_", None)
+            self.feature_names = list(feature_names) if feature_names is not None else None
+
+        self.compiled = None
+        if fold_scaler:
+            self.fold_scaler()
+        if self.backend in COMPILED_BACKENDS:
+            self.compile()
 
         logger.info(f"Model loaded from {model_path}")
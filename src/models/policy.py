@@ -0,0 +1,225 @@
+"""
+Declarative pre-screen policy and risk levels.
+
+Rules decide obvious approvals and rejections before the model runs. Each
+rule is a list of conditions on the applicant's features (all must hold),
+evaluated for a whole batch as NumPy masks; the first matching rule
+decides a row, and only unmatched rows are scored by the forest.
+
+Example policy file (JSON)::
+
+    {
+      "rules": [
+        {
+          "name": "loan_to_income_limit",
+          "decision": "reject",
+          "conditions": [{"feature": "loan_amount", "per": "income", "op": ">=", "value": 5}]
+        }
+      ],
+      "risk_levels": [
+        {"min_probability": 0.8, "level": "low"},
+        {"min_probability": 0.5, "level": "medium"}
+      ],
+      "default_risk_level": "high"
+    }
+"""
+import json
+import operator
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel, Field, model_validator
+
+# Risk levels as (minimum approval probability, level), highest first
+RISK_LEVEL_THRESHOLDS: tuple[tuple[float, str], ...] = ((0.8, "low"), (0.5, "medium"))
+DEFAULT_RISK_LEVEL: str = "high"
+
+# Label given to rows scored by the model in hit counters
+MODEL_DECISION: str = "model"
+
+OPERATORS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def risk_levels(
+    probabilities: np.ndarray,
+    thresholds: tuple[tuple[float, str], ...] = RISK_LEVEL_THRESHOLDS,
+    default: str = DEFAULT_RISK_LEVEL,
+) -> np.ndarray:
+    """
+    Map approval probabilities to risk levels.
+
+    Args:
+        probabilities: Approval probabilities
+        thresholds: (minimum probability, level) pairs, highest first
+        default: Level below every minimum
+
+    Returns:
+        Risk level per probability
+    """
+    return np.select(
+        [probabilities >= minimum for minimum, _ in thresholds],
+        [level for _, level in thresholds],
+        default=default,
+    )
+
+
+class Condition(BaseModel):
+    """``feature op value``, or ``feature / per op value`` for ratios."""
+
+    feature: str
+    op: Literal["<", "<=", ">", ">="]
+    value: float
+    per: str | None = Field(default=None, description="Divide feature by this feature")
+
+
+class Rule(BaseModel):
+    """Decision taken when every condition holds."""
+
+    name: str
+    decision: Literal["approve", "reject"]
+    conditions: list[Condition] = Field(..., min_length=1)
+    probability: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Approval probability reported (default: 1 approve, 0 reject)",
+    )
+
+    @property
+    def reported_probability(self) -> float:
+        if self.probability is not None:
+            return self.probability
+        return 1.0 if self.decision == "approve" else 0.0
+
+
+class RiskLevel(BaseModel):
+    """Level given to probabilities at or above min_probability."""
+
+    min_probability: float = Field(..., ge=0.0, le=1.0)
+    level: str
+
+
+class PolicyConfig(BaseModel):
+    """Pre-screen rules and risk levels."""
+
+    rules: list[Rule] = Field(default_factory=list)
+    risk_levels: list[RiskLevel] = Field(
+        default_factory=lambda: [
+            RiskLevel(min_probability=minimum, level=level)
+            for minimum, level in RISK_LEVEL_THRESHOLDS
+        ]
+    )
+    default_risk_level: str = DEFAULT_RISK_LEVEL
+
+    @model_validator(mode="after")
+    def check_order(self) -> "PolicyConfig":
+        minimums = [level.min_probability for level in self.risk_levels]
+        if minimums != sorted(minimums, reverse=True):
+            raise ValueError("risk_levels must be ordered by min_probability, highest first")
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names must be unique")
+        return self
+
+
+class PolicyEngine:
+    """
+    Evaluates pre-screen rules on feature matrices and maps risk levels.
+
+    Counts how many rows each rule decided and how many went to the model.
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, config: PolicyConfig | None = None) -> None:
+        self.config = config or PolicyConfig()
+        self.rules = self.config.rules
+        self.risk_thresholds: tuple[tuple[float, str], ...] = tuple(
+            (level.min_probability, level.level) for level in self.config.risk_levels
+        )
+        self.default_risk_level = self.config.default_risk_level
+
+        self.rule_probabilities = np.array(
+            [rule.reported_probability for rule in self.rules], dtype=np.float64
+        )
+        self.rule_labels = np.array(
+            [rule.decision == "approve" for rule in self.rules], dtype=np.int64
+        )
+        # Hit counters are only updated while set (off during warm-up and canaries)
+        self.counting = True
+        self._hits = np.zeros(len(self.rules) + 1, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: str) -> "PolicyEngine":
+        """
+        Load a policy from a JSON file.
+
+        Raises:
+            ValueError: If the file is not a valid policy
+        """
+        return cls(PolicyConfig.model_validate(json.loads(Path(path).read_text())))
+
+    @property
+    def risk_cutoffs(self) -> tuple[float, ...]:
+        """Probabilities at which the risk level changes."""
+        return tuple(minimum for minimum, _ in self.risk_thresholds)
+
+    def risk_levels(self, probabilities: np.ndarray) -> np.ndarray:
+        """Map approval probabilities to this policy's risk levels."""
+        return risk_levels(probabilities, self.risk_thresholds, self.default_risk_level)
+
+    def match(self, X: np.ndarray, feature_names: list[str], count: bool = True) -> np.ndarray:
+        """
+        Find the first matching rule of every row.
+
+        Args:
+            X: Raw features (n_samples, n_features)
+            feature_names: Column order of X
+            count: Add the rows to the hit counters (off for lookups only)
+
+        Returns:
+            Index of the deciding rule per row (-1: scored by the model)
+
+        Raises:
+            ValueError: If a rule refers to an unknown feature
+        """
+        decided = np.full(len(X), -1, dtype=np.int64)
+        for i, rule in reversed(list(enumerate(self.rules))):
+            mask = np.ones(len(X), dtype=bool)
+            for condition in rule.conditions:
+                mask &= OPERATORS[condition.op](
+                    self._column(X, feature_names, condition), condition.value
+                )
+            # Evaluated last to first, so earlier rules take precedence
+            decided[mask] = i
+
+        if count and self.counting:
+            counts = np.bincount(decided + 1, minlength=len(self.rules) + 1)
+            with self._lock:
+                self._hits += counts
+        return decided
+
+    @staticmethod
+    def _column(X: np.ndarray, feature_names: list[str], condition: Condition) -> np.ndarray:
+        try:
+            values = X[:, feature_names.index(condition.feature)]
+            if condition.per is not None:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    values = values / X[:, feature_names.index(condition.per)]
+        except ValueError as e:
+            raise ValueError(f"Policy condition refers to an unknown feature: {e}") from e
+        return values
+
+    def stats(self) -> dict[str, int]:
+        """Rows decided per rule, and rows scored by the model."""
+        with self._lock:
+            hits = self._hits.tolist()
+        return {MODEL_DECISION: hits[0], **{rule.name: n for rule, n in zip(self.rules, hits[1:])}}
@@ -2,6 +2,8 @@
 Application configuration module.
 """
 from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import SettingsConfigDict
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -19,6 +21,26 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
     log_level: str = "INFO"
+    log_async: bool = Field(
+        default=True,
+        description="Write logs from a background thread in batches",
+    )
+    log_queue_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Records buffered for the log writer (extra records are dropped)",
+    )
+    log_batch_size: int = Field(
+        default=256,
+        ge=1,
+        description="Records written per flush by the log writer",
+    )
+    log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of per-request INFO logs kept (warnings and errors always)",
+    )
 
     # API
     api_host: str = "0.0.0.0"
@@ -32,9 +54,197 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins",
     )
 
+    # Admin endpoints (disabled unless explicitly enabled)
+    admin_enabled: bool = Field(
+        default=False,
+        description="Expose /api/v1/admin endpoints",
+    )
+    admin_token: str = Field(
+        default="",
+        description="Shared secret required in the X-Admin-Token header (empty: none)",
+    )
+
     # Model
-    model_path: str = "models_trained/credit_model.pkl"
-    scaler_path: str = "models_trained/scaler.pkl"
+    model_path: str = Field(
+        default="models_trained/credit_model.artifact",
+        description="Model artifact (*.artifact), compiled forest (*.forest) or joblib pickle",
+    )
+    scaler_path: str = Field(
+        default="models_trained/scaler.pkl",
+        description="StandardScaler pickle (only used with a joblib model pickle)",
+    )
+    decision_threshold: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Approval probability a customer must exceed to be approved",
+    )
+    inference_backend: Literal["sklearn", "compiled", "quantized"] = Field(
+        default="sklearn",
+        description=(
+            "Forest evaluator: sklearn estimator, flat compiled arrays, or compiled "
+            "arrays quantized to float32 thresholds and small integer indices"
+        ),
+    )
+    fold_scaler: bool = Field(
+        default=False,
+        description="Fold the StandardScaler into the tree thresholds at load time",
+    )
+    policy_path: str = Field(
+        default="",
+        description="JSON pre-screen rules and risk levels (empty: no rules, default levels)",
+    )
+    early_exit_enabled: bool = Field(
+        default=False,
+        description=(
+            "Compiled backends: stop walking trees once a row's decision and risk level "
+            "can no longer change (probabilities of such rows become estimates)"
+        ),
+    )
+    eager_model_loading: bool = Field(
+        default=True,
+        description="Load and warm up the model at startup instead of on first request",
+    )
+    model_warmup_iterations: int = Field(
+        default=3,
+        ge=0,
+        description="Dummy scoring rounds run after loading the model",
+    )
+    model_warmup_rows: int = Field(
+        default=32,
+        ge=1,
+        description="Rows in the dummy batch scored during warm-up",
+    )
+    model_watch_interval_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Poll a .artifact/.forest MODEL_PATH and hot-reload on change (0 disables)"
+        ),
+    )
+
+    # Request handling
+    fast_json_enabled: bool = Field(
+        default=True,
+        description="Decode and encode /predict without Pydantic models when input is valid",
+    )
+
+    # Monitoring
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Expose Prometheus metrics at /metrics",
+    )
+
+    timing_header_enabled: bool = Field(
+        default=False,
+        description="Add a Server-Timing header with per-stage /predict durations",
+    )
+    profiling_enabled: bool = Field(
+        default=False,
+        description="Expose the sampling profiler at /api/v1/admin/profile",
+    )
+    profiling_max_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Longest profile a single request may run",
+    )
+
+    # Prediction cache
+    prediction_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum cached predictions (0 disables the cache)",
+    )
+    prediction_cache_ttl_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Cached prediction lifetime (0: until evicted or model reload)",
+    )
+    interval_cache_enabled: bool = Field(
+        default=True,
+        description=(
+            "Key cached predictions on the forest cell (split-threshold interval of "
+            "each feature) instead of the raw payload"
+        ),
+    )
+    request_coalescing_enabled: bool = Field(
+        default=True,
+        description=(
+            "Let concurrent identical /predict requests (same cache key, or same "
+            "Idempotency-Key and payload) share one in-flight computation"
+        ),
+    )
+
+    # Inference executor
+    inference_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Threads running CPU-bound model scoring off the event loop",
+    )
+    inference_queue_size: int = Field(
+        default=64,
+        ge=0,
+        description="Scoring calls allowed to wait for a free worker",
+    )
+    inference_overflow: Literal["reject", "wait"] = Field(
+        default="reject",
+        description="When the queue is full: reject with 503, or wait for a slot",
+    )
+    inference_queue_timeout_ms: float = Field(
+        default=100.0,
+        gt=0,
+        description="Maximum wait for a slot when inference_overflow is 'wait'",
+    )
+
+    # Serving-time parallelism (per worker process)
+    model_n_jobs: int = Field(
+        default=1,
+        description=(
+            "n_jobs of the sklearn forest when serving (training uses every core); "
+            "1 scores in the calling thread, -1 uses every core"
+        ),
+    )
+    native_threads: int = Field(
+        default=1,
+        ge=0,
+        description="Thread limit for BLAS/OpenMP pools in each worker (0: library default)",
+    )
+    cpu_affinity: str = Field(
+        default="",
+        description="CPUs the worker may run on, e.g. '0-3,6' (empty: no pinning)",
+    )
+    cpu_affinity_per_worker: bool = Field(
+        default=False,
+        description="Pin each worker process to its own CPU from cpu_affinity",
+    )
+
+    # NDJSON streaming
+    stream_chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Records scored per model call in /predict/stream",
+    )
+    stream_max_line_bytes: int = Field(
+        default=65_536,
+        ge=1,
+        description="Longest accepted NDJSON input line",
+    )
+
+    # Micro-batching
+    micro_batching_enabled: bool = Field(
+        default=False,
+        description="Batch concurrent /predict requests into one model call",
+    )
+    micro_batch_window_ms: float = Field(
+        default=2.0,
+        gt=0,
+        description="Maximum time a request waits for others to join its batch",
+    )
+    micro_batch_max_size: int = Field(
+        default=64,
+        ge=1,
+        description="Rows that trigger an immediate batch flush",
+    )
 
     @property
     def is_production(self) -> bool:
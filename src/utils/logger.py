@@ -1,20 +1,191 @@
 """
 Structured logging module.
 """
+import atexit
 import json
 import logging
+import queue
+import random
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from collections.abc import Sequence
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from src.utils.config import get_settings
 
 _initialized: bool = False
+_listener: QueueListener | None = None
+_queue_handler: "LazyQueueHandler | None" = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log_data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of per-request records.
+
+    Records logged with ``extra={"sampled": True}`` below WARNING are kept
+    with probability ``rate``; everything else always passes.
+    """
+
+    def __init__(self, rate: float = 1.0) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False) or record.levelno >= logging.WARNING:
+            return True
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats every record in the calling thread so it
+    can be pickled; records here never leave the process, so the message,
+    arguments and exception info are passed through untouched.
+
+    When the queue is full, records below WARNING are dropped (and counted)
+    rather than blocking the caller; warnings and errors are written
+    directly to the ``fallback`` handlers instead.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue, fallback: Sequence[logging.Handler] = ()
+    ) -> None:
+        super().__init__(log_queue)
+        self.fallback = tuple(fallback)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.WARNING and self.fallback:
+            for handler in self.fallback:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+                    if isinstance(handler, BatchFlushMixin):
+                        handler.flush_batch()
+            return
+
+        with self._dropped_lock:
+            self.dropped += 1
+
+
+class BatchFlushMixin:
+    """Defer stream flushes until the listener has written a whole batch."""
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        try:
+            super().flush()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. stdout at interpreter exit)
+            pass
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()
+
+
+class BatchStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler flushed once per batch."""
+
+
+class BatchRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    """RotatingFileHandler flushed once per batch."""
+
+
+class BatchQueueListener(QueueListener):
+    """
+    QueueListener that drains up to ``batch_size`` records per wake-up.
+
+    Every record of a batch is handled, then each handler is flushed once,
+    so a burst of records costs one write per handler instead of one each.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room so the stop request is never lost on a full queue
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+                self.queue.task_done()
+
+            for handler in self.handlers:
+                if isinstance(handler, BatchFlushMixin):
+                    handler.flush_batch()
+                else:
+                    handler.flush()
+
+            if stop:
+                break
+
+
+def _stop_listener() -> None:
+    """Write out queued records (runs at interpreter exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging() -> None:
-    """Configure structured logging with JSON format."""
-    global _initialized
+    """
+    Configure structured logging with JSON format.
+
+    With ``log_async`` enabled the root logger only enqueues records; a
+    background listener formats them and writes them to the file and stdout
+    in batches, keeping disk and console I/O off the event loop.
+    """
+    global _initialized, _listener, _queue_handler
     if _initialized:
         return
 
@@ -27,29 +198,42 @@ def setup_logging() -> None:
     logger = logging.getLogger()
     logger.setLevel(settings.log_level)
 
-    class JsonFormatter(logging.Formatter):
-        def format(self, record: logging.LogRecord) -> str:
-            log_data = {
-                "timestamp": self.formatTime(record),
-                "level": record.levelname,
-                "message": record.getMessage(),
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno,
-            }
-            if record.exc_info:
-                log_data["exception"] = self.formatException(record.exc_info)
-            return json.dumps(log_data, ensure_ascii=False)
-
-    file_handler = RotatingFileHandler(
-        log_dir / "app.log", maxBytes=10_000_000, backupCount=5
-    )
-    file_handler.setFormatter(JsonFormatter())
-    logger.addHandler(file_handler)
+    if settings.log_async:
+        file_handler = BatchRotatingFileHandler(
+            log_dir / "app.log", maxBytes=10_000_000, backupCount=5
+        )
+        console_handler = BatchStreamHandler(sys.stdout)
+    else:
+        file_handler = RotatingFileHandler(
+            log_dir / "app.log", maxBytes=10_000_000, backupCount=5
+        )
+        console_handler = logging.StreamHandler(sys.stdout)
 
-    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(JsonFormatter())
     console_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-    logger.addHandler(console_handler)
+
+    sampling = SamplingFilter(settings.log_sample_rate)
+
+    if settings.log_async:
+        log_queue: queue.Queue = queue.Queue(settings.log_queue_size)
+        _queue_handler = LazyQueueHandler(log_queue, fallback=(file_handler, console_handler))
+        _queue_handler.addFilter(sampling)
+        logger.addHandler(_queue_handler)
+
+        _listener = BatchQueueListener(
+            log_queue, file_handler, console_handler, batch_size=settings.log_batch_size
+        )
+        _listener.start()
+        atexit.register(_stop_listener)
+    else:
+        for handler in (file_handler, console_handler):
+            handler.addFilter(sampling)
+            logger.addHandler(handler)
+
+
+def dropped_log_records() -> int:
+    """Records dropped because the log queue was full (0 when logging synchronously)."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,116 @@
+"""
+Serving-time thread and CPU limits for worker processes.
+
+Scoring is parallelised by running several worker processes (and the
+inference executor's threads), so native thread pools inside a worker only
+oversubscribe the CPUs. These helpers cap BLAS/OpenMP pools and optionally
+pin a worker to its CPUs; they are applied once per process at startup.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from threadpoolctl import threadpool_limits
+
+from src.utils.config import Settings
+from src.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# Read by OpenMP/BLAS runtimes loaded after startup
+THREAD_ENV_VARS: tuple[str, ...] = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+)
+
+# Lock files through which worker processes claim a CPU each
+CPU_LOCK_DIR: Path = Path(tempfile.gettempdir()) / "credit-api-cpus"
+
+# Held open for the life of the process; the OS releases the lock on exit
+_cpu_claim: int | None = None
+
+
+def parse_cpu_list(spec: str) -> list[int]:
+    """
+    Parse a CPU list such as ``"0-3,6"``.
+
+    Raises:
+        ValueError: If the list is malformed
+    """
+    cpus: set[int] = set()
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            first, _, last = part.partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+        except ValueError as e:
+            raise ValueError(f"Invalid CPU list '{spec}'") from e
+    return sorted(cpus)
+
+
+def limit_native_threads(threads: int) -> None:
+    """Cap the BLAS/OpenMP thread pools loaded now and later in this process."""
+    for name in THREAD_ENV_VARS:
+        os.environ.setdefault(name, str(threads))
+    threadpool_limits(limits=threads)
+
+
+def claim_cpu(cpus: list[int], lock_dir: Path = CPU_LOCK_DIR) -> int | None:
+    """
+    Claim the first CPU in ``cpus`` no other worker process holds.
+
+    Returns:
+        The claimed CPU, or None if all are taken (or locking is unsupported)
+    """
+    global _cpu_claim
+
+    if fcntl is None:
+        return None
+
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    for cpu in cpus:
+        fd = os.open(lock_dir / f"cpu-{cpu}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            continue
+        if _cpu_claim is not None:
+            os.close(_cpu_claim)
+        _cpu_claim = fd
+        return cpu
+    return None
+
+
+def configure_worker_parallelism(settings: Settings) -> None:
+    """
+    Apply the native thread limit and CPU affinity of this worker process.
+
+    With ``cpu_affinity_per_worker`` each process claims its own CPU from
+    ``cpu_affinity``; when every CPU is claimed it runs on the whole list.
+    """
+    if settings.native_threads > 0:
+        limit_native_threads(settings.native_threads)
+
+    if not settings.cpu_affinity:
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU affinity is not supported on this platform, ignoring")
+        return
+
+    cpus = parse_cpu_list(settings.cpu_affinity)
+    if settings.cpu_affinity_per_worker:
+        cpu = claim_cpu(cpus)
+        if cpu is None:
+            logger.warning(f"No free CPU in {settings.cpu_affinity}, using all of them")
+        else:
+            cpus = [cpu]
+
+    os.sched_setaffinity(0, cpus)
+    logger.info(f"Worker pinned to CPUs {cpus}")
@@ -7,6 +7,9 @@ import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
+from src.models.credit_model import CreditApprovalModel
+from src.models.policy import PolicyEngine
+
 
 @pytest.fixture
 def mock_model():
@@ -14,18 +17,37 @@ def mock_model():
     model = MagicMock()
     model.predict.return_value = np.array([1])
     model.predict_proba.return_value = np.array([[0.15, 0.85]])
+    model.predict_proba_array.side_effect = lambda X: model.predict_proba(X)
+    model.decision_threshold = 0.5
+    model.feature_names = None
+    model.version = 1
+    model.early_exit = False
+    model.policy = PolicyEngine()
+    # Interval cache keys fall back to the raw values
+    model.threshold_index.cell.side_effect = tuple
+    # Real scoring logic on top of the mocked probabilities
+    model.score_array.side_effect = lambda X, threshold=None, count_policy=True: (
+        CreditApprovalModel.score_array(model, X, threshold, count_policy)
+    )
+    model._forest_positive.side_effect = lambda X, threshold: CreditApprovalModel._forest_positive(
+        model, X, threshold
+    )
     return model
 
 
 @pytest.fixture
 def client(mock_model) -> TestClient:
     """API test client with mocked model."""
-    with patch("src.api.dependencies._model_instance", mock_model):
-        with patch("src.api.dependencies.get_model", return_value=mock_model):
-            from src.api.main import create_app
+    from src.api.dependencies import get_model
+    from src.api.main import create_app
 
-            app = create_app()
-            return TestClient(app)
+    with (
+        patch("src.api.dependencies._model_instance", mock_model),
+        patch("src.api.dependencies._cache_instance", None),
+    ):
+        app = create_app()
+        app.dependency_overrides[get_model] = lambda: mock_model
+        yield TestClient(app)
 
 
 def test_health_check(client: TestClient) -> None:
@@ -37,6 +59,150 @@ def test_health_check(client: TestClient) -> None:
     assert "version" in data
 
 
+def test_readiness_ready(client: TestClient) -> None:
+    """Test readiness reports ready once a model is loaded."""
+    response = client.get("/api/v1/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_readiness_not_ready(client: TestClient) -> None:
+    """Test readiness returns 503 while no model is loaded."""
+    with patch("src.api.dependencies._model_instance", None):
+        response = client.get("/api/v1/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+
+def test_lifespan_loads_and_warms_model(tmp_path) -> None:
+    """Test the model is loaded and warmed up at startup."""
+    from src.api.main import create_app
+    from src.utils.config import get_settings
+    from tests.test_model import generate_sample
+
+    trained = CreditApprovalModel()
+    trained.train(*generate_sample(100))
+    trained.save(str(tmp_path / "model.pkl"), str(tmp_path / "scaler.pkl"))
+
+    settings = get_settings()
+    with (
+        patch.object(settings, "model_path", str(tmp_path / "model.pkl")),
+        patch.object(settings, "scaler_path", str(tmp_path / "scaler.pkl")),
+        patch("src.api.dependencies._model_instance", None),
+        patch("src.api.dependencies._model_stats", {}),
+    ):
+        with TestClient(create_app()) as client:
+            response = client.get("/api/v1/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ready"] is True
+    assert data["model_load_seconds"] > 0
+    assert data["warmup_seconds"] > 0
+
+
+@pytest.fixture
+def model_artifacts(tmp_path):
+    """Trained model saved to disk, with settings pointing at it."""
+    from src.utils.config import get_settings
+    from tests.test_model import generate_sample
+
+    trained = CreditApprovalModel()
+    trained.train(*generate_sample(100))
+    trained.save(str(tmp_path / "model.pkl"), str(tmp_path / "scaler.pkl"))
+
+    settings = get_settings()
+    with (
+        patch.object(settings, "model_path", str(tmp_path / "model.pkl")),
+        patch.object(settings, "scaler_path", str(tmp_path / "scaler.pkl")),
+        patch.object(settings, "admin_enabled", True),
+        patch("src.api.dependencies._model_stats", {}),
+        patch("src.api.dependencies._model_version", 1),
+    ):
+        yield tmp_path
+
+
+def test_reload_disabled_by_default(client: TestClient) -> None:
+    """Test admin endpoints are hidden unless enabled."""
+    response = client.post("/api/v1/admin/reload")
+    assert response.status_code == 404
+
+
+def test_reload_swaps_model(client: TestClient, mock_model: MagicMock, model_artifacts) -> None:
+    """Test reload installs a new model and bumps the version."""
+    from src.api import dependencies
+
+    response = client.post("/api/v1/admin/reload")
+
+    assert response.status_code == 200
+    assert response.json()["model_version"] == 2
+    assert isinstance(dependencies._model_instance, CreditApprovalModel)
+    assert dependencies._model_instance is not mock_model
+
+
+def test_reload_failure_keeps_model(
+    client: TestClient, mock_model: MagicMock, model_artifacts
+) -> None:
+    """Test a model failing validation is not swapped in."""
+    from src.api import dependencies
+
+    with patch.object(CreditApprovalModel, "score_array", side_effect=ValueError("broken")):
+        with pytest.raises(dependencies.ModelReloadError, match="canary"):
+            dependencies.reload_model()
+    assert dependencies._model_instance is mock_model
+
+    (model_artifacts / "model.pkl").unlink()
+    response = client.post("/api/v1/admin/reload")
+
+    assert response.status_code == 409
+    assert dependencies._model_instance is mock_model
+    assert dependencies.model_version() == 1
+
+
+def test_reload_requires_token(client: TestClient, model_artifacts) -> None:
+    """Test the admin token is enforced when configured."""
+    from src.utils.config import get_settings
+
+    with patch.object(get_settings(), "admin_token", "secret"):
+        assert client.post("/api/v1/admin/reload").status_code == 403
+        response = client.post("/api/v1/admin/reload", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+
+
+def test_watcher_ignores_joblib_pairs(model_artifacts) -> None:
+    """Test only atomically written artifacts are watched for hot-reload."""
+    import asyncio
+    import os
+
+    from src.api import dependencies
+    from src.utils.config import get_settings
+
+    # A joblib pair could be read between its two writes: not watched
+    with patch.object(dependencies, "reload_model") as reload_model:
+        asyncio.run(asyncio.wait_for(dependencies.watch_model_file(0.01), timeout=1))
+    reload_model.assert_not_called()
+
+    artifact = model_artifacts / "model.artifact"
+    model = CreditApprovalModel()
+    model.load(str(model_artifacts / "model.pkl"), str(model_artifacts / "scaler.pkl"))
+    model.save_artifact(str(artifact))
+
+    async def watch_until_reload() -> None:
+        task = asyncio.create_task(dependencies.watch_model_file(0.01))
+        await asyncio.sleep(0.05)
+        os.utime(artifact, (artifact.stat().st_atime, artifact.stat().st_mtime + 10))
+        while not reload_model.called:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    with (
+        patch.object(get_settings(), "model_path", str(artifact)),
+        patch.object(dependencies, "reload_model") as reload_model,
+    ):
+        asyncio.run(asyncio.wait_for(watch_until_reload(), timeout=5))
+    reload_model.assert_called_once()
+
+
 def test_predict_success(client: TestClient) -> None:
     """Test prediction with valid data."""
     payload = {
@@ -58,22 +224,303 @@ def test_predict_success(client: TestClient) -> None:
     assert data["risk_level"] == "low"
 
 
-def test_predict_high_risk(client: TestClient) -> None:
+def test_predict_single_forest_pass(client: TestClient, mock_model: MagicMock) -> None:
+    """Test prediction evaluates the forest once per request."""
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
+    assert response.status_code == 200
+    mock_model.predict_proba.assert_called_once()
+    mock_model.predict.assert_not_called()
+
+
+def test_predict_feature_order(client: TestClient, mock_model: MagicMock) -> None:
+    """Test the feature row follows the model's stored feature order."""
+    mock_model.feature_names = [
+        "income", "age", "credit_score", "loan_amount", "employment_years", "existing_debts",
+    ]
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
+    assert response.status_code == 200
+    X = mock_model.predict_proba.call_args.args[0]
+    assert X.dtype == np.float64
+    assert X.tolist() == [[50000, 35, 750, 20000, 8, 5000]]
+
+
+def test_predict_micro_batching(client: TestClient, mock_model: MagicMock) -> None:
+    """Test prediction through the micro-batcher."""
+    from src.utils.config import get_settings
+
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    with patch.object(get_settings(), "micro_batching_enabled", True):
+        response = client.post("/api/v1/predict", json=payload)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "approved": True,
+        "approval_probability": 0.85,
+        "risk_level": "low",
+    }
+    mock_model.score_array.assert_called_once()
+
+
+def test_predict_overloaded(client: TestClient) -> None:
+    """Test a full inference queue returns 503."""
+    from src.api.executor import ExecutorSaturatedError
+
+    executor = MagicMock()
+    executor.run.side_effect = ExecutorSaturatedError("full")
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    with patch("src.api.routes.get_executor", return_value=executor):
+        response = client.post("/api/v1/predict", json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_predict_cache_hit(client: TestClient, mock_model: MagicMock) -> None:
+    """Test repeated payloads are served from the prediction cache."""
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    first = client.post("/api/v1/predict", json=payload)
+    second = client.post("/api/v1/predict", json={**payload, "age": 35.0})
+
+    assert first.json() == second.json()
+    mock_model.predict_proba.assert_called_once()
+
+
+def test_predict_cache_shared_within_forest_cell(
+    client: TestClient, mock_model: MagicMock
+) -> None:
+    """Test applicants in the same forest cell share one cached prediction."""
+    mock_model.threshold_index.cell.side_effect = lambda row: (0,) * len(row)
+    payload = {
+        "age": 35,
+        "income": 52000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    first = client.post("/api/v1/predict", json=payload)
+    second = client.post("/api/v1/predict", json={**payload, "income": 52400})
+
+    assert first.json() == second.json()
+    mock_model.predict_proba.assert_called_once()
+
+    from src.utils.config import get_settings
+
+    with patch.object(get_settings(), "interval_cache_enabled", False):
+        client.post("/api/v1/predict", json={**payload, "income": 52800})
+    assert mock_model.predict_proba.call_count == 2
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_predict_cache_respects_policy_rules(fast_json: bool) -> None:
+    """Test rule-decided and model-scored applicants never share a cached result."""
+    from src.api.dependencies import get_model
+    from src.api.main import create_app
+    from src.models.policy import PolicyEngine
+    from src.utils.config import get_settings
+    from tests.test_model import generate_sample
+
+    model = CreditApprovalModel(backend="compiled")
+    model.train(*generate_sample(300))
+    model.policy = PolicyEngine.from_file("config/policy.json")
+    model.version = 1
+
+    applicant = {
+        "age": 35,
+        "income": 20000,
+        "credit_score": 650,
+        "loan_amount": 99999,
+        "employment_years": 8,
+        "existing_debts": 0,
+    }
+    # loan/income crosses the loan_to_income_limit rule within one forest cell
+    over_limit = {**applicant, "loan_amount": 100001}
+    rows = [[float(a[name]) for name in model.feature_names] for a in (applicant, over_limit)]
+    assert model.threshold_index.cell(rows[0]) == model.threshold_index.cell(rows[1])
+
+    def predict(payloads: list[dict]) -> list[dict]:
+        with (
+            patch("src.api.dependencies._model_instance", model),
+            patch("src.api.dependencies._cache_instance", None),
+            patch.object(get_settings(), "interval_cache_enabled", True),
+            patch.object(get_settings(), "fast_json_enabled", fast_json),
+        ):
+            app = create_app()
+            app.dependency_overrides[get_model] = lambda: model
+            client = TestClient(app)
+            return [client.post("/api/v1/predict", json=p).json() for p in payloads]
+
+    expected_model = predict([applicant])[0]
+    assert expected_model["approval_probability"] > 0
+
+    rejected = {"approved": False, "approval_probability": 0.0, "risk_level": "high"}
+    assert predict([applicant, over_limit]) == [expected_model, rejected]
+    assert predict([over_limit, applicant]) == [rejected, expected_model]
+
+
+def test_predict_counts_policy_rule_per_request() -> None:
+    """Test cached and freshly scored requests are each counted once, warm-up never."""
+    from src.api.dependencies import get_model, validate_model, warm_up_model
+    from src.api.main import create_app
+    from src.models.policy import MODEL_DECISION, PolicyEngine
+    from tests.test_model import generate_sample
+
+    model = CreditApprovalModel(backend="compiled")
+    model.train(*generate_sample(300))
+    model.policy = PolicyEngine.from_file("config/policy.json")
+    model.version = 1
+    warm_up_model(model)
+    validate_model(model)
+    assert set(model.policy.stats().values()) == {0}
+
+    applicant = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 650,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 0,
+    }
+    with (
+        patch("src.api.dependencies._model_instance", model),
+        patch("src.api.dependencies._cache_instance", None),
+    ):
+        app = create_app()
+        app.dependency_overrides[get_model] = lambda: model
+        client = TestClient(app)
+        for payload in (applicant, applicant, {**applicant, "age": 19}, {**applicant, "age": 19}):
+            assert client.post("/api/v1/predict", json=payload).status_code == 200
+
+    stats = model.policy.stats()
+    assert stats[MODEL_DECISION] == 2
+    assert stats["minimum_age"] == 2
+
+
+def test_predict_cache_keyed_on_model_version(
+    client: TestClient, mock_model: MagicMock
+) -> None:
+    """Test a new model version does not reuse cached predictions."""
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    client.post("/api/v1/predict", json=payload)
+    mock_model.version = 2
+    client.post("/api/v1/predict", json=payload)
+
+    assert mock_model.predict_proba.call_count == 2
+
+
+@pytest.mark.parametrize("idempotency_key", [None, "retry-123"])
+def test_predict_coalesces_concurrent_duplicates(
+    mock_model: MagicMock, idempotency_key: str | None
+) -> None:
+    """Test concurrent identical requests reach the model once, even uncached."""
+    import asyncio
+    import time
+
+    import httpx
+
+    from src.api.dependencies import get_model
+    from src.api.main import create_app
+    from src.utils.config import get_settings
+
+    def slow_predict_proba(X):
+        time.sleep(0.1)
+        return np.array([[0.15, 0.85]])
+
+    mock_model.predict_proba.side_effect = slow_predict_proba
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+
+    async def run() -> list[httpx.Response]:
+        app = create_app()
+        app.dependency_overrides[get_model] = lambda: mock_model
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.post("/api/v1/predict", json=payload, headers=headers) for _ in range(8))
+            )
+
+    with (
+        patch("src.api.dependencies._model_instance", mock_model),
+        patch("src.api.dependencies._single_flight_instance", None),
+        patch.object(get_settings(), "prediction_cache_size", 0),
+    ):
+        responses = asyncio.run(run())
+
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.content for response in responses}) == 1
+    mock_model.predict_proba.assert_called_once()
+
+    with patch.object(get_settings(), "request_coalescing_enabled", False):
+        from src.api.dependencies import get_single_flight
+
+        assert get_single_flight() is None
+
+
+def test_predict_high_risk(client: TestClient, mock_model: MagicMock) -> None:
     """Test prediction with high-risk profile."""
-    with patch("src.api.dependencies._model_instance") as mock:
-        mock.predict.return_value = np.array([0])
-        mock.predict_proba.return_value = np.array([[0.83, 0.17]])
-
-        with patch("src.api.dependencies.get_model", return_value=mock):
-            payload = {
-                "age": 25,
-                "income": 25000,
-                "credit_score": 550,
-                "loan_amount": 30000,
-                "employment_years": 1,
-                "existing_debts": 15000,
-            }
-            response = client.post("/api/v1/predict", json=payload)
+    mock_model.predict.return_value = np.array([0])
+    mock_model.predict_proba.return_value = np.array([[0.83, 0.17]])
+
+    payload = {
+        "age": 25,
+        "income": 25000,
+        "credit_score": 550,
+        "loan_amount": 30000,
+        "employment_years": 1,
+        "existing_debts": 15000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
 
     assert response.status_code == 200
     data = response.json()
@@ -81,22 +528,20 @@ def test_predict_high_risk(client: TestClient) -> None:
     assert data["risk_level"] == "high"
 
 
-def test_predict_medium_risk(client: TestClient) -> None:
+def test_predict_medium_risk(client: TestClient, mock_model: MagicMock) -> None:
     """Test prediction with medium-risk profile."""
-    with patch("src.api.dependencies._model_instance") as mock:
-        mock.predict.return_value = np.array([1])
-        mock.predict_proba.return_value = np.array([[0.35, 0.65]])
-
-        with patch("src.api.dependencies.get_model", return_value=mock):
-            payload = {
-                "age": 30,
-                "income": 40000,
-                "credit_score": 680,
-                "loan_amount": 25000,
-                "employment_years": 3,
-                "existing_debts": 8000,
-            }
-            response = client.post("/api/v1/predict", json=payload)
+    mock_model.predict.return_value = np.array([1])
+    mock_model.predict_proba.return_value = np.array([[0.35, 0.65]])
+
+    payload = {
+        "age": 30,
+        "income": 40000,
+        "credit_score": 680,
+        "loan_amount": 25000,
+        "employment_years": 3,
+        "existing_debts": 8000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
 
     assert response.status_code == 200
     data = response.json()
@@ -123,3 +568,273 @@ def test_predict_missing_fields(client: TestClient) -> None:
     invalid_payload = {"age": 35}  # Missing fields
     response = client.post("/api/v1/predict", json=invalid_payload)
     assert response.status_code == 422
+
+
+def test_predict_fast_path_matches_pydantic(client: TestClient) -> None:
+    """Test the fast path returns the same bytes as the Pydantic path."""
+    from src.utils.config import get_settings
+
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    fast = client.post("/api/v1/predict", json=payload)
+    with patch.object(get_settings(), "fast_json_enabled", False):
+        slow = client.post("/api/v1/predict", json=payload)
+
+    assert fast.status_code == slow.status_code == 200
+    assert fast.content == slow.content
+    assert fast.headers["content-type"] == slow.headers["content-type"]
+
+
+def test_predict_fast_path_falls_back_for_coercion(client: TestClient) -> None:
+    """Test bodies needing Pydantic coercion are still accepted."""
+    payload = {
+        "age": "35",
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
+    assert response.status_code == 200
+    assert response.json()["approved"] is True
+
+
+def test_predict_fast_path_requires_json_content_type(client: TestClient) -> None:
+    """Test non-JSON bodies are rejected like on the Pydantic path."""
+    import json
+
+    from src.utils.config import get_settings
+
+    body = json.dumps(
+        {
+            "age": 35,
+            "income": 50000,
+            "credit_score": 750,
+            "loan_amount": 20000,
+            "employment_years": 8,
+            "existing_debts": 5000,
+        }
+    )
+    headers = {"content-type": "text/plain"}
+    fast = client.post("/api/v1/predict", content=body, headers=headers)
+    with patch.object(get_settings(), "fast_json_enabled", False):
+        slow = client.post("/api/v1/predict", content=body, headers=headers)
+
+    assert fast.status_code == slow.status_code == 422
+    assert fast.json() == slow.json()
+
+
+def test_predict_fast_path_honours_model_override(
+    client: TestClient, mock_model: MagicMock
+) -> None:
+    """Test the fast path scores with the overridden get_model dependency."""
+    from src.api.dependencies import get_model
+
+    resolved: list[MagicMock] = []
+
+    def override() -> MagicMock:
+        resolved.append(mock_model)
+        return mock_model
+
+    client.app.dependency_overrides[get_model] = override
+
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    assert client.post("/api/v1/predict", json=payload).status_code == 200
+    assert resolved == [mock_model]
+
+
+def test_metrics_endpoint(client: TestClient) -> None:
+    """Test /metrics exposes stage latencies and prediction counters."""
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    assert client.post("/api/v1/predict", json=payload).status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'credit_api_stage_seconds_count{stage="parse"}' in body
+    assert "credit_api_log_records_dropped_total " in body
+    assert 'credit_api_stage_seconds_count{stage="serialize"}' in body
+    assert 'credit_api_predictions_total{risk_level="low"}' in body
+
+
+@pytest.mark.parametrize(
+    "fast_json, payload_update",
+    [(True, {}), (True, {"age": "35"}), (False, {})],
+    ids=["fast", "fallback", "pydantic"],
+)
+def test_parse_stage_covers_both_paths(
+    client: TestClient, fast_json: bool, payload_update: dict
+) -> None:
+    """Test parse is timed once per request, whichever path validates the body."""
+    from src.api import metrics
+    from src.utils.config import get_settings
+
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+        **payload_update,
+    }
+    before = sum(metrics.PARSE_SECONDS.counts)
+    with patch.object(get_settings(), "fast_json_enabled", fast_json):
+        assert client.post("/api/v1/predict", json=payload).status_code == 200
+    assert sum(metrics.PARSE_SECONDS.counts) == before + 1
+
+
+def test_stage_observer_sees_only_serving_single_rows() -> None:
+    """Test warm-up and batch calls stay out of the stage latency metrics."""
+    from src.api.dependencies import warm_up_model
+    from tests.test_model import generate_sample
+
+    model = CreditApprovalModel()
+    model.train(*generate_sample(100))
+    model.stage_observer = MagicMock()
+
+    warm_up_model(model)
+    model.score_array(np.ones((10, 6)))
+    model.stage_observer.assert_not_called()
+
+    model.score_array(np.ones((1, 6)))
+    model.stage_observer.assert_called_once()
+
+
+def test_predict_timing_header(client: TestClient) -> None:
+    """Test the Server-Timing header breaks /predict down into stages."""
+    from src.utils.config import get_settings
+
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    response = client.post("/api/v1/predict", json=payload)
+    assert "Server-Timing" not in response.headers
+
+    with patch.object(get_settings(), "timing_header_enabled", True):
+        response = client.post("/api/v1/predict", json={**payload, "income": 60000})
+    assert response.status_code == 200
+    stages = [part.split(";")[0] for part in response.headers["Server-Timing"].split(", ")]
+    assert stages[0] == "parse"
+    assert {"build", "serialize", "total"} <= set(stages)
+
+
+def test_profile_requires_opt_in(client: TestClient) -> None:
+    """Test the profiler is hidden unless enabled."""
+    from src.utils.config import get_settings
+
+    with patch.object(get_settings(), "admin_enabled", True):
+        response = client.post("/api/v1/admin/profile", params={"seconds": 0.01})
+    assert response.status_code == 404
+
+
+def test_profile_returns_collapsed_stacks(client: TestClient) -> None:
+    """Test the profiler returns flamegraph-compatible collapsed stacks."""
+    from src.utils.config import get_settings
+
+    settings = get_settings()
+    with (
+        patch.object(settings, "admin_enabled", True),
+        patch.object(settings, "profiling_enabled", True),
+    ):
+        response = client.post(
+            "/api/v1/admin/profile", params={"seconds": 0.05, "interval_ms": 5}
+        )
+        too_long = client.post("/api/v1/admin/profile", params={"seconds": 3600})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert ";" in stack
+    assert too_long.status_code == 422
+
+
+def test_predict_batch(client: TestClient, mock_model: MagicMock) -> None:
+    """Test batch prediction scores all rows with one model call."""
+    mock_model.predict_proba.return_value = np.array(
+        [[0.15, 0.85], [0.83, 0.17], [0.35, 0.65]]
+    )
+    applicant = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    response = client.post("/api/v1/predict/batch", json={"applicants": [applicant] * 3})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [p["approved"] for p in data["predictions"]] == [True, False, True]
+    assert [p["risk_level"] for p in data["predictions"]] == ["low", "high", "medium"]
+    assert data["predictions"][0]["approval_probability"] == 0.85
+    mock_model.predict_proba.assert_called_once()
+    X = mock_model.predict_proba.call_args.args[0]
+    assert isinstance(X, np.ndarray)
+    assert X.shape == (3, 6)
+
+
+def test_predict_batch_empty(client: TestClient) -> None:
+    """Test batch prediction rejects an empty list."""
+    response = client.post("/api/v1/predict/batch", json={"applicants": []})
+    assert response.status_code == 422
+
+
+def test_predict_stream(client: TestClient, mock_model: MagicMock) -> None:
+    """Test NDJSON streaming returns one result line per input line."""
+    import json
+
+    mock_model.predict_proba.side_effect = lambda X: np.tile([0.15, 0.85], (len(X), 1))
+    applicant = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    body = "\n".join([json.dumps(applicant), "{bad", json.dumps(applicant)]) + "\n"
+    response = client.post(
+        "/api/v1/predict/stream",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["line"] for r in results] == [1, 2, 3]
+    assert results[0]["risk_level"] == "low"
+    assert "error" in results[1]
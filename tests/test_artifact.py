@@ -0,0 +1,104 @@
+"""
+Tests for the versioned model artifact.
+"""
+import json
+import zipfile
+
+import numpy as np
+import pytest
+
+from src.models.artifact import MANIFEST_NAME, read_artifact, write_artifact
+from src.models.credit_model import CreditApprovalModel
+from tests.test_model import generate_sample
+
+
+@pytest.fixture
+def trained_model() -> CreditApprovalModel:
+    """Train a model for testing."""
+    model = CreditApprovalModel()
+    model.train(*generate_sample(300))
+    return model
+
+
+def test_round_trip_parity(trained_model: CreditApprovalModel, tmp_path) -> None:
+    path = str(tmp_path / "model.artifact")
+    trained_model.save_artifact(path, metadata={"test_accuracy": 0.9})
+
+    served = CreditApprovalModel()
+    served.load(path)
+    assert served.backend == "compiled"
+    assert served.model is None and served.scaler is None
+    assert served.feature_names == trained_model.feature_names
+    assert served.metadata["n_samples"] == 300
+    assert served.metadata["test_accuracy"] == 0.9
+
+    X, _ = generate_sample(200)
+    np.testing.assert_allclose(served.predict_proba(X), trained_model.predict_proba(X))
+    np.testing.assert_array_equal(served.predict(X), trained_model.predict(X))
+
+
+def test_artifact_contains_no_pickle(trained_model: CreditApprovalModel, tmp_path) -> None:
+    path = tmp_path / "model.artifact"
+    trained_model.save_artifact(str(path))
+
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+
+    assert names == {MANIFEST_NAME, *(f"{name}.npy" for name in manifest["arrays"])}
+    assert {"scaler_mean", "scaler_scale", "threshold", "roots"} <= set(manifest["arrays"])
+    assert all("O" not in spec["dtype"] for spec in manifest["arrays"].values())
+
+
+def test_save_untrained_raises(tmp_path) -> None:
+    with pytest.raises(ValueError, match="not trained"):
+        CreditApprovalModel().save_artifact(str(tmp_path / "model.artifact"))
+
+
+def test_tampered_array_rejected(tmp_path) -> None:
+    path = tmp_path / "data.artifact"
+    write_artifact(str(path), {"values": np.arange(5.0)}, {"note": "test"})
+
+    manifest, arrays = read_artifact(str(path))
+    assert manifest["note"] == "test"
+    np.testing.assert_array_equal(arrays["values"], np.arange(5.0))
+
+    # Original manifest with the array of another artifact
+    other = tmp_path / "other.artifact"
+    write_artifact(str(other), {"values": np.ones(5)}, {})
+    tampered = tmp_path / "tampered.artifact"
+    with (
+        zipfile.ZipFile(path) as source,
+        zipfile.ZipFile(other) as replacement,
+        zipfile.ZipFile(tampered, "w") as target,
+    ):
+        target.writestr(MANIFEST_NAME, source.read(MANIFEST_NAME))
+        target.writestr("values.npy", replacement.read("values.npy"))
+
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        read_artifact(str(tampered))
+
+
+def test_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "model.artifact"
+    path.write_bytes(b"not an artifact")
+    with pytest.raises(ValueError, match="not a model artifact"):
+        read_artifact(str(path))
+
+
+def test_rejects_newer_version(tmp_path) -> None:
+    path = tmp_path / "model.artifact"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            MANIFEST_NAME,
+            json.dumps({"format": "credit-approval-model", "format_version": 99, "arrays": {}}),
+        )
+    with pytest.raises(ValueError, match="artifact version 99"):
+        read_artifact(str(path))
+
+
+def test_object_arrays_rejected(tmp_path) -> None:
+    with pytest.raises(ValueError, match="object dtype"):
+        write_artifact(
+            str(tmp_path / "model.artifact"), {"names": np.array(["a", None])}, {}
+        )
@@ -0,0 +1,59 @@
+"""
+Tests for MicroBatcher.
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.api.batching import MicroBatcher
+from src.models.credit_model import ScoringResult
+
+
+@pytest.fixture
+def mock_model() -> MagicMock:
+    """Mock model echoing the first feature as approval probability."""
+    model = MagicMock()
+    model.score_array.side_effect = lambda X, **_: ScoringResult.from_probabilities(X[:, 0].copy())
+    return model
+
+
+def test_concurrent_rows_share_one_call(mock_model: MagicMock) -> None:
+    batcher = MicroBatcher(window=0.05, max_batch_size=100)
+
+    async def run() -> list:
+        rows = [np.array([p, 0.0]) for p in (0.9, 0.6, 0.1)]
+        return await asyncio.gather(*(batcher.submit(mock_model, row) for row in rows))
+
+    scores = asyncio.run(run())
+
+    assert scores == [(1, 0.9, "low"), (1, 0.6, "medium"), (0, 0.1, "high")]
+    mock_model.score_array.assert_called_once()
+    assert mock_model.score_array.call_args.args[0].shape == (3, 2)
+
+
+def test_max_batch_size_flushes(mock_model: MagicMock) -> None:
+    batcher = MicroBatcher(window=10.0, max_batch_size=2)
+
+    async def run() -> list:
+        rows = [np.array([0.9, 0.0])] * 4
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(mock_model, row) for row in rows)), timeout=5
+        )
+
+    scores = asyncio.run(run())
+
+    assert len(scores) == 4
+    assert mock_model.score_array.call_count == 2
+
+
+def test_errors_propagate_to_callers(mock_model: MagicMock) -> None:
+    mock_model.score_array.side_effect = RuntimeError("boom")
+    batcher = MicroBatcher(window=0.001)
+
+    async def run() -> None:
+        await batcher.submit(mock_model, np.array([0.5, 0.0]))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run())
@@ -0,0 +1,75 @@
+"""
+Tests for PredictionCache.
+"""
+from unittest.mock import patch
+
+import numpy as np
+
+from src.api.cache import PredictionCache, interval_cache_key, prediction_cache_key
+from src.api.schemas import PredictionRequest
+from src.models.compiled_forest import ThresholdIndex
+
+
+def test_lru_eviction() -> None:
+    cache = PredictionCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_expiry() -> None:
+    cache = PredictionCache(max_size=10, ttl=5.0)
+    with patch("src.api.cache.time.monotonic", return_value=100.0):
+        cache.put("a", 1)
+    with patch("src.api.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == 1
+    with patch("src.api.cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_stats_and_clear() -> None:
+    cache = PredictionCache(max_size=10)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_key_normalizes_fields() -> None:
+    payload = {
+        "age": 35,
+        "income": 50000,
+        "credit_score": 750,
+        "loan_amount": 20000,
+        "employment_years": 8,
+        "existing_debts": 5000,
+    }
+    as_float = {name: float(value) for name, value in payload.items()}
+    assert prediction_cache_key(PredictionRequest(**payload), 1) == prediction_cache_key(
+        PredictionRequest(**as_float), 1
+    )
+    assert prediction_cache_key(PredictionRequest(**payload), 1) != prediction_cache_key(
+        PredictionRequest(**payload), 2
+    )
+
+
+def test_interval_key_shared_within_cell() -> None:
+    index = ThresholdIndex([np.array([10.0, 20.0]), np.array([0.5])], np.dtype(np.float64))
+
+    assert interval_cache_key(index, [11.0, 0.1], 1) == interval_cache_key(index, [19.0, 0.5], 1)
+    assert interval_cache_key(index, [11.0, 0.1], 1) != interval_cache_key(index, [21.0, 0.1], 1)
+    assert interval_cache_key(index, [11.0, 0.1], 1) != interval_cache_key(index, [11.0, 0.1], 2)
@@ -0,0 +1,95 @@
+"""
+Tests for SingleFlight request coalescing.
+"""
+import asyncio
+
+from src.api.coalescing import SingleFlight
+
+
+def counting_compute(calls: list[str], result: str, delay: float = 0.02):
+    async def compute() -> str:
+        calls.append(result)
+        await asyncio.sleep(delay)
+        return result
+
+    return compute
+
+
+def test_concurrent_callers_share_one_computation() -> None:
+    flights = SingleFlight()
+    calls: list[str] = []
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(flights.run("a", counting_compute(calls, "a")) for _ in range(5)),
+            flights.run("b", counting_compute(calls, "b")),
+        )
+
+    results = asyncio.run(run())
+
+    assert sorted(calls) == ["a", "b"]
+    assert [result for result, _ in results] == ["a"] * 5 + ["b"]
+    assert [shared for _, shared in results].count(True) == 4
+    assert flights.leaders == 2 and flights.followers == 4
+    assert len(flights) == 0
+
+
+def test_finished_flights_are_not_reused() -> None:
+    flights = SingleFlight()
+    calls: list[str] = []
+
+    async def run() -> None:
+        await flights.run("a", counting_compute(calls, "a", delay=0))
+        await flights.run("a", counting_compute(calls, "a", delay=0))
+
+    asyncio.run(run())
+    assert calls == ["a", "a"]
+
+
+def test_fingerprint_mismatch_computes_separately() -> None:
+    flights = SingleFlight()
+    calls: list[str] = []
+
+    async def run() -> list:
+        return await asyncio.gather(
+            flights.run("key", counting_compute(calls, "x"), fingerprint="x"),
+            flights.run("key", counting_compute(calls, "x"), fingerprint="x"),
+            flights.run("key", counting_compute(calls, "y"), fingerprint="y"),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [("x", False), ("x", True), ("y", False)]
+    assert sorted(calls) == ["x", "y"]
+
+
+def test_errors_propagate_to_every_caller() -> None:
+    flights = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run() -> list:
+        return await asyncio.gather(
+            flights.run("a", fail), flights.run("a", fail), return_exceptions=True
+        )
+
+    errors = asyncio.run(run())
+    assert [str(error) for error in errors] == ["boom", "boom"]
+
+
+def test_cancelled_leader_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+    calls: list[str] = []
+
+    async def run() -> tuple:
+        leader = asyncio.ensure_future(flights.run("a", counting_compute(calls, "a")))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.run("a", counting_compute(calls, "a")))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == ("a", True)
+    assert calls == ["a"]
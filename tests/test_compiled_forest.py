@@ -0,0 +1,289 @@
+"""
+Tests for CompiledForest.
+"""
+import numpy as np
+import pytest
+
+from src.models.compiled_forest import CompiledForest, QuantizedForest, ThresholdIndex
+from src.models.credit_model import CreditApprovalModel
+from tests.test_model import generate_sample
+
+
+@pytest.fixture
+def trained_model() -> CreditApprovalModel:
+    """Train a model for testing."""
+    model = CreditApprovalModel()
+    model.train(*generate_sample(300))
+    return model
+
+
+def test_parity_with_sklearn(trained_model: CreditApprovalModel) -> None:
+    compiled = CompiledForest.from_sklearn(trained_model.model, trained_model.scaler)
+    X, _ = generate_sample(2000)
+    np.testing.assert_allclose(
+        compiled.predict_proba(X.to_numpy(dtype=np.float64)),
+        trained_model.predict_proba(X),
+        atol=1e-12,
+    )
+
+
+def test_chunked_evaluation_matches(trained_model: CreditApprovalModel) -> None:
+    compiled = CompiledForest.from_sklearn(trained_model.model, trained_model.scaler)
+    X = generate_sample(100)[0].to_numpy(dtype=np.float64)
+    np.testing.assert_array_equal(
+        compiled.predict_positive(X, chunk_size=7),
+        compiled.predict_positive(X),
+    )
+
+
+def test_layout(trained_model: CreditApprovalModel) -> None:
+    compiled = CompiledForest.from_sklearn(trained_model.model, trained_model.scaler)
+    assert compiled.n_trees == 100
+    assert compiled.n_nodes == sum(e.tree_.node_count for e in trained_model.model.estimators_)
+    assert compiled.max_depth <= 10
+
+
+def test_wrong_shape_raises(trained_model: CreditApprovalModel) -> None:
+    compiled = CompiledForest.from_sklearn(trained_model.model, trained_model.scaler)
+    with pytest.raises(ValueError, match="shape"):
+        compiled.predict_positive(np.zeros((2, 4)))
+
+
+def test_compiled_backend(trained_model: CreditApprovalModel) -> None:
+    model = CreditApprovalModel(backend="compiled")
+    X_train, y_train = generate_sample(300)
+    model.train(X_train, y_train)
+    assert model.compiled is not None
+
+    X, _ = generate_sample(50)
+    np.testing.assert_allclose(model.predict_proba(X), trained_model.predict_proba(X))
+    np.testing.assert_array_equal(model.predict(X), trained_model.predict(X))
+    np.testing.assert_allclose(
+        model.predict_proba_array(X.to_numpy(dtype=np.float64)),
+        trained_model.predict_proba(X),
+    )
+
+
+def test_unknown_backend_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown backend"):
+        CreditApprovalModel(backend="onnx")
+
+
+def test_save_and_load_mmap(trained_model: CreditApprovalModel, tmp_path) -> None:
+    compiled = trained_model.compile()
+    path = str(tmp_path / "model.forest")
+    compiled.save(path)
+
+    mapped = CompiledForest.load(path, mmap=True)
+    assert isinstance(mapped.threshold.base, np.memmap)
+    assert not mapped.threshold.flags.writeable
+    assert mapped.feature_names == trained_model.feature_names
+    assert mapped.max_depth == compiled.max_depth
+
+    X = generate_sample(200)[0].to_numpy(dtype=np.float64)
+    np.testing.assert_array_equal(mapped.predict_positive(X), compiled.predict_positive(X))
+    np.testing.assert_array_equal(
+        CompiledForest.load(path, mmap=False).predict_positive(X),
+        compiled.predict_positive(X),
+    )
+
+
+def test_resave_keeps_existing_mappings_valid(
+    trained_model: CreditApprovalModel, tmp_path
+) -> None:
+    path = str(tmp_path / "model.forest")
+    trained_model.compile().save(path)
+    mapped = CompiledForest.load(path, mmap=True)
+    X = generate_sample(200)[0].to_numpy(dtype=np.float64)
+    expected = mapped.predict_positive(X)
+
+    retrained = CreditApprovalModel()
+    X_train, y_train = generate_sample(500)
+    retrained.train(X_train, 1 - y_train)
+    retrained.compile().save(path)
+
+    np.testing.assert_array_equal(mapped.predict_positive(X), expected)
+    np.testing.assert_array_equal(
+        CompiledForest.load(path).predict_positive(X), retrained.compile().predict_positive(X)
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.forest"]
+
+
+def test_load_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "model.forest"
+    path.write_bytes(b"not a forest")
+    with pytest.raises(ValueError, match="not a compiled forest"):
+        CompiledForest.load(str(path))
+
+
+def test_model_loads_forest_file(trained_model: CreditApprovalModel, tmp_path) -> None:
+    path = str(tmp_path / "model.forest")
+    trained_model.save_compiled(path)
+    # Saving leaves the sklearn backend serving as before
+    assert trained_model.compiled is None
+
+    served = CreditApprovalModel()
+    served.load(path)
+    assert served.backend == "compiled"
+    assert served.model is None and served.scaler is None
+    assert served.feature_names == trained_model.feature_names
+
+    X, _ = generate_sample(100)
+    np.testing.assert_allclose(served.predict_proba(X), trained_model.predict_proba(X))
+    np.testing.assert_array_equal(served.predict(X), trained_model.predict(X))
+
+
+def test_quantized_layout(trained_model: CreditApprovalModel) -> None:
+    compiled = trained_model.compile()
+    quantized = compiled.quantize()
+
+    assert quantized.feature.dtype == np.uint8
+    assert quantized.threshold.dtype == np.float32
+    assert quantized.left.dtype == quantized.right.dtype == quantized.roots.dtype == np.int16
+    assert quantized.n_nodes == compiled.n_nodes
+    assert quantized.nbytes < compiled.nbytes / 4
+
+
+def test_quantized_index_dtype_follows_forest_size() -> None:
+    n_nodes = 2**15
+    # One single-leaf tree per node: leaves point to themselves
+    nodes = np.arange(n_nodes)
+    compiled = CompiledForest(
+        feature=np.zeros(n_nodes, dtype=np.int64),
+        threshold=np.zeros(n_nodes),
+        left=nodes,
+        right=nodes,
+        value=np.full(n_nodes, 0.5),
+        roots=nodes,
+        n_features=1,
+        max_depth=0,
+    )
+    quantized = compiled.quantize()
+
+    assert quantized.left.dtype == quantized.roots.dtype == np.int32
+    assert quantized.leaves(np.zeros((1, 1), dtype=np.float32))[0, -1] == n_nodes - 1
+
+
+def test_quantized_parity(trained_model: CreditApprovalModel) -> None:
+    compiled = trained_model.compile()
+    quantized = compiled.quantize()
+
+    X = generate_sample(2000)[0].to_numpy(dtype=np.float64)
+    np.testing.assert_allclose(
+        quantized.predict_positive(X), compiled.predict_positive(X), atol=1e-6
+    )
+    np.testing.assert_array_equal(quantized.leaves(X.astype(np.float32)), compiled.leaves(X))
+
+
+def test_quantization_parity_report(trained_model: CreditApprovalModel) -> None:
+    X, y = generate_sample(500)
+    parity = trained_model.quantization_parity(X, y)
+
+    assert parity["decision_agreement"] == 1.0
+    assert parity["max_probability_error"] < 1e-6
+    assert parity["quantized_accuracy"] == parity["reference_accuracy"]
+    assert parity["quantized_bytes"] < parity["full_bytes"]
+
+
+def test_quantized_backend(trained_model: CreditApprovalModel, tmp_path) -> None:
+    path = str(tmp_path / "model.artifact")
+    trained_model.save_artifact(path)
+
+    served = CreditApprovalModel(backend="quantized")
+    served.load(path)
+    assert served.backend == "quantized"
+    assert isinstance(served.compiled, QuantizedForest)
+
+    X, _ = generate_sample(200)
+    np.testing.assert_array_equal(served.predict(X), trained_model.predict(X))
+
+
+def test_quantized_forest_file(trained_model: CreditApprovalModel, tmp_path) -> None:
+    quantized = trained_model.compile().quantize()
+    path = str(tmp_path / "model.forest")
+    quantized.save(path)
+
+    served = CreditApprovalModel()
+    served.load(path)
+    assert served.backend == "quantized"
+    assert served.compiled.threshold.dtype == np.float32
+
+    X = generate_sample(200)[0].to_numpy(dtype=np.float64)
+    np.testing.assert_array_equal(
+        served.compiled.predict_positive(X), quantized.predict_positive(X)
+    )
+
+
+@pytest.mark.parametrize("backend", ["compiled", "quantized"])
+def test_threshold_index_cells_are_exact(backend: str) -> None:
+    model = CreditApprovalModel(backend=backend)
+    model.train(*generate_sample(300))
+    index = model.threshold_index
+
+    X = generate_sample(300)[0][model.feature_names].to_numpy(dtype=np.float64)
+    cells = index.cells(X)
+    assert [index.cell(row) for row in X.tolist()] == [tuple(cell) for cell in cells]
+
+    # Move every feature to the upper end of its interval (t[c - 1], t[c]]
+    moved = np.column_stack(
+        [
+            np.append(thresholds, thresholds[-1] + 100)[cells[:, i]]
+            for i, thresholds in enumerate(index.thresholds)
+        ]
+    ).astype(np.float64)
+    assert not np.array_equal(moved, X)
+
+    np.testing.assert_array_equal(index.cells(moved), cells)
+    np.testing.assert_array_equal(
+        model.predict_proba_array(moved), model.predict_proba_array(X)
+    )
+
+
+def test_threshold_index_reset_on_retrain(trained_model: CreditApprovalModel) -> None:
+    index = trained_model.threshold_index
+    assert trained_model.threshold_index is index
+    assert isinstance(index, ThresholdIndex)
+
+    trained_model.train(*generate_sample(200))
+    assert trained_model.threshold_index is not index
+
+
+@pytest.mark.parametrize("backend", ["compiled", "quantized"])
+def test_early_exit_keeps_bands(backend: str) -> None:
+    model = CreditApprovalModel(backend=backend)
+    model.train(*generate_sample(300))
+    boundaries = (0.5, 0.8)
+
+    X = generate_sample(2000)[0][model.feature_names].to_numpy(dtype=np.float64)
+    exact = model.compiled.predict_positive(X)
+    estimate, evaluated = model.compiled.predict_positive_early_exit(X, boundaries, chunk_size=300)
+
+    assert evaluated.mean() < model.compiled.n_trees
+    for boundary in boundaries:
+        np.testing.assert_array_equal(estimate > boundary, exact > boundary)
+        np.testing.assert_array_equal(estimate >= boundary, exact >= boundary)
+    full = evaluated == model.compiled.n_trees
+    np.testing.assert_allclose(estimate[full], exact[full])
+
+
+def test_exit_checkpoints(trained_model: CreditApprovalModel) -> None:
+    compiled = trained_model.compile()
+    checkpoints = compiled.exit_checkpoints((0.5, 0.8), 10)
+
+    # Leaves lie in [0, 1]: nothing is decided before half the trees ran
+    assert checkpoints[0] >= compiled.n_trees // 2
+    assert checkpoints[-1] == compiled.n_trees
+    assert np.all(np.diff(checkpoints) <= 10)
+
+
+def test_score_array_early_exit(trained_model: CreditApprovalModel) -> None:
+    served = CreditApprovalModel(backend="compiled", early_exit=True)
+    served.model, served.scaler = trained_model.model, trained_model.scaler
+    served.feature_names = trained_model.feature_names
+    served.compile()
+
+    X = generate_sample(1000)[0][served.feature_names].to_numpy(dtype=np.float64)
+    result = served.score_array(X)
+    expected = trained_model.score_array(X)
+    np.testing.assert_array_equal(result.labels, expected.labels)
+    np.testing.assert_array_equal(result.risk_levels, expected.risk_levels)
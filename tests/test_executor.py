@@ -0,0 +1,61 @@
+"""
+Tests for InferenceExecutor.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.api.executor import ExecutorSaturatedError, InferenceExecutor
+
+
+def test_runs_in_worker_thread() -> None:
+    executor = InferenceExecutor(max_workers=1, queue_size=0)
+
+    async def run() -> str:
+        return await executor.run(lambda: threading.current_thread().name)
+
+    assert asyncio.run(run()).startswith("inference")
+    executor.shutdown()
+
+
+def test_reject_when_full() -> None:
+    executor = InferenceExecutor(max_workers=1, queue_size=0, overflow="reject")
+    release = threading.Event()
+
+    async def run() -> None:
+        busy = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(lambda: None)
+        finally:
+            release.set()
+            await busy
+
+    asyncio.run(run())
+    executor.shutdown()
+
+
+def test_wait_times_out() -> None:
+    executor = InferenceExecutor(max_workers=1, queue_size=0, overflow="wait", queue_timeout=0.01)
+    release = threading.Event()
+
+    async def run() -> None:
+        busy = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(lambda: None)
+        finally:
+            release.set()
+            await busy
+        assert await executor.run(lambda: 42) == 42
+
+    asyncio.run(run())
+    executor.shutdown()
+
+
+def test_unknown_overflow_raises() -> None:
+    with pytest.raises(ValueError, match="overflow"):
+        InferenceExecutor(overflow="drop")
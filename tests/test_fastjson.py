@@ -0,0 +1,55 @@
+"""
+Tests for the fast /predict JSON path.
+"""
+import numpy as np
+
+from src.api.fastjson import (
+    FEATURE_FIELDS,
+    encode_prediction,
+    parse_prediction_request,
+    within_bounds,
+)
+from src.api.schemas import PredictionResponse
+
+BODY = (
+    b'{"age": 35, "income": 50000.5, "credit_score": 750, "loan_amount": 20000,'
+    b' "employment_years": 8, "existing_debts": 0}'
+)
+
+
+def test_parse_valid_body() -> None:
+    row = parse_prediction_request(BODY)
+    assert row.dtype == np.float64
+    assert row.tolist() == [35, 50000.5, 750, 20000, 8, 0]
+    assert len(row) == len(FEATURE_FIELDS)
+
+
+def test_parse_falls_back() -> None:
+    assert parse_prediction_request(b"not json") is None
+    assert parse_prediction_request(b"[1, 2, 3]") is None
+    assert parse_prediction_request(b'{"age": 35}') is None
+    assert parse_prediction_request(BODY.replace(b"35", b'"35"')) is None
+    assert parse_prediction_request(BODY.replace(b"35", b"true")) is None
+    assert parse_prediction_request(BODY.replace(b'"age": 35', b'"age": 0')) is None
+
+
+def test_within_bounds_matches_schema() -> None:
+    # age: gt=0, le=100; credit_score: ge=0, le=1000
+    X = np.array(
+        [
+            [100, 1, 0, 1, 0, 0],
+            [100.5, 1, 0, 1, 0, 0],
+            [0, 1, 0, 1, 0, 0],
+            [35, 1, -1, 1, 0, 0],
+            [35, np.inf, 0, 1, 0, 0],
+        ]
+    )
+    assert within_bounds(X).tolist() == [True, False, False, False, False]
+
+
+def test_encode_prediction_matches_pydantic() -> None:
+    for approved, probability, risk_level in [(True, 0.85, "low"), (False, 0.1, "high")]:
+        expected = PredictionResponse(
+            approved=approved, approval_probability=probability, risk_level=risk_level
+        ).model_dump_json()
+        assert encode_prediction(approved, probability, risk_level) == expected.encode()
@@ -0,0 +1,76 @@
+"""
+Tests for the logging pipeline.
+"""
+import io
+import logging
+import queue
+
+from src.utils.logger import (
+    BatchQueueListener,
+    BatchStreamHandler,
+    LazyQueueHandler,
+    SamplingFilter,
+)
+
+
+def _record(level: int = logging.INFO, sampled: bool = False) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, __file__, 1, "value=%d", (1,), None)
+    if sampled:
+        record.sampled = True
+    return record
+
+
+def test_sampling_filter() -> None:
+    drop_all = SamplingFilter(0.0)
+    assert drop_all.filter(_record(sampled=True)) is False
+    assert drop_all.filter(_record()) is True
+    assert drop_all.filter(_record(logging.ERROR, sampled=True)) is True
+    assert SamplingFilter(1.0).filter(_record(sampled=True)) is True
+
+
+def test_lazy_queue_handler_defers_formatting() -> None:
+    log_queue: queue.Queue = queue.Queue(1)
+    handler = LazyQueueHandler(log_queue)
+    record = _record()
+    handler.handle(record)
+    handler.handle(_record())
+
+    queued = log_queue.get_nowait()
+    assert queued is record
+    assert queued.args == (1,)
+    assert handler.dropped == 1
+
+
+def test_full_queue_never_drops_warnings() -> None:
+    stream = io.StringIO()
+    fallback = BatchStreamHandler(stream)
+    log_queue: queue.Queue = queue.Queue(1)
+    handler = LazyQueueHandler(log_queue, fallback=(fallback,))
+    handler.handle(_record())
+
+    handler.handle(_record(logging.INFO))
+    handler.handle(_record(logging.ERROR))
+
+    assert handler.dropped == 1
+    assert stream.getvalue() == "value=1\n"
+
+
+def test_batch_listener_flushes_once_per_batch() -> None:
+    class CountingStream(io.StringIO):
+        flushes = 0
+
+        def flush(self) -> None:
+            CountingStream.flushes += 1
+
+    stream = CountingStream()
+    handler = BatchStreamHandler(stream)
+    log_queue: queue.Queue = queue.Queue()
+    for _ in range(10):
+        log_queue.put_nowait(_record())
+
+    listener = BatchQueueListener(log_queue, handler, batch_size=100)
+    listener.start()
+    listener.stop()
+
+    assert stream.getvalue().count("value=1") == 10
+    assert CountingStream.flushes <= 2
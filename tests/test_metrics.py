@@ -0,0 +1,56 @@
+"""
+Tests for Prometheus metrics.
+"""
+import numpy as np
+
+from src.api.metrics import (
+    PREDICTIONS_BY_RISK,
+    Histogram,
+    MetricFamily,
+    count_risk_levels,
+    policy_metrics,
+)
+
+
+def test_histogram_buckets() -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.sum == 2.65
+
+
+def test_histogram_exposition_is_cumulative() -> None:
+    family = MetricFamily("test_seconds", "Test", "histogram", ("stage",), buckets=(0.1, 1.0))
+    family.labels("parse").observe(0.05)
+    family.labels("parse").observe(0.5)
+
+    lines = list(family.expose())
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{stage="parse",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="parse",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{stage="parse",le="+Inf"} 2' in lines
+    assert 'test_seconds_count{stage="parse"} 2' in lines
+
+
+def test_labels_are_bound_once() -> None:
+    family = MetricFamily("test_total", "Test", "counter", ("reason",))
+    assert family.labels("a") is family.labels("a")
+
+
+def test_count_risk_levels() -> None:
+    before = PREDICTIONS_BY_RISK["low"].value
+    count_risk_levels(np.array(["low", "high", "low"], dtype=object))
+    assert PREDICTIONS_BY_RISK["low"].value == before + 2
+
+
+def test_count_custom_risk_level() -> None:
+    count_risk_levels(np.array(["prime"], dtype=object))
+    assert PREDICTIONS_BY_RISK["prime"].value >= 1
+
+
+def test_policy_metrics() -> None:
+    lines = list(policy_metrics({"model": 3, "credit_score_floor": 2}))
+    assert 'credit_api_policy_decisions_total{rule="model"} 3' in lines
+    assert 'credit_api_policy_decisions_total{rule="credit_score_floor"} 2' in lines
@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.models.credit_model import CreditApprovalModel
+from src.models.credit_model import CreditApprovalModel, ScoringResult, risk_levels
 
 
 @pytest.fixture
@@ -73,6 +73,19 @@ class TestPredict:
         assert result.shape == (5, 2)
         assert np.allclose(result.sum(axis=1), 1.0)
 
+    def test_predict_proba_array_matches_dataframe(
+        self, trained_model: CreditApprovalModel
+    ) -> None:
+        X, _ = generate_sample(10)
+        result = trained_model.predict_proba_array(X.to_numpy(dtype=np.float64))
+        np.testing.assert_allclose(result, trained_model.predict_proba(X))
+
+    def test_predict_proba_array_wrong_shape_raises(
+        self, trained_model: CreditApprovalModel
+    ) -> None:
+        with pytest.raises(ValueError, match="shape"):
+            trained_model.predict_proba_array(np.zeros((1, 3)))
+
     def test_predict_without_training_raises(self) -> None:
         model = CreditApprovalModel()
         X, _ = generate_sample(1)
@@ -86,6 +99,80 @@ class TestPredict:
             model.predict_proba(X)
 
 
+class TestScore:
+    """Tests for single-pass scoring."""
+
+    def test_score_matches_predict(self, trained_model: CreditApprovalModel) -> None:
+        X, _ = generate_sample(20)
+        result = trained_model.score(X)
+        assert isinstance(result, ScoringResult)
+        assert len(result) == 20
+        np.testing.assert_array_equal(result.labels, trained_model.predict(X))
+        np.testing.assert_allclose(result.probabilities, trained_model.predict_proba(X)[:, 1])
+
+    def test_score_custom_threshold(self, trained_model: CreditApprovalModel) -> None:
+        X, _ = generate_sample(20)
+        result = trained_model.score(X, threshold=1.0)
+        assert not result.labels.any()
+
+    def test_risk_levels(self) -> None:
+        levels = risk_levels(np.array([0.95, 0.8, 0.65, 0.5, 0.2]))
+        assert levels.tolist() == ["low", "low", "medium", "medium", "high"]
+
+
+class TestFoldScaler:
+    """Tests for folding the scaler into the forest."""
+
+    def test_fold_matches_scaled_model(
+        self, sample_data, trained_model: CreditApprovalModel
+    ) -> None:
+        folded = CreditApprovalModel()
+        folded.train(*sample_data, fold_scaler=True)
+        assert folded.scaler is None
+
+        X, _ = generate_sample(2000)
+        np.testing.assert_allclose(folded.predict_proba(X), trained_model.predict_proba(X))
+        np.testing.assert_allclose(
+            folded.predict_proba_array(X.to_numpy(dtype=np.float64)),
+            trained_model.predict_proba(X),
+        )
+
+    def test_fold_compiled_backend(self, sample_data, trained_model: CreditApprovalModel) -> None:
+        folded = CreditApprovalModel(backend="compiled")
+        folded.train(*sample_data, fold_scaler=True)
+
+        X, _ = generate_sample(2000)
+        np.testing.assert_allclose(folded.predict_proba(X), trained_model.predict_proba(X))
+
+    def test_fold_at_load(self, trained_model: CreditApprovalModel, tmp_path: Path) -> None:
+        model_path = str(tmp_path / "model.pkl")
+        scaler_path = str(tmp_path / "scaler.pkl")
+        trained_model.save(model_path, scaler_path)
+
+        folded = CreditApprovalModel()
+        folded.load(model_path, scaler_path, fold_scaler=True)
+        assert folded.scaler is None
+        assert folded.feature_names == trained_model.feature_names
+
+        X, _ = generate_sample(200)
+        np.testing.assert_allclose(folded.predict_proba(X), trained_model.predict_proba(X))
+
+    def test_save_and_load_folded(self, sample_data, tmp_path: Path) -> None:
+        folded = CreditApprovalModel()
+        folded.train(*sample_data, fold_scaler=True)
+        model_path = str(tmp_path / "model.pkl")
+        scaler_path = str(tmp_path / "scaler.pkl")
+        folded.save(model_path, scaler_path)
+
+        loaded = CreditApprovalModel()
+        loaded.load(model_path, scaler_path)
+        assert loaded.scaler is None
+        assert loaded.feature_names == folded.feature_names
+
+        X, _ = generate_sample(50)
+        np.testing.assert_array_equal(loaded.predict(X), folded.predict(X))
+
+
 class TestSaveLoad:
     """Tests for model serialization."""
 
@@ -105,12 +192,25 @@ class TestSaveLoad:
             trained_model.predict(X),
             new_model.predict(X),
         )
+        assert new_model.feature_names == trained_model.feature_names
 
     def test_save_untrained_raises(self) -> None:
         model = CreditApprovalModel()
         with pytest.raises(ValueError, match="not trained"):
             model.save("model.pkl", "scaler.pkl")
 
+    def test_load_applies_serving_n_jobs(
+        self, trained_model: CreditApprovalModel, tmp_path: Path
+    ) -> None:
+        model_path = str(tmp_path / "model.pkl")
+        scaler_path = str(tmp_path / "scaler.pkl")
+        trained_model.save(model_path, scaler_path)
+        assert trained_model.model.n_jobs == -1
+
+        served = CreditApprovalModel(n_jobs=1)
+        served.load(model_path, scaler_path)
+        assert served.model.n_jobs == 1
+
 
 def generate_sample(n: int = 1) -> tuple[pd.DataFrame, pd.Series]:
     """Helper to generate sample data."""
@@ -0,0 +1,51 @@
+"""
+Tests for serving-time thread and CPU limits.
+"""
+import os
+from unittest.mock import patch
+
+import pytest
+from threadpoolctl import threadpool_limits
+
+from src.utils.config import get_settings
+from src.utils.parallelism import claim_cpu, configure_worker_parallelism, parse_cpu_list
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def test_parse_cpu_list() -> None:
+    assert parse_cpu_list("0-3,6") == [0, 1, 2, 3, 6]
+    assert parse_cpu_list(" 2, 1,2 ") == [1, 2]
+    assert parse_cpu_list("") == []
+    with pytest.raises(ValueError, match="Invalid CPU list"):
+        parse_cpu_list("0-x")
+
+
+def test_claim_cpu_skips_cpus_held_by_other_workers(tmp_path) -> None:
+    # Another worker process holding CPU 0
+    fd = os.open(tmp_path / "cpu-0.lock", os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    try:
+        assert claim_cpu([0, 1], tmp_path) == 1
+        assert claim_cpu([0], tmp_path) is None
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_configure_worker_pins_cpus() -> None:
+    original = os.sched_getaffinity(0)
+    cpu = min(original)
+    settings = get_settings()
+    try:
+        with (
+            threadpool_limits(),
+            patch.object(settings, "native_threads", 1),
+            patch.object(settings, "cpu_affinity", str(cpu)),
+            patch.dict(os.environ),
+        ):
+            configure_worker_parallelism(settings)
+            assert os.sched_getaffinity(0) == {cpu}
+            assert os.environ["OMP_NUM_THREADS"] == "1"
+    finally:
+        os.sched_setaffinity(0, original)
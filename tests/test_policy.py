@@ -0,0 +1,154 @@
+"""
+Tests for the pre-screen policy engine.
+"""
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.models.credit_model import CreditApprovalModel
+from src.models.policy import PolicyConfig, PolicyEngine
+from tests.test_model import generate_sample
+
+FEATURES = ["age", "income", "credit_score", "loan_amount", "employment_years", "existing_debts"]
+
+POLICY = {
+    "rules": [
+        {
+            "name": "credit_score_floor",
+            "decision": "reject",
+            "conditions": [{"feature": "credit_score", "op": "<", "value": 500}],
+        },
+        {
+            "name": "loan_to_income_limit",
+            "decision": "reject",
+            "probability": 0.1,
+            "conditions": [{"feature": "loan_amount", "per": "income", "op": ">=", "value": 5}],
+        },
+        {
+            "name": "prime_applicant",
+            "decision": "approve",
+            "conditions": [
+                {"feature": "credit_score", "op": ">=", "value": 720},
+                {"feature": "loan_amount", "per": "income", "op": "<=", "value": 2},
+            ],
+        },
+    ],
+}
+
+
+def rows(*applicants: tuple[float, ...]) -> np.ndarray:
+    return np.array(applicants, dtype=np.float64)
+
+
+def test_match_first_rule_wins() -> None:
+    engine = PolicyEngine(PolicyConfig.model_validate(POLICY))
+    X = rows(
+        (35, 50000, 450, 300000, 8, 0),  # both reject rules: first one wins
+        (35, 50000, 650, 300000, 8, 0),  # loan-to-income only
+        (35, 50000, 760, 60000, 8, 0),  # prime
+        (35, 50000, 650, 60000, 8, 0),  # no rule
+    )
+
+    np.testing.assert_array_equal(engine.match(X, FEATURES), [0, 1, 2, -1])
+    assert engine.stats() == {
+        "model": 1,
+        "credit_score_floor": 1,
+        "loan_to_income_limit": 1,
+        "prime_applicant": 1,
+    }
+
+    engine.match(X, FEATURES, count=False)
+    assert engine.stats()["model"] == 1
+
+
+def test_unknown_feature_raises() -> None:
+    config = {
+        "rules": [
+            {
+                "name": "bad",
+                "decision": "reject",
+                "conditions": [{"feature": "salary", "op": "<", "value": 1}],
+            }
+        ]
+    }
+    engine = PolicyEngine(PolicyConfig.model_validate(config))
+    with pytest.raises(ValueError, match="unknown feature"):
+        engine.match(rows((35, 50000, 650, 20000, 8, 0)), FEATURES)
+
+
+def test_config_validation() -> None:
+    with pytest.raises(ValidationError, match="highest first"):
+        PolicyConfig.model_validate(
+            {
+                "risk_levels": [
+                    {"min_probability": 0.5, "level": "medium"},
+                    {"min_probability": 0.8, "level": "low"},
+                ]
+            }
+        )
+    with pytest.raises(ValidationError, match="unique"):
+        PolicyConfig.model_validate({"rules": [POLICY["rules"][0], POLICY["rules"][0]]})
+
+
+def test_custom_risk_levels(tmp_path) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(
+        json.dumps(
+            {
+                "risk_levels": [{"min_probability": 0.9, "level": "prime"}],
+                "default_risk_level": "standard",
+            }
+        )
+    )
+    engine = PolicyEngine.from_file(str(path))
+
+    assert engine.risk_cutoffs == (0.9,)
+    assert engine.risk_levels(np.array([0.95, 0.9, 0.5])).tolist() == [
+        "prime",
+        "prime",
+        "standard",
+    ]
+
+
+def test_score_array_skips_forest_for_decided_rows() -> None:
+    model = CreditApprovalModel()
+    model.train(*generate_sample(300))
+    model.policy = PolicyEngine(PolicyConfig.model_validate(POLICY))
+    features = model.feature_names
+
+    base = {"age": 35, "income": 50000, "employment_years": 8, "existing_debts": 0}
+    applicants = [
+        {**base, "credit_score": 450, "loan_amount": 20000},
+        {**base, "credit_score": 650, "loan_amount": 300000},
+        {**base, "credit_score": 760, "loan_amount": 60000},
+        {**base, "credit_score": 650, "loan_amount": 60000},
+    ]
+    X = np.array([[applicant[name] for name in features] for applicant in applicants])
+
+    scored_rows: list[int] = []
+    predict_proba_array = model.predict_proba_array
+    model.predict_proba_array = lambda X: scored_rows.append(len(X)) or predict_proba_array(X)
+
+    result = model.score_array(X)
+
+    assert scored_rows == [1]
+    assert result.labels[:3].tolist() == [0, 0, 1]
+    assert result.probabilities[:3].tolist() == [0.0, 0.1, 1.0]
+    assert result.risk_levels[:3].tolist() == ["high", "high", "low"]
+    assert result.probabilities[3] == predict_proba_array(X[3:])[0, 1]
+
+
+def test_score_array_all_decided_by_policy() -> None:
+    model = CreditApprovalModel()
+    model.train(*generate_sample(300))
+    model.policy = PolicyEngine(PolicyConfig.model_validate(POLICY))
+    model.predict_proba_array = None  # the forest must not be called
+
+    X = np.full((3, 6), 1.0)
+    X[:, model.feature_names.index("credit_score")] = 400
+    result = model.score_array(X)
+
+    assert result.labels.tolist() == [0, 0, 0]
+    assert model.policy.stats()["credit_score_floor"] == 3
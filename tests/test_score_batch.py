@@ -0,0 +1,120 @@
+"""
+Tests for offline bulk scoring.
+"""
+import importlib.util
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.score_batch import MANIFEST_NAME, read_chunks, score_file
+from src.models.credit_model import CreditApprovalModel
+from tests.test_model import generate_sample
+
+WRITERS = {
+    "csv": lambda df, path: df.to_csv(path, index=False),
+    "jsonl": lambda df, path: df.to_json(path, orient="records", lines=True),
+    "parquet": lambda df, path: df.to_parquet(path, index=False),
+}
+READERS = {
+    "csv": pd.read_csv,
+    "jsonl": lambda path: pd.read_json(path, lines=True),
+    "parquet": pd.read_parquet,
+}
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@pytest.fixture(scope="module")
+def initargs(tmp_path_factory) -> tuple[str, str, str, float]:
+    """Worker arguments pointing at a trained model artifact."""
+    path = tmp_path_factory.mktemp("model") / "model.artifact"
+    model = CreditApprovalModel()
+    model.train(*generate_sample(300))
+    model.save_artifact(str(path))
+    return (str(path), "", "", 0.5)
+
+
+def write_input(tmp_path: Path, fmt: str, n: int = 250) -> Path:
+    """Write ``n`` synthetic applicants in the given format."""
+    path = tmp_path / f"applicants.{fmt}"
+    WRITERS[fmt](generate_sample(n)[0], path)
+    return path
+
+
+def parts(output_dir: Path) -> list[str]:
+    """Names of the scored part files, in order."""
+    return sorted(path.name for path in output_dir.glob("part-*"))
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        "csv",
+        "jsonl",
+        pytest.param(
+            "parquet", marks=pytest.mark.skipif(not HAS_PYARROW, reason="needs pyarrow")
+        ),
+    ],
+)
+def test_scores_in_chunks_in_input_format(
+    initargs: tuple, tmp_path: Path, fmt: str
+) -> None:
+    """Test every chunk is scored into a part file of the input's format."""
+    input_path = write_input(tmp_path, fmt)
+    output_dir = tmp_path / "out"
+
+    scored, skipped = score_file(str(input_path), output_dir, fmt, 100, 2, initargs)
+
+    assert (scored, skipped) == (250, 0)
+    assert parts(output_dir) == [f"part-{i:05d}.{fmt}" for i in range(3)]
+    chunks = [READERS[fmt](output_dir / name) for name in parts(output_dir)]
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+    result = pd.concat(chunks, ignore_index=True)
+    expected = pd.concat(list(read_chunks(str(input_path), fmt, 100)), ignore_index=True)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+    assert {"approved", "approval_probability", "risk_level"} <= set(result.columns)
+    assert result["approval_probability"].between(0, 1).all()
+
+
+def test_resume_scores_only_missing_parts(initargs: tuple, tmp_path: Path) -> None:
+    """Test a rerun keeps finished parts and scores only the missing one."""
+    input_path = write_input(tmp_path, "csv")
+    output_dir = tmp_path / "out"
+    score_file(str(input_path), output_dir, "csv", 100, 1, initargs)
+    first = (output_dir / "part-00000.csv").read_text()
+    (output_dir / "part-00001.csv").unlink()
+
+    scored, skipped = score_file(str(input_path), output_dir, "csv", 100, 1, initargs)
+
+    assert (scored, skipped) == (100, 2)
+    assert len(parts(output_dir)) == 3
+    assert (output_dir / "part-00000.csv").read_text() == first
+
+
+def test_resume_refuses_other_chunking_or_input(initargs: tuple, tmp_path: Path) -> None:
+    """Test resuming with another chunk size or a changed input is refused."""
+    input_path = write_input(tmp_path, "csv")
+    output_dir = tmp_path / "out"
+    score_file(str(input_path), output_dir, "csv", 100, 1, initargs)
+    assert (output_dir / MANIFEST_NAME).exists()
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        score_file(str(input_path), output_dir, "csv", 50, 1, initargs)
+
+    WRITERS["csv"](generate_sample(300)[0], input_path)
+    os.utime(input_path, ns=(0, 0))
+    with pytest.raises(ValueError, match="another run"):
+        score_file(str(input_path), output_dir, "csv", 100, 1, initargs)
+
+
+def test_refuses_parts_without_manifest(initargs: tuple, tmp_path: Path) -> None:
+    """Test part files of unknown origin are not mistaken for a resumable run."""
+    input_path = write_input(tmp_path, "csv")
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    (output_dir / "part-00000.csv").write_text("stale")
+
+    with pytest.raises(ValueError, match="without a manifest"):
+        score_file(str(input_path), output_dir, "csv", 100, 1, initargs)
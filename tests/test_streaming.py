@@ -0,0 +1,74 @@
+"""
+Tests for NDJSON streaming helpers.
+"""
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.api.streaming import iter_lines, iter_scored_ndjson
+from src.models.credit_model import ScoringResult
+
+APPLICANT = {
+    "age": 35,
+    "income": 50000,
+    "credit_score": 750,
+    "loan_amount": 20000,
+    "employment_years": 8,
+    "existing_debts": 5000,
+}
+
+
+@pytest.fixture
+def mock_model() -> MagicMock:
+    """Mock model approving every row with probability 0.85."""
+    model = MagicMock()
+    model.feature_names = None
+    model.score_array.side_effect = lambda X: ScoringResult.from_probabilities(
+        np.full(len(X), 0.85)
+    )
+    return model
+
+
+async def _collect(body: list[bytes], max_line_bytes: int = 1000) -> list[bytes]:
+    async def chunks():
+        for chunk in body:
+            yield chunk
+
+    return [line async for line in iter_lines(chunks(), max_line_bytes)]
+
+
+def test_iter_lines_across_chunks() -> None:
+    lines = asyncio.run(_collect([b'{"a":', b' 1}\n{"b"', b": 2}\n", b'{"c": 3}']))
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+def test_iter_lines_too_long() -> None:
+    lines = asyncio.run(_collect([b"x" * 8, b"x" * 8, b"x\nok\n"], max_line_bytes=10))
+    assert lines == [b"\x00", b"ok"]
+
+
+def test_scored_in_chunks_with_errors(mock_model: MagicMock) -> None:
+    lines = [
+        json.dumps(APPLICANT).encode(),
+        b"",
+        b"not json",
+        json.dumps({**APPLICANT, "age": -1}).encode(),
+        json.dumps(APPLICANT).encode(),
+    ]
+    output = b"".join(iter_scored_ndjson(lines, mock_model, chunk_size=2))
+    results = [json.loads(line) for line in output.splitlines()]
+
+    assert [r["line"] for r in results] == [1, 3, 4, 5]
+    assert results[0] == {
+        "line": 1,
+        "approved": True,
+        "approval_probability": 0.85,
+        "risk_level": "low",
+    }
+    assert results[1]["error"].startswith("Invalid JSON")
+    assert results[2]["error"] == "Validation error"
+    assert results[3]["approved"] is True
+    assert mock_model.score_array.call_count == 2